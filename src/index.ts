@@ -102,12 +102,14 @@ export { MonoMethod } from "./model/method";
 export { MonoObject } from "./model/object";
 export { MonoProperty } from "./model/property";
 export { MonoString } from "./model/string";
+export { getStructCodec, registerStructCodec } from "./model/struct-codec";
 export { Tracer } from "./model/trace";
 export { MonoType } from "./model/type";
 
 // Utils (logging + caching are commonly used standalone)
 export { lazy, LruCache, memoize } from "./utils/cache";
 export { Logger } from "./utils/log";
+export { getScratchArena, ScratchArena, withScratch } from "./utils/memory";
 
 // Value conversion helpers (used by properties/methods; handy standalone)
 export {
@@ -4,6 +4,7 @@ import { MonoErrorCodes, raise } from "../utils/errors";
 import { pointerIsNull } from "../utils/memory";
 import { MonoClass } from "./class";
 import { MonoObject } from "./object";
+import { getStructCodec, readStructs, writeStruct } from "./struct-codec";
 import { MonoTypeKind, isNumericKind } from "./type";
 import { getArrayWrapper, registerArrayWrapper } from "./wrappers";
 
@@ -215,7 +216,7 @@ export class MonoArray<T = unknown> extends MonoObject implements Iterable<T> {
     // First get the array's class, then get its element class
     const arrayClass = this.class;
     const elementClassPtr = this.native.mono_class_get_element_class(arrayClass.pointer);
-    return new MonoClass(this.api, elementClassPtr);
+    return this.api.intern(MonoClass, elementClassPtr);
   }
 
   /**
@@ -354,10 +355,15 @@ export class MonoArray<T = unknown> extends MonoObject implements Iterable<T> {
       return;
     }
 
+    if (typeof value === "object" && value !== null) {
+      writeStruct(this.elementClass, address, value);
+      return;
+    }
+
     raise(
       MonoErrorCodes.TYPE_MISMATCH,
-      "Non-primitive value type arrays require a NativePointer or boxed MonoObject",
-      "Pass a pointer to the value data or a boxed value type",
+      "Non-primitive value type arrays require a NativePointer, boxed MonoObject or plain object",
+      "Pass a pointer to the value data, a boxed value type or an object keyed by field name",
     );
   }
 
@@ -726,6 +732,37 @@ export class MonoArray<T = unknown> extends MonoObject implements Iterable<T> {
     }
   }
 
+  /**
+   * Decode a range of struct elements with a single memory read.
+   *
+   * Each element is decoded by the element class's struct codec (plain objects
+   * keyed by field name by default), without per-element native calls.
+   *
+   * @param start First index (default: 0)
+   * @param count Number of elements (default: up to the end of the array)
+   * @returns Decoded elements
+   * @throws {MonoError} If the element type is not a value type or the range is out of bounds
+   *
+   * @example
+   * ```typescript
+   * const positions = vertices.readStructs<{ x: number; y: number; z: number }>();
+   * ```
+   */
+  readStructs<S = Record<string, unknown>>(start = 0, count = this.length - start): S[] {
+    if (start < 0 || count < 0 || start + count > this.length) {
+      raise(
+        MonoErrorCodes.INVALID_ARGUMENT,
+        `Range [${start}, ${start + count}) is out of bounds for array of length ${this.length}`,
+        "Ensure the range is within [0, length]",
+      );
+    }
+    if (count === 0) {
+      return [];
+    }
+    const codec = getStructCodec<S>(this.elementClass);
+    return readStructs(codec, this.getElementAddress(start), count, this.elementSize);
+  }
+
   /**
    * Get element at relative index (supports negative indices).
    * Similar to JavaScript's Array.prototype.at().
@@ -1741,7 +1778,7 @@ export class MonoArray<T = unknown> extends MonoObject implements Iterable<T> {
     if (pointerIsNull(elementClass)) {
       raise(MonoErrorCodes.CLASS_NOT_FOUND, `Could not find class: System.${monoTypeName}`, "Ensure corlib is loaded");
     }
-    const classObj = new MonoClass(api, elementClass);
+    const classObj = api.intern(MonoClass, elementClass);
     return MonoArray.new(api, classObj, length) as MonoArray<number>;
   }
 
@@ -1760,7 +1797,7 @@ export class MonoArray<T = unknown> extends MonoObject implements Iterable<T> {
     if (pointerIsNull(stringClass)) {
       raise(MonoErrorCodes.CLASS_NOT_FOUND, "Could not find class: System.String", "Ensure corlib is loaded");
     }
-    const classObj = new MonoClass(api, stringClass);
+    const classObj = api.intern(MonoClass, stringClass);
     return MonoArray.new(api, classObj, length) as MonoArray<string>;
   }
 
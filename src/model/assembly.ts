@@ -1,6 +1,8 @@
 import type { MonoApi } from "../runtime/api";
+import { MonoEnums } from "../runtime/enums";
 import { lazy } from "../utils/cache";
 import { MonoErrorCodes, raise } from "../utils/errors";
+import { scratchAlloc, withScratch } from "../utils/memory";
 import { readUtf8String } from "../utils/string";
 import type { CustomAttribute } from "./attribute";
 import { createAssemblyAttributeContext, getCustomAttributes } from "./attribute";
@@ -31,7 +33,7 @@ export class MonoAssembly extends MonoHandle {
    */
   #getImage(): MonoImage {
     const imagePtr = this.native.mono_assembly_get_image(this.pointer);
-    return new MonoImage(this.api, imagePtr);
+    return this.api.intern(MonoImage, imagePtr);
   }
 
   /**
@@ -179,8 +181,8 @@ export class MonoAssembly extends MonoHandle {
   get customAttributes(): CustomAttribute[] {
     return getCustomAttributes(
       createAssemblyAttributeContext(this.api, this.pointer, this.native),
-      ptr => new MonoClass(this.api, ptr).name,
-      ptr => new MonoClass(this.api, ptr).fullName,
+      ptr => this.api.intern(MonoClass, ptr).name,
+      ptr => this.api.intern(MonoClass, ptr).fullName,
     );
   }
 
@@ -401,93 +403,17 @@ export class MonoAssembly extends MonoHandle {
   /**
    * Get all assemblies referenced by this assembly.
    *
-   * This reads the AssemblyRef metadata table to find all referenced assemblies,
-   * then attempts to resolve them from loaded assemblies in the current domain.
+   * Answered from the shared `AssemblyReferenceGraph`, which reads each image's
+   * AssemblyRef table once and resolves references against loaded assemblies.
    */
-  @lazy
   get referencedAssemblies(): MonoAssembly[] {
-    const result: MonoAssembly[] = [];
-
-    try {
-      const image = this.#getImage();
-
-      // MONO_TABLE_ASSEMBLYREF = 35
-      const MONO_TABLE_ASSEMBLYREF = 35;
-
-      // Get number of assembly references
-      const refCount = this.native.mono_image_get_table_rows(image.pointer, MONO_TABLE_ASSEMBLYREF);
-
-      if (refCount <= 0) {
-        return result;
-      }
-
-      // Get loaded assemblies to resolve references
-      const loadedAssemblies = new Map<string, MonoAssembly>();
-
-      // Use mono_assembly_foreach to enumerate all loaded assemblies
-      const seenPtrs = new Set<string>();
-      const callback = new NativeCallback(
-        (assemblyPtr: NativePointer, _userData: NativePointer) => {
-          if (assemblyPtr.isNull()) return;
-          const key = assemblyPtr.toString();
-          if (seenPtrs.has(key)) return;
-          seenPtrs.add(key);
-
-          try {
-            const asm = new MonoAssembly(this.api, assemblyPtr);
-            const name = asm.name.toLowerCase();
-            loadedAssemblies.set(name, asm);
-          } catch {
-            // Skip invalid assemblies
-          }
-        },
-        "void",
-        ["pointer", "pointer"],
-      );
-
-      this.native.mono_assembly_foreach(callback, NULL);
-
-      // Get referenced assembly names using mono_assembly_get_assemblyref
-      // NOTE: mono_assembly_name_get_name is only available in mono-2.0-bdwgc.dll
-      if (this.api.hasExport("mono_assembly_name_get_name")) {
-        const assemblyNameStruct = Memory.alloc(256); // MonoAssemblyName is a structure
-
-        for (let i = 0; i < Number(refCount); i++) {
-          try {
-            // mono_assembly_get_assemblyref fills the MonoAssemblyName structure
-            this.native.mono_assembly_get_assemblyref(image.pointer, i, assemblyNameStruct);
-
-            // Get name from the assembly name structure
-            const namePtr = this.native.mono_assembly_name_get_name(assemblyNameStruct);
-            if (!namePtr.isNull()) {
-              const refName = namePtr.readUtf8String();
-              if (refName) {
-                const normalizedName = refName.toLowerCase();
-                const resolved = loadedAssemblies.get(normalizedName);
-                if (resolved && resolved.pointer.toString() !== this.pointer.toString()) {
-                  // Avoid duplicates
-                  if (!result.some(a => a.pointer.toString() === resolved.pointer.toString())) {
-                    result.push(resolved);
-                  }
-                }
-              }
-            }
-          } catch {
-            // Skip invalid references
-          }
-        }
-      }
-    } catch {
-      // Return empty array on error
-    }
-    return result;
+    return AssemblyReferenceGraph.of(this.api).referencesOf(this);
   }
 
   /**
    * Get all assemblies that reference this assembly.
    *
-   * This performs a reverse dependency analysis by iterating through all loaded
-   * assemblies and checking if they reference this assembly.
+   * Answered from the reverse adjacency of the shared `AssemblyReferenceGraph`.
    *
    * @returns Array of assemblies that depend on this assembly
    *
@@ -496,54 +422,8 @@ export class MonoAssembly extends MonoHandle {
    * const dependents = mscorlib.referencingAssemblies;
    * // Most assemblies will reference mscorlib
    */
-  @lazy
   get referencingAssemblies(): MonoAssembly[] {
-    const result: MonoAssembly[] = [];
-
-    try {
-      const myName = this.name.toLowerCase();
-      const myPointer = this.pointer.toString();
-
-      // Enumerate all loaded assemblies
-      const seenPtrs = new Set<string>();
-      const callback = new NativeCallback(
-        (assemblyPtr: NativePointer, _userData: NativePointer) => {
-          if (assemblyPtr.isNull()) return;
-          const key = assemblyPtr.toString();
-          if (seenPtrs.has(key)) return;
-          seenPtrs.add(key);
-
-          // Skip self
-          if (key === myPointer) return;
-
-          try {
-            const otherAsm = new MonoAssembly(this.api, assemblyPtr);
-
-            // Check if this assembly references us
-            const refs = otherAsm.referencedAssemblies;
-            const referencesMe = refs.some(
-              ref => ref.name.toLowerCase() === myName || ref.pointer.toString() === myPointer,
-            );
-
-            if (referencesMe) {
-              // Avoid duplicates
-              if (!result.some(a => a.pointer.toString() === key)) {
-                result.push(otherAsm);
-              }
-            }
-          } catch {
-            // Skip assemblies that fail to enumerate
-          }
-        },
-        "void",
-        ["pointer", "pointer"],
-      );
-
-      this.native.mono_assembly_foreach(callback, NULL);
-    } catch {
-      // Return empty array on error
-    }
-    return result;
+    return AssemblyReferenceGraph.of(this.api).referrersOf(this);
   }
 
   /**
@@ -568,10 +448,11 @@ export class MonoAssembly extends MonoHandle {
       };
     };
 
+    const root = buildTree(this);
     return {
-      root: buildTree(this),
+      root,
       totalAssemblies: visited.size,
-      maxDepth: this.calculateDependencyDepth(buildTree(this)),
+      maxDepth: this.calculateDependencyDepth(root),
     };
   }
 
@@ -756,6 +637,196 @@ export class MonoAssembly extends MonoHandle {
   }
 }
 
+// ============================================================================
+// ASSEMBLY REFERENCE GRAPH
+// ============================================================================
+
+const ASSEMBLYREF_TABLE = MonoEnums.MonoMetaTableEnum.MONO_TABLE_ASSEMBLYREF;
+
+/** Sentinel cursor: load hook unavailable, re-enumerate to find new assemblies */
+const UNTRACKED = -1;
+
+const referenceGraphs = new WeakMap<MonoApi, AssemblyReferenceGraph>();
+
+/**
+ * Reference graph over all loaded assemblies, with forward and reverse edges.
+ *
+ * Each assembly's AssemblyRef table is read once, when the assembly is first
+ * seen. References are kept by (case-insensitive) name and resolved against
+ * loaded assemblies at query time, so a reference to an assembly that loads
+ * later starts resolving without a rebuild. Newly loaded assemblies are picked
+ * up from the runtime's assembly-load hook.
+ *
+ * @example
+ * ```typescript
+ * const graph = AssemblyReferenceGraph.of(api);
+ * for (const dependent of graph.referrersOf(mscorlib)) {
+ *   console.log(dependent.name);
+ * }
+ * ```
+ */
+export class AssemblyReferenceGraph {
+  /** Known assemblies by pointer key */
+  private readonly assemblies = new Map<string, MonoAssembly>();
+  /** Lower-case name -> first loaded assembly with that name */
+  private readonly byName = new Map<string, MonoAssembly>();
+  /** Pointer key -> lower-case names of referenced assemblies */
+  private readonly forward = new Map<string, string[]>();
+  /** Lower-case referenced name -> assemblies referencing it */
+  private readonly reverse = new Map<string, MonoAssembly[]>();
+  private loadCursor: number | null = null;
+
+  private constructor(private readonly api: MonoApi) {}
+
+  /**
+   * Get the shared graph for an API instance.
+   */
+  static of(api: MonoApi): AssemblyReferenceGraph {
+    let graph = referenceGraphs.get(api);
+    if (!graph) {
+      graph = new AssemblyReferenceGraph(api);
+      referenceGraphs.set(api, graph);
+    }
+    return graph;
+  }
+
+  /** Number of assemblies in the graph. */
+  get size(): number {
+    this.sync();
+    return this.assemblies.size;
+  }
+
+  /**
+   * Loaded assemblies referenced by `assembly`, excluding itself.
+   */
+  referencesOf(assembly: MonoAssembly): MonoAssembly[] {
+    this.sync();
+    const key = assembly.pointer.toString();
+    const result: MonoAssembly[] = [];
+    const seen = new Set<string>([key]);
+    for (const name of this.forward.get(key) ?? this.readReferenceNames(assembly)) {
+      const resolved = this.byName.get(name);
+      if (!resolved) {
+        continue;
+      }
+      const resolvedKey = resolved.pointer.toString();
+      if (!seen.has(resolvedKey)) {
+        seen.add(resolvedKey);
+        result.push(resolved);
+      }
+    }
+    return result;
+  }
+
+  /**
+   * Loaded assemblies that reference `assembly`, excluding itself.
+   */
+  referrersOf(assembly: MonoAssembly): MonoAssembly[] {
+    this.sync();
+    const referrers = this.reverse.get(assembly.name.toLowerCase()) ?? [];
+    return referrers.filter(referrer => !referrer.pointer.equals(assembly.pointer));
+  }
+
+  /**
+   * Add assemblies loaded since the last query.
+   */
+  private sync(): void {
+    if (this.loadCursor === null) {
+      this.loadCursor = this.api.trackAssemblyLoads() ? this.api.assemblyLoads.length : UNTRACKED;
+      this.enumerateLoaded();
+      return;
+    }
+    if (this.loadCursor === UNTRACKED) {
+      this.enumerateLoaded();
+      return;
+    }
+    const loads = this.api.assemblyLoads;
+    for (let i = this.loadCursor; i < loads.length; i++) {
+      this.add(loads[i].assembly);
+    }
+    this.loadCursor = loads.length;
+  }
+
+  private enumerateLoaded(): void {
+    const pointers: NativePointer[] = [];
+    const callback = new NativeCallback(
+      (assemblyPtr: NativePointer, _userData: NativePointer) => {
+        if (!assemblyPtr.isNull()) {
+          pointers.push(assemblyPtr);
+        }
+      },
+      "void",
+      ["pointer", "pointer"],
+    );
+    this.api.native.mono_assembly_foreach(callback, NULL);
+    for (const pointer of pointers) {
+      this.add(pointer);
+    }
+  }
+
+  private add(pointer: NativePointer): void {
+    const key = pointer.toString();
+    if (this.assemblies.has(key)) {
+      return;
+    }
+    try {
+      const assembly = this.api.intern(MonoAssembly, pointer);
+      const name = assembly.name.toLowerCase();
+      this.assemblies.set(key, assembly);
+      if (!this.byName.has(name)) {
+        this.byName.set(name, assembly);
+      }
+
+      const references = this.readReferenceNames(assembly);
+      this.forward.set(key, references);
+      for (const reference of new Set(references)) {
+        let referrers = this.reverse.get(reference);
+        if (!referrers) {
+          referrers = [];
+          this.reverse.set(reference, referrers);
+        }
+        referrers.push(assembly);
+      }
+    } catch {
+      // Skip assemblies that fail to resolve
+    }
+  }
+
+  /**
+   * Lower-case names from the AssemblyRef table of an assembly's image.
+   */
+  private readReferenceNames(assembly: MonoAssembly): string[] {
+    const image = assembly.image;
+    const metadata = image.metadata;
+    if (metadata.table(ASSEMBLYREF_TABLE) !== null) {
+      return metadata.assemblyRefs.map(ref => ref.name.toLowerCase());
+    }
+
+    // Fallback: one mono_assembly_get_assemblyref call per row
+    // NOTE: mono_assembly_name_get_name is only available in mono-2.0-bdwgc.dll
+    const names: string[] = [];
+    if (!this.api.hasExport("mono_assembly_name_get_name")) {
+      return names;
+    }
+    const refCount = Number(this.api.native.mono_image_get_table_rows(image.pointer, ASSEMBLYREF_TABLE));
+    withScratch(() => {
+      const nameBuffer = scratchAlloc(256); // MonoAssemblyName is a structure
+      for (let i = 0; i < refCount; i++) {
+        try {
+          this.api.native.mono_assembly_get_assemblyref(image.pointer, i, nameBuffer);
+          const name = readUtf8String(this.api.native.mono_assembly_name_get_name(nameBuffer));
+          if (name) {
+            names.push(name.toLowerCase());
+          }
+        } catch {
+          // Skip invalid references
+        }
+      }
+    });
+    return names;
+  }
+}
+
 // ===== INTERFACES AND TYPES =====
 
 export interface AssemblyPerformanceStats {
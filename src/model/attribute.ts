@@ -9,6 +9,8 @@
 
 import type { MonoApi } from "../runtime/api";
 import { MonoEnums } from "../runtime/enums";
+import type { MetadataReader } from "../runtime/metadata-tables";
+import { lazy } from "../utils/cache";
 import { pointerIsNull } from "../utils/memory";
 
 // ============================================================================
@@ -688,3 +690,194 @@ export function createAssemblyAttributeContext(
     getAttrInfoPtr: () => native.mono_custom_attrs_from_assembly(assemblyPtr),
   };
 }
+
+// ============================================================================
+// CUSTOM ATTRIBUTE INDEX
+// ============================================================================
+
+/**
+ * One row of an image's CustomAttribute table, with the attribute type
+ * resolved from metadata. Arguments are decoded separately, on demand.
+ */
+export interface IndexedCustomAttribute {
+  /** 1-based CustomAttribute row id */
+  rid: number;
+  /** Token of the attributed entity (TypeDef, MethodDef, Field, Property, Assembly, ...) */
+  owner: number;
+  /** Attribute type full name */
+  type: string;
+  /** Attribute type name without namespace */
+  name: string;
+  /** Constructor token (MethodDef or MemberRef) */
+  constructorToken: number;
+  /** #Blob heap index of the encoded arguments */
+  value: number;
+}
+
+/**
+ * Index over one image's CustomAttribute table.
+ *
+ * Built from metadata alone: attribute types and owners are known without
+ * loading any class or parsing any blob. Blobs are decoded only when
+ * `decode()` is called, and both decoded attributes and owner names are
+ * cached for the lifetime of the index.
+ *
+ * @example
+ * ```typescript
+ * const index = image.customAttributeIndex;
+ * for (const attr of index.find("UnityEngine.SerializeField")) {
+ *   console.log(index.ownerName(attr.owner));
+ * }
+ * ```
+ */
+export class CustomAttributeIndex {
+  private readonly decoded = new Map<number, CustomAttribute>();
+  private readonly ownerNames = new Map<number, string>();
+
+  constructor(
+    private readonly api: MonoApi,
+    private readonly image: NativePointer,
+    private readonly metadata: MetadataReader,
+  ) {}
+
+  /** All attribute rows of the image. */
+  @lazy
+  get entries(): IndexedCustomAttribute[] {
+    const typeNames = new Map<number, string>();
+    return this.metadata.customAttributes.map(row => {
+      let type = typeNames.get(row.type);
+      if (type === undefined) {
+        type = this.metadata.declaringTypeNameOf(row.type);
+        typeNames.set(row.type, type);
+      }
+      const lastDot = type.lastIndexOf(".");
+      return {
+        rid: row.rid,
+        owner: row.parent,
+        type,
+        name: lastDot >= 0 ? type.slice(lastDot + 1) : type,
+        constructorToken: row.type,
+        value: row.value,
+      };
+    });
+  }
+
+  /** Distinct attribute type full names used in the image, sorted. */
+  get attributeTypes(): string[] {
+    return Array.from(this.byType.keys()).sort();
+  }
+
+  /**
+   * All uses of an attribute type.
+   *
+   * @param attributeType Full name (`UnityEngine.SerializeField`) or short name,
+   *   with or without the `Attribute` suffix (`SerializeField`)
+   */
+  find(attributeType: string): IndexedCustomAttribute[] {
+    const exact = this.byType.get(attributeType);
+    if (exact) {
+      return exact;
+    }
+    return (
+      this.byName.get(attributeType) ??
+      this.byName.get(`${attributeType}Attribute`) ??
+      this.byName.get(attributeType.replace(/Attribute$/, "")) ??
+      []
+    );
+  }
+
+  /**
+   * Distinct owner tokens carrying an attribute type.
+   */
+  ownersOf(attributeType: string): number[] {
+    return Array.from(new Set(this.find(attributeType).map(entry => entry.owner)));
+  }
+
+  /**
+   * Attributes applied to one entity.
+   *
+   * @param owner Token of the entity (TypeDef, MethodDef, Field, ...)
+   */
+  attributesOf(owner: number): IndexedCustomAttribute[] {
+    return this.byOwner.get(owner) ?? [];
+  }
+
+  /**
+   * Display name of an owner token, e.g. `Game.Player::Fire`.
+   */
+  ownerName(owner: number): string {
+    let name = this.ownerNames.get(owner);
+    if (name === undefined) {
+      name = this.metadata.nameOf(owner);
+      this.ownerNames.set(owner, name);
+    }
+    return name;
+  }
+
+  /**
+   * Decode an attribute's constructor and named arguments.
+   *
+   * Resolves the constructor through `mono_get_method` and parses the blob on
+   * first call; later calls return the cached result.
+   */
+  decode(entry: IndexedCustomAttribute): CustomAttribute {
+    const cached = this.decoded.get(entry.rid);
+    if (cached) {
+      return cached;
+    }
+
+    let constructorArguments: AttributeValue[] = [];
+    let properties: Record<string, AttributeValue> = {};
+    try {
+      const ctorPtr = this.api.native.mono_get_method(this.image, entry.constructorToken, NULL);
+      const blob = this.metadata.blob(entry.value);
+      if (!pointerIsNull(ctorPtr) && blob.size > 0) {
+        const parsed = parseConstructorArguments(this.api, ctorPtr, blob.pointer, blob.size);
+        if (parsed) {
+          constructorArguments = parsed.args;
+          if (parsed.namedCount > 0) {
+            properties = parseNamedArguments(parsed.reader, parsed.namedCount);
+          }
+        }
+      }
+    } catch {
+      // ignore blob parsing failures
+    }
+
+    const attribute: CustomAttribute = { name: entry.name, type: entry.type, constructorArguments, properties };
+    this.decoded.set(entry.rid, attribute);
+    return attribute;
+  }
+
+  @lazy
+  private get byType(): Map<string, IndexedCustomAttribute[]> {
+    return groupEntries(this.entries, entry => entry.type);
+  }
+
+  @lazy
+  private get byName(): Map<string, IndexedCustomAttribute[]> {
+    return groupEntries(this.entries, entry => entry.name);
+  }
+
+  @lazy
+  private get byOwner(): Map<number, IndexedCustomAttribute[]> {
+    return groupEntries(this.entries, entry => entry.owner);
+  }
+}
+
+function groupEntries<K>(
+  entries: IndexedCustomAttribute[],
+  key: (entry: IndexedCustomAttribute) => K,
+): Map<K, IndexedCustomAttribute[]> {
+  const groups = new Map<K, IndexedCustomAttribute[]>();
+  for (const entry of entries) {
+    const k = key(entry);
+    let group = groups.get(k);
+    if (!group) {
+      group = [];
+      groups.set(k, group);
+    }
+    group.push(entry);
+  }
+  return groups;
+}
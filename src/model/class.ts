@@ -3,7 +3,7 @@ import { tryGetClassPtrFromMonoType } from "../runtime/type-resolution";
 import { lazy } from "../utils/cache";
 import { findSimilarNames, formatSimilarNames, MonoErrorCodes, raise } from "../utils/errors";
 import { Logger } from "../utils/log";
-import { enumerateMonoHandles, pointerIsNull } from "../utils/memory";
+import { enumerateMonoHandles, iterateMonoHandles, pointerIsNull } from "../utils/memory";
 import { readUtf8String } from "../utils/string";
 import type { CustomAttribute } from "./attribute";
 import { createClassAttributeContext, getCustomAttributes } from "./attribute";
@@ -12,6 +12,7 @@ import { MonoField } from "./field";
 import type { MethodArgument } from "./handle";
 import { MonoHandle } from "./handle";
 import { MonoImage } from "./image";
+import { ClassLayout } from "./layout";
 import { MonoMethod } from "./method";
 import { MonoObject } from "./object";
 import { MonoProperty } from "./property";
@@ -60,7 +61,8 @@ const TYPE_DESCRIBED_FLAGS: Record<string, number> = {
  */
 export class MonoClass extends MonoHandle {
   #initialized = false;
-  #methodCache: Map<string, MonoMethod | null> | null = null;
+  #memberIndex: ClassMemberIndex | null = null;
+  #hierarchyMembers: ClassHierarchyMembers | null = null;
 
   // ===== CORE PROPERTIES =====
 
@@ -96,7 +98,7 @@ export class MonoClass extends MonoHandle {
   @lazy
   get image(): MonoImage {
     const imagePtr = this.native.mono_class_get_image(this.pointer);
-    return new MonoImage(this.api, imagePtr);
+    return this.api.intern(MonoImage, imagePtr);
   }
 
   /**
@@ -121,7 +123,7 @@ export class MonoClass extends MonoHandle {
   @lazy
   get type(): MonoType {
     const typePtr = this.native.mono_class_get_type(this.pointer);
-    return new MonoType(this.api, typePtr);
+    return this.api.intern(MonoType, typePtr);
   }
 
   /**
@@ -144,6 +146,16 @@ export class MonoClass extends MonoHandle {
     return { size, alignment };
   }
 
+  /**
+   * Get the instance layout plan of this class.
+   * Lists every instance field (including inherited ones) with its offset and a
+   * decoder, so an instance can be read with a single memory read.
+   */
+  @lazy
+  get layout(): ClassLayout {
+    return new ClassLayout(this);
+  }
+
   /**
    * Get custom attributes applied to this class.
    * Uses mono_custom_attrs_from_class API to retrieve attribute metadata.
@@ -153,8 +165,8 @@ export class MonoClass extends MonoHandle {
   get customAttributes(): CustomAttribute[] {
     return getCustomAttributes(
       createClassAttributeContext(this.api, this.pointer, this.native),
-      ptr => new MonoClass(this.api, ptr).name,
-      ptr => new MonoClass(this.api, ptr).fullName,
+      ptr => this.api.intern(MonoClass, ptr).name,
+      ptr => this.api.intern(MonoClass, ptr).fullName,
     );
   }
 
@@ -219,7 +231,7 @@ export class MonoClass extends MonoHandle {
   get methods(): MonoMethod[] {
     return enumerateMonoHandles(
       iter => this.native.mono_class_get_methods(this.pointer, iter),
-      ptr => new MonoMethod(this.api, ptr),
+      ptr => this.api.intern(MonoMethod, ptr),
     );
   }
 
@@ -230,7 +242,7 @@ export class MonoClass extends MonoHandle {
   get fields(): MonoField[] {
     return enumerateMonoHandles(
       iter => this.native.mono_class_get_fields(this.pointer, iter),
-      ptr => new MonoField(this.api, ptr),
+      ptr => this.api.intern(MonoField, ptr),
     );
   }
 
@@ -241,25 +253,92 @@ export class MonoClass extends MonoHandle {
   get properties(): MonoProperty[] {
     return enumerateMonoHandles(
       iter => this.native.mono_class_get_properties(this.pointer, iter),
-      ptr => new MonoProperty(this.api, ptr),
+      ptr => this.api.intern(MonoProperty, ptr),
+    );
+  }
+
+  /**
+   * Lazily iterate over the methods of this class.
+   * Wrappers are created only as the caller advances.
+   */
+  *iterMethods(): Generator<MonoMethod, void, undefined> {
+    yield* iterateMonoHandles(
+      iter => this.native.mono_class_get_methods(this.pointer, iter),
+      ptr => this.api.intern(MonoMethod, ptr),
+    );
+  }
+
+  /**
+   * Lazily iterate over the fields of this class.
+   */
+  *iterFields(): Generator<MonoField, void, undefined> {
+    yield* iterateMonoHandles(
+      iter => this.native.mono_class_get_fields(this.pointer, iter),
+      ptr => this.api.intern(MonoField, ptr),
+    );
+  }
+
+  /**
+   * Lazily iterate over the properties of this class.
+   */
+  *iterProperties(): Generator<MonoProperty, void, undefined> {
+    yield* iterateMonoHandles(
+      iter => this.native.mono_class_get_properties(this.pointer, iter),
+      ptr => this.api.intern(MonoProperty, ptr),
     );
   }
 
   // ===== MEMBER LOOKUP (INDIVIDUAL) =====
 
+  /**
+   * Member lookup index (methods by name and signature, fields, properties, nested types).
+   * Built on first lookup and reused for the lifetime of the class.
+   */
+  private get memberIndex(): ClassMemberIndex {
+    if (!this.#memberIndex) {
+      this.#memberIndex = new ClassMemberIndex(this);
+    }
+    return this.#memberIndex;
+  }
+
+  /**
+   * Flattened member table of this class, its base classes and its interfaces.
+   * Built once per class on top of the parent's table.
+   */
+  private get hierarchyMembers(): ClassHierarchyMembers {
+    if (!this.#hierarchyMembers) {
+      this.#hierarchyMembers = new ClassHierarchyMembers(
+        this.memberIndex,
+        () => this.parent?.hierarchyMembers ?? null,
+        () => this.interfaces.map(iface => iface.hierarchyMembers),
+      );
+    }
+    return this.#hierarchyMembers;
+  }
+
   /**
    * Find a method by name, throwing if not found.
    * @param name Method name
-   * @param paramCount Parameter count (-1 to match any)
+   * @param params Parameter count (-1 to match any) or parameter type full names
    * @returns MonoMethod
    * @throws {MonoMethodNotFoundError} if method not found
+   *
+   * @example
+   * ```typescript
+   * const damage = klass.method("Damage", ["System.Int32", "UnityEngine.Vector3"]);
+   * ```
    */
-  method(name: string, paramCount = -1): MonoMethod {
-    const m = this.tryMethod(name, paramCount);
+  method(name: string, params: number | readonly string[] = -1): MonoMethod {
+    const m = this.tryMethod(name, params);
     if (m) {
       return m;
     }
-    const paramHint = paramCount >= 0 ? ` with ${paramCount} parameter(s)` : "";
+    const paramHint =
+      typeof params === "number"
+        ? params >= 0
+          ? ` with ${params} parameter(s)`
+          : ""
+        : ` with parameters (${params.join(", ")})`;
 
     // Find similar method names
     const methodNames = this.methods.map(m => m.name);
@@ -275,52 +354,62 @@ export class MonoClass extends MonoHandle {
   }
 
   /**
-   * Try to find a method by name without throwing.
-   * Uses internal caching to improve performance for repeated lookups.
+   * Try to find a method declared by this class without throwing.
+   *
+   * Overloads are resolved through the class member index: by arity when a
+   * count is given, or exactly by parameter type full names (as reported by
+   * `MonoType.fullName`, e.g. `"System.Int32"`, `"System.String&"` for by-ref).
+   *
    * @param name Method name
-   * @param paramCount Parameter count (-1 to match any)
+   * @param params Parameter count (-1 to match any) or parameter type full names
    * @returns Method if found, null otherwise
    */
-  tryMethod(name: string, paramCount = -1): MonoMethod | null {
-    // Build cache key
-    const cacheKey = `${name}:${paramCount}`;
-
-    // Initialize cache lazily
-    if (!this.#methodCache) {
-      this.#methodCache = new Map();
-    }
-
-    // Check cache first
-    if (this.#methodCache.has(cacheKey)) {
-      return this.#methodCache.get(cacheKey) ?? null;
-    }
+  tryMethod(name: string, params: number | readonly string[] = -1): MonoMethod | null {
+    return typeof params === "number"
+      ? this.memberIndex.methodByArity(name, params)
+      : this.memberIndex.methodBySignature(name, params);
+  }
 
-    // Perform actual lookup
-    const namePtr = this.api.allocUtf8StringCached(name);
-    const methodPtr = this.native.mono_class_get_method_from_name(this.pointer, namePtr, paramCount);
-    const result = pointerIsNull(methodPtr) ? null : new MonoMethod(this.api, methodPtr);
+  /**
+   * Try to find a method in this class, its base classes or its interfaces.
+   *
+   * Methods declared closer to this class win; interface methods are only
+   * returned when no class in the chain declares a match.
+   *
+   * @param name Method name
+   * @param paramCount Parameter count (-1 to match any)
+   * @returns Method if found, null otherwise
+   */
+  tryMethodInHierarchy(name: string, paramCount = -1): MonoMethod | null {
+    return this.hierarchyMembers.methodByArity(name, paramCount);
+  }
 
-    // Cache result
-    this.#methodCache.set(cacheKey, result);
-    return result;
+  /**
+   * Get all overloads of a method declared by this class.
+   * @param name Method name
+   * @returns Overloads in declaration order (empty if none)
+   */
+  overloads(name: string): readonly MonoMethod[] {
+    return this.memberIndex.overloads(name);
   }
 
   /**
-   * Clear the method lookup cache.
-   * Call this if class methods change dynamically (rare in practice).
+   * Clear the member lookup index.
+   * Call this if class members change dynamically (rare in practice).
    */
   clearMethodCache(): void {
-    this.#methodCache?.clear();
+    this.#memberIndex = null;
+    this.#hierarchyMembers = null;
   }
 
   /**
    * Check if this class has a method with the given name.
    * @param name Method name
-   * @param paramCount Parameter count (-1 to match any)
+   * @param params Parameter count (-1 to match any) or parameter type full names
    * @returns True if method exists
    */
-  hasMethod(name: string, paramCount = -1): boolean {
-    return this.tryMethod(name, paramCount) !== null;
+  hasMethod(name: string, params: number | readonly string[] = -1): boolean {
+    return this.tryMethod(name, params) !== null;
   }
 
   /**
@@ -350,13 +439,12 @@ export class MonoClass extends MonoHandle {
 
   /**
    * Try to find a field by name without throwing.
+   * Searches this class first, then its base classes.
    * @param name Field name
    * @returns Field if found, null otherwise
    */
   tryField(name: string): MonoField | null {
-    const namePtr = this.api.allocUtf8StringCached(name);
-    const fieldPtr = this.native.mono_class_get_field_from_name(this.pointer, namePtr);
-    return pointerIsNull(fieldPtr) ? null : new MonoField(this.api, fieldPtr);
+    return this.hierarchyMembers.fields.get(name) ?? null;
   }
 
   /**
@@ -395,13 +483,12 @@ export class MonoClass extends MonoHandle {
 
   /**
    * Try to find a property by name without throwing.
+   * Searches this class first, then its base classes.
    * @param name Property name
    * @returns Property if found, null otherwise
    */
   tryProperty(name: string): MonoProperty | null {
-    const namePtr = this.api.allocUtf8StringCached(name);
-    const propertyPtr = this.native.mono_class_get_property_from_name(this.pointer, namePtr);
-    return pointerIsNull(propertyPtr) ? null : new MonoProperty(this.api, propertyPtr);
+    return this.hierarchyMembers.properties.get(name) ?? null;
   }
 
   /**
@@ -437,12 +524,7 @@ export class MonoClass extends MonoHandle {
    * @returns Nested type if found, null otherwise
    */
   tryNestedType(name: string): MonoClass | null {
-    for (const nested of this.nestedTypes) {
-      if (nested.name === name) {
-        return nested;
-      }
-    }
-    return null;
+    return this.memberIndex.nestedTypes.get(name) ?? null;
   }
 
   /**
@@ -462,7 +544,7 @@ export class MonoClass extends MonoHandle {
   @lazy
   get parent(): MonoClass | null {
     const parentPtr = this.native.mono_class_get_parent(this.pointer);
-    return pointerIsNull(parentPtr) ? null : new MonoClass(this.api, parentPtr);
+    return pointerIsNull(parentPtr) ? null : this.api.intern(MonoClass, parentPtr);
   }
 
   /**
@@ -472,7 +554,7 @@ export class MonoClass extends MonoHandle {
   get interfaces(): MonoClass[] {
     return enumerateMonoHandles(
       iter => this.native.mono_class_get_interfaces(this.pointer, iter),
-      ptr => new MonoClass(this.api, ptr),
+      ptr => this.api.intern(MonoClass, ptr),
     );
   }
 
@@ -483,7 +565,7 @@ export class MonoClass extends MonoHandle {
   get nestedTypes(): MonoClass[] {
     return enumerateMonoHandles(
       iter => this.native.mono_class_get_nested_types(this.pointer, iter),
-      ptr => new MonoClass(this.api, ptr),
+      ptr => this.api.intern(MonoClass, ptr),
     );
   }
 
@@ -812,7 +894,7 @@ export class MonoClass extends MonoHandle {
       for (let i = 0; i < count; i++) {
         const argPtr = this.native.mono_unity_class_get_generic_argument_at(this.pointer, i);
         if (!pointerIsNull(argPtr)) {
-          args.push(new MonoClass(this.api, argPtr));
+          args.push(this.api.intern(MonoClass, argPtr));
         }
       }
       return args;
@@ -838,7 +920,7 @@ export class MonoClass extends MonoHandle {
     try {
       const defPtr = this.native.mono_unity_class_get_generic_type_definition(this.pointer);
       if (!pointerIsNull(defPtr)) {
-        return new MonoClass(this.api, defPtr);
+        return this.api.intern(MonoClass, defPtr);
       }
     } catch {
       // Return null
@@ -939,12 +1021,12 @@ export class MonoClass extends MonoHandle {
 
         // Convert MonoType to MonoClass
         const klassPtr = tryGetClassPtrFromMonoType(this.api, monoTypeGlobal);
-        return klassPtr ? new MonoClass(this.api, klassPtr) : null;
+        return klassPtr ? this.api.intern(MonoClass, klassPtr) : null;
       }
 
       // Convert MonoType to MonoClass
       const klassPtr = tryGetClassPtrFromMonoType(this.api, monoType);
-      return klassPtr ? new MonoClass(this.api, klassPtr) : null;
+      return klassPtr ? this.api.intern(MonoClass, klassPtr) : null;
     } catch (e) {
       // Silently fail and return null
       return null;
@@ -1119,3 +1201,199 @@ export class MonoClass extends MonoHandle {
     return this.properties.filter(predicate);
   }
 }
+
+// ============================================================================
+// MEMBER INDEX
+// ============================================================================
+
+/**
+ * Name-keyed lookup tables for the members declared by one class.
+ *
+ * Each table is built from the class's member list on first use, so a field
+ * lookup never enumerates methods. Method overloads are additionally keyed by
+ * their parameter type signature the first time a typed lookup asks for them.
+ */
+class ClassMemberIndex {
+  private readonly signatures = new Map<string, MonoMethod | null>();
+
+  constructor(private readonly klass: MonoClass) {}
+
+  /** Method name -> overloads, in declaration order. */
+  @lazy
+  get methods(): Map<string, MonoMethod[]> {
+    const result = new Map<string, MonoMethod[]>();
+    for (const method of this.klass.methods) {
+      const overloads = result.get(method.name);
+      if (overloads) {
+        overloads.push(method);
+      } else {
+        result.set(method.name, [method]);
+      }
+    }
+    return result;
+  }
+
+  /** Field name -> field (first declaration wins). */
+  @lazy
+  get fields(): Map<string, MonoField> {
+    return indexByName(this.klass.fields);
+  }
+
+  /** Property name -> property (first declaration wins). */
+  @lazy
+  get properties(): Map<string, MonoProperty> {
+    return indexByName(this.klass.properties);
+  }
+
+  /** Nested type name -> nested class. */
+  @lazy
+  get nestedTypes(): Map<string, MonoClass> {
+    return indexByName(this.klass.nestedTypes);
+  }
+
+  overloads(name: string): readonly MonoMethod[] {
+    return this.methods.get(name) ?? [];
+  }
+
+  /**
+   * First overload with the given arity (-1 matches any), mirroring
+   * `mono_class_get_method_from_name`.
+   */
+  methodByArity(name: string, paramCount: number): MonoMethod | null {
+    const overloads = this.methods.get(name);
+    if (!overloads) {
+      return null;
+    }
+    if (paramCount < 0) {
+      return overloads[0];
+    }
+    return overloads.find(method => method.parameterCount === paramCount) ?? null;
+  }
+
+  /** Overload whose parameter type full names match exactly. */
+  methodBySignature(name: string, parameterTypes: readonly string[]): MonoMethod | null {
+    const key = signatureKey(name, parameterTypes);
+    const cached = this.signatures.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+    for (const method of this.overloads(name)) {
+      const methodKey = signatureKey(name, method.parameterTypes.map(type => type.fullName));
+      if (!this.signatures.has(methodKey)) {
+        this.signatures.set(methodKey, method);
+      }
+    }
+    // Remember misses as well, so repeated failing lookups stay O(1)
+    if (!this.signatures.has(key)) {
+      this.signatures.set(key, null);
+    }
+    return this.signatures.get(key) ?? null;
+  }
+}
+
+/**
+ * Members of a class merged with those of its base classes and interfaces.
+ *
+ * The parent's table is reused rather than re-walked, so every class in a
+ * hierarchy is flattened exactly once. Each table is flattened independently on
+ * first use, so field and property lookups never enumerate methods or
+ * interfaces. Lookups by name (and arity) are single map reads after warm-up.
+ */
+class ClassHierarchyMembers {
+  private readonly arityCache = new Map<string, MonoMethod | null>();
+
+  constructor(
+    private readonly own: ClassMemberIndex,
+    private readonly parent: () => ClassHierarchyMembers | null,
+    private readonly interfaces: () => ClassHierarchyMembers[],
+  ) {}
+
+  /** Method name -> overloads; own first, then base classes, then interfaces. */
+  @lazy
+  get methods(): Map<string, MonoMethod[]> {
+    const result = new Map<string, MonoMethod[]>();
+    for (const [name, overloads] of this.own.methods) {
+      result.set(name, overloads.slice());
+    }
+    const parent = this.parent();
+    if (parent) {
+      mergeMethods(result, parent.methods);
+    }
+    for (const iface of this.interfaces()) {
+      mergeMethods(result, iface.methods);
+    }
+    return result;
+  }
+
+  /** Field name -> most derived field with that name. */
+  @lazy
+  get fields(): Map<string, MonoField> {
+    const result = new Map(this.own.fields);
+    const parent = this.parent();
+    if (parent) {
+      mergeMissing(result, parent.fields);
+    }
+    return result;
+  }
+
+  /** Property name -> most derived property with that name. */
+  @lazy
+  get properties(): Map<string, MonoProperty> {
+    const result = new Map(this.own.properties);
+    const parent = this.parent();
+    if (parent) {
+      mergeMissing(result, parent.properties);
+    }
+    return result;
+  }
+
+  methodByArity(name: string, paramCount: number): MonoMethod | null {
+    const key = `${name}:${paramCount}`;
+    const cached = this.arityCache.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+    const overloads = this.methods.get(name) ?? [];
+    const result =
+      (paramCount < 0 ? overloads[0] : overloads.find(method => method.parameterCount === paramCount)) ?? null;
+    this.arityCache.set(key, result);
+    return result;
+  }
+}
+
+function mergeMethods(target: Map<string, MonoMethod[]>, source: Map<string, MonoMethod[]>): void {
+  for (const [name, overloads] of source) {
+    const existing = target.get(name);
+    if (!existing) {
+      target.set(name, overloads.slice());
+      continue;
+    }
+    for (const method of overloads) {
+      if (!existing.includes(method)) {
+        existing.push(method);
+      }
+    }
+  }
+}
+
+function mergeMissing<T>(target: Map<string, T>, source: Map<string, T>): void {
+  for (const [name, value] of source) {
+    if (!target.has(name)) {
+      target.set(name, value);
+    }
+  }
+}
+
+function signatureKey(name: string, parameterTypes: readonly string[]): string {
+  return `${name}(${parameterTypes.join(",")})`;
+}
+
+function indexByName<T extends { name: string }>(items: readonly T[]): Map<string, T> {
+  const result = new Map<string, T>();
+  for (const item of items) {
+    if (!result.has(item.name)) {
+      result.set(item.name, item);
+    }
+  }
+  return result;
+}
@@ -11,6 +11,7 @@
 
 import type { MonoApi } from "../runtime/api";
 import { MonoErrorCodes, raise } from "../utils/errors";
+import { runInSlices, TimeSliceOptions } from "../utils/time-slice";
 import { MonoAssembly } from "./assembly";
 import { MonoClass } from "./class";
 import { MonoDomain } from "./domain";
@@ -445,6 +446,55 @@ export function collectClasses(api: MonoApi, options: ClassCollectionOptions = {
   return summaries;
 }
 
+/**
+ * Time-sliced variant of `collectClasses()`.
+ *
+ * Walks assemblies and classes lazily, yielding to the event loop whenever a
+ * slice exceeds `budgetMs`. Progress is reported in classes visited.
+ *
+ * @example
+ * ```typescript
+ * const summaries = await collectClassesAsync(api, { includeMethods: true, budgetMs: 4 });
+ * ```
+ */
+export async function collectClassesAsync(
+  api: MonoApi,
+  options: ClassCollectionOptions & TimeSliceOptions = {},
+): Promise<ClassSummary[]> {
+  const domain = options.domain ?? MonoDomain.getRoot(api);
+  const summaries: ClassSummary[] = [];
+
+  function* visitClasses(): Generator<[MonoAssembly, MonoClass], void, undefined> {
+    for (const assembly of domain.assemblies) {
+      if (options.filter && !options.filter(assembly)) {
+        continue;
+      }
+      for (const klass of assembly.image.iterClasses()) {
+        yield [assembly, klass];
+      }
+    }
+  }
+
+  await runInSlices(
+    visitClasses(),
+    ([assembly, klass]) => {
+      if (options.classFilter && !options.classFilter(klass)) {
+        return;
+      }
+      let methods: MonoMethod[] | undefined;
+      if (options.includeMethods) {
+        const collected = klass.methods;
+        methods = options.methodFilter ? collected.filter(options.methodFilter) : collected;
+      }
+      summaries.push({ assembly, image: assembly.image, klass, methods });
+    },
+    options,
+    domain.assemblies.reduce((sum, assembly) => sum + assembly.image.classCount, 0),
+  );
+
+  return summaries;
+}
+
 export function groupClassesByNamespace(classes: Iterable<MonoClass>): Map<string, MonoClass[]> {
   const index = new Map<string, MonoClass[]>();
   for (const klass of classes) {
@@ -218,7 +218,7 @@ export class MonoDelegate extends MonoObject {
   @lazy
   get invokeMethod(): MonoMethod {
     const { invoke } = this.ensureInvokeData();
-    return new MonoMethod(this.api, invoke);
+    return this.api.intern(MonoMethod, invoke);
   }
 
   /**
@@ -1,12 +1,16 @@
 import type { MonoApi } from "../runtime/api";
+import { isMetadataSnapshot, METADATA_SNAPSHOT_MESSAGE, MetadataSnapshot } from "../runtime/metadata-snapshot";
+import type { MetadataTypeDef } from "../runtime/metadata-tables";
 import { lazy } from "../utils/cache";
 import { MonoErrorCodes, raise } from "../utils/errors";
 import { pointerIsNull } from "../utils/memory";
-import { matchesPattern } from "../utils/pattern";
-import { MonoAssembly } from "./assembly";
+import { compilePattern } from "../utils/pattern";
+import { runInSlices, TimeSliceOptions } from "../utils/time-slice";
+import { AssemblyReferenceGraph, MonoAssembly } from "./assembly";
 import { MonoClass } from "./class";
 import { MonoField } from "./field";
 import { MonoHandle } from "./handle";
+import type { MonoImage } from "./image";
 import { MonoMethod } from "./method";
 import { MonoProperty } from "./property";
 
@@ -73,6 +77,11 @@ export interface FindOptions {
   filter?: (item: unknown) => boolean;
 }
 
+/**
+ * Options for time-sliced domain searches.
+ */
+export interface FindAsyncOptions extends FindOptions, TimeSliceOptions {}
+
 /**
  * Represents a Mono application domain.
  *
@@ -105,6 +114,19 @@ export class MonoDomain extends MonoHandle {
   /** Cached root domain pointer for comparison */
   private static rootDomainPtr: NativePointer | null = null;
 
+  /** Known assemblies in discovery order; null until first access */
+  private assemblyList: MonoAssembly[] | null = null;
+
+  /** Pointer keys of `assemblyList`, for de-duplicating load notifications */
+  private readonly assemblyKeys = new Set<string>();
+
+  /** Position in `api.assemblyLoads` up to which loads have been applied; -1 if loads are untracked */
+  private assemblyLoadCursor = 0;
+
+  /** Class name index over `assemblyList[0..indexedAssemblyCount)` */
+  private readonly nameIndex = new DomainClassIndex();
+  private indexedAssemblyCount = 0;
+
   // ===== STATIC FACTORY METHODS =====
 
   /**
@@ -156,150 +178,141 @@ export class MonoDomain extends MonoHandle {
   // ===== FIND HELPERS =====
 
   /**
-   * Find classes by pattern across all loaded assemblies.
+   * Lazily iterate over classes matching a pattern across all loaded assemblies.
+   *
+   * @remarks
+   * Names are matched against TypeDef metadata before a class is loaded, and
+   * nothing past the last yielded match is touched, so `limit` or an early
+   * `break` ends the scan immediately.
+   *
+   * @example
+   * ```typescript
+   * const first = domain.iterClasses("*Manager").next().value;
+   * ```
    */
-  findClasses(pattern: string, options: FindOptions = {}): MonoClass[] {
-    const results: MonoClass[] = [];
-    const seenClasses = new Set<string>();
-
-    const searchNamespace = options.searchNamespace !== false;
-    const limit = options.limit;
-    const customFilter = options.filter;
-
-    this.enumerateAssemblies((assembly: MonoAssembly) => {
-      if (limit !== undefined && results.length >= limit) {
-        return;
+  *iterClasses(pattern: string, options: FindOptions = {}): Generator<MonoClass, void, undefined> {
+    for (const klass of this.scanClasses(pattern, options)) {
+      if (klass) {
+        yield klass;
       }
+    }
+  }
 
-      const image = assembly.image;
-      const klassArray = image.classes;
-
-      for (const klass of klassArray) {
-        if (limit !== undefined && results.length >= limit) {
-          break;
-        }
-
-        const klassKey = klass.pointer.toString();
-        if (seenClasses.has(klassKey)) {
-          continue;
-        }
-        seenClasses.add(klassKey);
-
-        const name = klass.name;
-        const namespace = klass.namespace;
-        const fullName = namespace ? `${namespace}.${name}` : name;
-
-        const matches = searchNamespace
-          ? matchesPattern(fullName, pattern, options)
-          : matchesPattern(name, pattern, options);
-
-        if (!matches) {
-          continue;
-        }
-        if (customFilter && !customFilter(klass)) {
-          continue;
+  /**
+   * Find classes by pattern without blocking the thread for the whole scan.
+   *
+   * @remarks
+   * Returns the same classes as `findClasses()`, but processes TypeDef rows in
+   * slices of at most `budgetMs` and yields to the event loop in between.
+   * Progress is reported in TypeDef rows against `totalClassCount`.
+   *
+   * @example
+   * ```typescript
+   * const managers = await domain.findClassesAsync("*Manager", {
+   *   budgetMs: 4,
+   *   onProgress: p => console.log(`${p.processed}/${p.total}`),
+   * });
+   * ```
+   */
+  async findClassesAsync(pattern: string, options: FindAsyncOptions = {}): Promise<MonoClass[]> {
+    const results: MonoClass[] = [];
+    await runInSlices(
+      this.scanClasses(pattern, options),
+      klass => {
+        if (klass) {
+          results.push(klass);
         }
-        results.push(klass);
-      }
-    });
-
+      },
+      options,
+      // Row counts only; totalClassCount would build the whole name index up front
+      this.assemblies.reduce((sum, assembly) => sum + assembly.image.classCount, 0),
+    );
     return results;
   }
 
   /**
-   * Find methods by pattern across all loaded assemblies.
-   * Supports ClassName.MethodName when options.regex is false.
+   * Step through every TypeDef row of the domain, yielding matching classes
+   * and `null` for rows that did not match. Stops once `limit` matches were yielded.
    */
-  findMethods(pattern: string, options: FindOptions = {}): MonoMethod[] {
-    const results: MonoMethod[] = [];
-    let classPattern = "*";
-    let methodPattern = pattern;
+  private *scanClasses(pattern: string, options: FindOptions): Generator<MonoClass | null, void, undefined> {
     const limit = options.limit;
-    const customFilter = options.filter;
-
-    if (pattern.includes(".") && !options.regex) {
-      const parts = pattern.split(".");
-      classPattern = parts.slice(0, -1).join(".");
-      methodPattern = parts[parts.length - 1];
+    if (limit !== undefined && limit <= 0) {
+      return;
     }
+    const searchNamespace = options.searchNamespace !== false;
+    const customFilter = options.filter;
+    const matcher = compilePattern(pattern, options);
+    const nameFilter = (typeDef: MetadataTypeDef): boolean =>
+      matcher.test(searchNamespace ? typeDef.fullName : typeDef.name);
 
-    const matchingClasses = this.findClasses(classPattern, {
-      ...options,
-      searchNamespace: true,
-      limit: undefined,
-      filter: undefined,
-    });
-
-    for (const klass of matchingClasses) {
-      if (limit !== undefined && results.length >= limit) {
-        break;
-      }
-
-      const klassMethods = klass.methods;
-      for (const method of klassMethods) {
-        if (limit !== undefined && results.length >= limit) {
-          break;
-        }
-
-        if (!matchesPattern(method.name, methodPattern, options)) {
+    let count = 0;
+    for (const assembly of this.assemblies) {
+      for (const klass of assembly.image.scanClasses(nameFilter)) {
+        if (!klass || (customFilter && !customFilter(klass))) {
+          yield null;
           continue;
         }
-        if (customFilter && !customFilter(method)) {
-          continue;
+        yield klass;
+        count++;
+        if (limit !== undefined && count >= limit) {
+          return;
         }
-        results.push(method);
       }
     }
+  }
 
-    return results;
+  /**
+   * Lazily iterate over methods matching a pattern across all loaded assemblies.
+   * Supports ClassName.MethodName when options.regex is false.
+   *
+   * @example
+   * ```typescript
+   * for (const method of domain.iterMethods("*Player.Update")) {
+   *   console.log(method.fullName);
+   * }
+   * ```
+   */
+  iterMethods(pattern: string, options: FindOptions = {}): Generator<MonoMethod, void, undefined> {
+    return this.iterMembers(pattern, options, klass => klass.iterMethods());
   }
 
   /**
-   * Find fields by pattern across all loaded assemblies.
+   * Lazily iterate over fields matching a pattern across all loaded assemblies.
    * Supports ClassName.FieldName when options.regex is false.
    */
-  findFields(pattern: string, options: FindOptions = {}): MonoField[] {
-    const results: MonoField[] = [];
-    let classPattern = "*";
-    let fieldPattern = pattern;
-    const limit = options.limit;
-    const customFilter = options.filter;
-
-    if (pattern.includes(".") && !options.regex) {
-      const parts = pattern.split(".");
-      classPattern = parts.slice(0, -1).join(".");
-      fieldPattern = parts[parts.length - 1];
-    }
-
-    const matchingClasses = this.findClasses(classPattern, {
-      ...options,
-      searchNamespace: true,
-      limit: undefined,
-      filter: undefined,
-    });
+  iterFields(pattern: string, options: FindOptions = {}): Generator<MonoField, void, undefined> {
+    return this.iterMembers(pattern, options, klass => klass.iterFields());
+  }
 
-    for (const klass of matchingClasses) {
-      if (limit !== undefined && results.length >= limit) {
-        break;
-      }
+  /**
+   * Lazily iterate over properties matching a pattern across all loaded assemblies.
+   * Supports ClassName.PropertyName when options.regex is false.
+   */
+  iterProperties(pattern: string, options: FindOptions = {}): Generator<MonoProperty, void, undefined> {
+    return this.iterMembers(pattern, options, klass => klass.iterProperties());
+  }
 
-      const klassFields = klass.fields;
-      for (const field of klassFields) {
-        if (limit !== undefined && results.length >= limit) {
-          break;
-        }
+  /**
+   * Find classes by pattern across all loaded assemblies.
+   */
+  findClasses(pattern: string, options: FindOptions = {}): MonoClass[] {
+    return Array.from(this.iterClasses(pattern, options));
+  }
 
-        if (!matchesPattern(field.name, fieldPattern, options)) {
-          continue;
-        }
-        if (customFilter && !customFilter(field)) {
-          continue;
-        }
-        results.push(field);
-      }
-    }
+  /**
+   * Find methods by pattern across all loaded assemblies.
+   * Supports ClassName.MethodName when options.regex is false.
+   */
+  findMethods(pattern: string, options: FindOptions = {}): MonoMethod[] {
+    return Array.from(this.iterMethods(pattern, options));
+  }
 
-    return results;
+  /**
+   * Find fields by pattern across all loaded assemblies.
+   * Supports ClassName.FieldName when options.regex is false.
+   */
+  findFields(pattern: string, options: FindOptions = {}): MonoField[] {
+    return Array.from(this.iterFields(pattern, options));
   }
 
   /**
@@ -307,47 +320,56 @@ export class MonoDomain extends MonoHandle {
    * Supports ClassName.PropertyName when options.regex is false.
    */
   findProperties(pattern: string, options: FindOptions = {}): MonoProperty[] {
-    const results: MonoProperty[] = [];
-    let classPattern = "*";
-    let propPattern = pattern;
+    return Array.from(this.iterProperties(pattern, options));
+  }
+
+  /**
+   * Shared member search: split `Class.Member` patterns, stream matching
+   * classes, and stop as soon as `limit` members have been yielded.
+   */
+  private *iterMembers<T extends { name: string }>(
+    pattern: string,
+    options: FindOptions,
+    members: (klass: MonoClass) => Iterable<T>,
+  ): Generator<T, void, undefined> {
     const limit = options.limit;
-    const customFilter = options.filter;
+    if (limit !== undefined && limit <= 0) {
+      return;
+    }
 
+    let classPattern = "*";
+    let memberPattern = pattern;
     if (pattern.includes(".") && !options.regex) {
-      const parts = pattern.split(".");
-      classPattern = parts.slice(0, -1).join(".");
-      propPattern = parts[parts.length - 1];
+      const lastDot = pattern.lastIndexOf(".");
+      classPattern = pattern.slice(0, lastDot);
+      memberPattern = pattern.slice(lastDot + 1);
     }
 
-    const matchingClasses = this.findClasses(classPattern, {
+    const customFilter = options.filter;
+    const matcher = compilePattern(memberPattern, options);
+    const classes = this.iterClasses(classPattern, {
       ...options,
       searchNamespace: true,
       limit: undefined,
       filter: undefined,
     });
 
-    for (const klass of matchingClasses) {
-      if (limit !== undefined && results.length >= limit) {
-        break;
-      }
-
-      const klassProperties = klass.properties;
-      for (const prop of klassProperties) {
-        if (limit !== undefined && results.length >= limit) {
-          break;
-        }
-
-        if (!matchesPattern(prop.name, propPattern, options)) {
+    let count = 0;
+    for (const klass of classes) {
+      for (const member of members(klass)) {
+        if (!matcher.test(member.name)) {
           continue;
         }
-        if (customFilter && !customFilter(prop)) {
+        if (customFilter && !customFilter(member)) {
           continue;
         }
-        results.push(prop);
+        yield member;
+        count++;
+        if (limit !== undefined && count >= limit) {
+          return;
+        }
       }
     }
-
-    return results;
   }
 
   // ===== CORE PROPERTIES =====
@@ -413,23 +435,63 @@ export class MonoDomain extends MonoHandle {
         "Ensure the file exists and is a valid Mono assembly",
       );
     }
-    return new MonoAssembly(this.api, assemblyPtr);
+    return this.api.intern(MonoAssembly, assemblyPtr);
   }
 
   /**
    * Get all assemblies loaded in this domain.
    *
+   * @remarks
+   * The list is enumerated once; assemblies loaded afterwards are picked up
+   * from the runtime's assembly-load hook and appended, without a rescan.
+   * If loads cannot be tracked, the domain is re-enumerated on every access.
+   *
    * @example
    * ```typescript
    * const assemblies = domain.assemblies;
    * assemblies.forEach(asm => console.log(asm.name));
    * ```
    */
-  @lazy
   get assemblies(): MonoAssembly[] {
-    const assemblies: MonoAssembly[] = [];
-    this.enumerateAssemblies(assembly => assemblies.push(assembly));
-    return assemblies;
+    if (this.assemblyList === null) {
+      // Start tracking before enumerating so nothing loaded in between is missed
+      const tracking = this.api.trackAssemblyLoads();
+      this.assemblyLoadCursor = tracking ? this.api.assemblyLoads.length : -1;
+      this.assemblyList = [];
+      this.enumerateAssemblies(assembly => this.appendAssembly(assembly));
+    } else if (this.assemblyLoadCursor < 0) {
+      // Without the load hook a rescan is the only way to see new assemblies
+      this.enumerateAssemblies(assembly => this.appendAssembly(assembly));
+    } else {
+      this.applyAssemblyLoads();
+    }
+    return this.assemblyList;
+  }
+
+  /**
+   * Append assemblies the load hook reported for this domain since the last call.
+   */
+  private applyAssemblyLoads(): void {
+    const loads = this.api.assemblyLoads;
+    if (this.assemblyLoadCursor === loads.length) {
+      return;
+    }
+    for (let i = this.assemblyLoadCursor; i < loads.length; i++) {
+      const { assembly, domain } = loads[i];
+      // Loads with an unknown domain are kept: a spurious entry is cheaper than a missed one
+      if (domain.isNull() || domain.equals(this.pointer)) {
+        this.appendAssembly(this.api.intern(MonoAssembly, assembly));
+      }
+    }
+    this.assemblyLoadCursor = loads.length;
+  }
+
+  private appendAssembly(assembly: MonoAssembly): void {
+    const key = assembly.pointer.toString();
+    if (!this.assemblyKeys.has(key)) {
+      this.assemblyKeys.add(key);
+      this.assemblyList!.push(assembly);
+    }
   }
 
   /**
@@ -544,9 +606,10 @@ export class MonoDomain extends MonoHandle {
    * @returns MonoClass if found, null otherwise
    *
    * @remarks
-   * This method searches through all loaded assemblies until it finds a match.
-   * For better performance when you know which assembly contains the class,
-   * use `assembly.image.tryClass()` directly.
+   * Resolved through a domain-wide name index built from each image's TypeDef
+   * table on first use, so a lookup (hit or miss) costs at most one native call.
+   * Nested types use `/` between enclosing and nested names, matching
+   * `image.tryClass()` (e.g. `"System.Environment/SpecialFolder"`).
    *
    * @example
    * ```typescript
@@ -561,49 +624,8 @@ export class MonoDomain extends MonoHandle {
     if (trimmed.length === 0) {
       return null;
     }
-
-    // Fast path for common namespaces
-    const lastDot = trimmed.lastIndexOf(".");
-    const namespace = lastDot >= 0 ? trimmed.slice(0, lastDot) : "";
-    const className = lastDot >= 0 ? trimmed.slice(lastDot + 1) : trimmed;
-
-    // Fast path for System.* classes - try mscorlib first
-    if (namespace === "System" || namespace.startsWith("System.")) {
-      const mscorlibImage = this.api.native.mono_image_loaded(this.api.allocUtf8StringCached("mscorlib"));
-      if (!pointerIsNull(mscorlibImage)) {
-        const nsPtr = this.api.allocUtf8StringCached(namespace);
-        const namePtr = this.api.allocUtf8StringCached(className);
-        const klassPtr = this.api.native.mono_class_from_name(mscorlibImage, nsPtr, namePtr);
-        if (!pointerIsNull(klassPtr)) {
-          return new MonoClass(this.api, klassPtr);
-        }
-      }
-    }
-
-    // Fast path for UnityEngine.* classes - try UnityEngine.CoreModule first
-    if (namespace === "UnityEngine" || namespace.startsWith("UnityEngine.")) {
-      const unityAssemblyNames = ["UnityEngine.CoreModule", "UnityEngine", "UnityEngine.dll"];
-
-      for (const assemblyName of unityAssemblyNames) {
-        const unityImage = this.api.native.mono_image_loaded(this.api.allocUtf8StringCached(assemblyName));
-        if (!pointerIsNull(unityImage)) {
-          const nsPtr = this.api.allocUtf8StringCached(namespace);
-          const namePtr = this.api.allocUtf8StringCached(className);
-          const klassPtr = this.api.native.mono_class_from_name(unityImage, nsPtr, namePtr);
-          if (!pointerIsNull(klassPtr)) {
-            return new MonoClass(this.api, klassPtr);
-          }
-        }
-      }
-    }
-
-    for (const assembly of this.assemblies) {
-      const klass = assembly.image.tryClass(trimmed);
-      if (klass) {
-        return klass;
-      }
-    }
-    return null;
+    const entry = this.classIndex.lookup(trimmed);
+    return entry ? entry.image.getTypeByToken(entry.token) : null;
   }
 
   /**
@@ -614,9 +636,7 @@ export class MonoDomain extends MonoHandle {
    * @throws {MonoClassNotFoundError} if class not found
    *
    * @remarks
-   * This method searches through all loaded assemblies until it finds a match.
-   * For better performance when you know which assembly contains the class,
-   * use `assembly.image.class()` directly.
+   * Uses the same domain-wide name index as `tryClass()`.
    *
    * @example
    * ```typescript
@@ -655,21 +675,21 @@ export class MonoDomain extends MonoHandle {
    * // ["System", "UnityEngine", "Game", ...]
    * ```
    */
-  @lazy
   get rootNamespaces(): string[] {
-    const namespaces = new Set<string>();
-
-    for (const assembly of this.assemblies) {
-      for (const klass of assembly.image.classes) {
-        const ns = klass.namespace;
-        if (ns) {
-          const rootNs = ns.split(".")[0];
-          namespaces.add(rootNs);
-        }
-      }
-    }
+    return this.classIndex.rootNamespaces;
+  }
 
-    return Array.from(namespaces).sort();
+  /**
+   * Time-sliced variant of `rootNamespaces`; indexes one image per step.
+   *
+   * @example
+   * ```typescript
+   * const roots = await domain.rootNamespacesAsync({ budgetMs: 4 });
+   * ```
+   */
+  async rootNamespacesAsync(options: TimeSliceOptions = {}): Promise<string[]> {
+    await this.buildClassIndexAsync(options);
+    return this.nameIndex.rootNamespaces;
   }
 
   /**
@@ -683,20 +703,16 @@ export class MonoDomain extends MonoHandle {
    * // ["System", "System.Collections", "System.Collections.Generic", ...]
    * ```
    */
-  @lazy
   get allNamespaces(): string[] {
-    const namespaces = new Set<string>();
-
-    for (const assembly of this.assemblies) {
-      for (const klass of assembly.image.classes) {
-        const ns = klass.namespace;
-        if (ns) {
-          namespaces.add(ns);
-        }
-      }
-    }
+    return this.classIndex.namespaces;
+  }
 
-    return Array.from(namespaces).sort();
+  /**
+   * Time-sliced variant of `allNamespaces`; indexes one image per step.
+   */
+  async allNamespacesAsync(options: TimeSliceOptions = {}): Promise<string[]> {
+    await this.buildClassIndexAsync(options);
+    return this.nameIndex.namespaces;
   }
 
   /**
@@ -706,8 +722,8 @@ export class MonoDomain extends MonoHandle {
    * @returns Array of classes in the specified namespace
    *
    * @remarks
-   * This searches across all loaded assemblies. For better performance
-   * when searching within a single assembly, use `image.getClassesByNamespace()`.
+   * Served from the domain-wide name index; only the classes in the
+   * namespace are loaded.
    *
    * @example
    * ```typescript
@@ -718,19 +734,64 @@ export class MonoDomain extends MonoHandle {
   getClassesInNamespace(namespace: string): MonoClass[] {
     const classes: MonoClass[] = [];
 
-    for (const assembly of this.assemblies) {
-      for (const klass of assembly.image.classes) {
-        if (klass.namespace === namespace) {
-          classes.push(klass);
-        }
+    for (const entry of this.classIndex.inNamespace(namespace)) {
+      const klass = entry.image.getTypeByToken(entry.token);
+      if (klass) {
+        classes.push(klass);
       }
     }
 
     return classes;
   }
 
+  /**
+   * Domain-wide class name index. Images are indexed on first use and as new
+   * assemblies appear in `assemblies`; indexed images are never rescanned.
+   */
+  private get classIndex(): DomainClassIndex {
+    const assemblies = this.assemblies;
+    while (this.indexedAssemblyCount < assemblies.length) {
+      this.nameIndex.addImage(assemblies[this.indexedAssemblyCount].image);
+      this.indexedAssemblyCount++;
+    }
+    return this.nameIndex;
+  }
+
+  /**
+   * Bring the class index up to date, yielding to the event loop between images.
+   */
+  private async buildClassIndexAsync(options: TimeSliceOptions): Promise<void> {
+    const assemblies = this.assemblies;
+    await runInSlices(this.indexPendingAssemblies(), () => {}, options, assemblies.length - this.indexedAssemblyCount);
+  }
+
+  /**
+   * Index assemblies not yet in the class index, one image per step.
+   */
+  private *indexPendingAssemblies(): Generator<MonoAssembly, void, undefined> {
+    const assemblies = this.assemblies;
+    while (this.indexedAssemblyCount < assemblies.length) {
+      const assembly = assemblies[this.indexedAssemblyCount];
+      this.nameIndex.addImage(assembly.image);
+      this.indexedAssemblyCount++;
+      yield assembly;
+    }
+  }
+
   // ===== ASSEMBLY MANAGEMENT =====
 
+  /**
+   * Reference graph over all loaded assemblies (forward and reverse edges).
+   *
+   * @example
+   * ```typescript
+   * const dependents = domain.referenceGraph.referrersOf(domain.assembly("UnityEngine.CoreModule"));
+   * ```
+   */
+  get referenceGraph(): AssemblyReferenceGraph {
+    return AssemblyReferenceGraph.of(this.api);
+  }
+
   /**
    * Enumerate all assemblies in this domain.
    *
@@ -759,7 +820,7 @@ export class MonoDomain extends MonoHandle {
           return;
         }
         seen.add(key);
-        visitor(new MonoAssembly(this.api, assemblyPtr));
+        visitor(this.api.intern(MonoAssembly, assemblyPtr));
       },
       "void",
       ["pointer", "pointer"],
@@ -900,6 +961,91 @@ export class MonoDomain extends MonoHandle {
     }
   }
 
+  // ===== METADATA SNAPSHOTS =====
+
+  /**
+   * Export metadata snapshots for the images in this domain.
+   *
+   * @param filter Optional image filter (e.g. only game assemblies)
+   * @returns One snapshot per image with readable metadata
+   *
+   * @example
+   * ```typescript
+   * rpc.exports = {
+   *   metadataSnapshots: () => Mono.domain.exportMetadataSnapshots(image => image.name === "Assembly-CSharp"),
+   * };
+   * ```
+   */
+  exportMetadataSnapshots(filter?: (image: MonoImage) => boolean): MetadataSnapshot[] {
+    const snapshots: MetadataSnapshot[] = [];
+    for (const assembly of this.assemblies) {
+      const image = assembly.image;
+      if ((filter && !filter(image)) || !image.metadata.available || image.snapshotKey.mvid === "") {
+        continue;
+      }
+      snapshots.push(image.exportMetadataSnapshot());
+    }
+    return snapshots;
+  }
+
+  /**
+   * Send metadata snapshots to the host, one message per image.
+   *
+   * Each message has the shape `{ type: "mono-metadata-snapshot", snapshot }`.
+   *
+   * @param filter Optional image filter
+   * @returns Number of snapshots sent
+   */
+  sendMetadataSnapshots(filter?: (image: MonoImage) => boolean): number {
+    const snapshots = this.exportMetadataSnapshots(filter);
+    for (const snapshot of snapshots) {
+      send({ type: METADATA_SNAPSHOT_MESSAGE, snapshot });
+    }
+    return snapshots.length;
+  }
+
+  /**
+   * Restore image metadata from snapshots saved by the host in an earlier session.
+   *
+   * @remarks
+   * Snapshots are matched to loaded images by MVID; snapshots whose key no
+   * longer matches (rebuilt assembly) or that are malformed are skipped. Call
+   * this right after attaching, before the first class lookup or search.
+   *
+   * @param snapshots Snapshots as returned by `exportMetadataSnapshots()`
+   * @returns Number of images whose metadata was restored
+   *
+   * @example
+   * ```typescript
+   * recv("mono-metadata-snapshots", message => {
+   *   const restored = Mono.domain.importMetadataSnapshots(message.snapshots);
+   *   console.log(`Restored metadata for ${restored} images`);
+   * });
+   * ```
+   */
+  importMetadataSnapshots(snapshots: readonly unknown[]): number {
+    const byMvid = new Map<string, MonoImage>();
+    for (const assembly of this.assemblies) {
+      const image = assembly.image;
+      const mvid = image.snapshotKey.mvid;
+      if (mvid !== "") {
+        byMvid.set(mvid, image);
+      }
+    }
+
+    let restored = 0;
+    for (const snapshot of snapshots) {
+      if (!isMetadataSnapshot(snapshot)) {
+        continue;
+      }
+      const image = byMvid.get(snapshot.key.mvid);
+      if (image?.importMetadataSnapshot(snapshot)) {
+        restored++;
+      }
+    }
+    return restored;
+  }
+
   // ===== UTILITY METHODS =====
 
   /**
@@ -1010,7 +1156,8 @@ export class MonoDomain extends MonoHandle {
    * ```
    */
   hasClass(fullName: string): boolean {
-    return this.tryClass(fullName) !== null;
+    const trimmed = fullName ? fullName.trim() : "";
+    return trimmed.length > 0 && this.classIndex.lookup(trimmed) !== undefined;
   }
 
   /**
@@ -1070,12 +1217,8 @@ export class MonoDomain extends MonoHandle {
    * console.log(`Domain has ${domain.getTotalClassCount()} classes`);
    * ```
    */
-  @lazy get totalClassCount(): number {
-    let count = 0;
-    for (const assembly of this.assemblies) {
-      count += assembly.image.classCount;
-    }
-    return count;
+  get totalClassCount(): number {
+    return this.classIndex.classCount;
   }
 
   // ===== ITERATION SUPPORT =====
@@ -1130,3 +1273,135 @@ export class MonoDomain extends MonoHandle {
     return this.assemblies.filter(predicate);
   }
 }
+
+// ============================================================================
+// CLASS NAME INDEX
+// ============================================================================
+
+/** Location of a class definition: owning image and TypeDef token. */
+interface ClassIndexEntry {
+  image: MonoImage;
+  token: number;
+}
+
+/**
+ * Full-name and namespace index over the TypeDef tables of a set of images.
+ *
+ * Images are added one at a time and never rescanned, so the index can be
+ * extended as new assemblies show up. When several images define the same
+ * full name, the first one added wins.
+ */
+class DomainClassIndex {
+  private readonly byName = new Map<string, ClassIndexEntry>();
+  private readonly byNamespace = new Map<string, ClassIndexEntry[]>();
+  private readonly images = new Set<string>();
+  /** Images indexed without metadata tables, whose nested types are not indexed */
+  private readonly imagesWithoutNested: MonoImage[] = [];
+  private sortedNamespaces: string[] | null = null;
+  private sortedRootNamespaces: string[] | null = null;
+
+  /** Number of TypeDef rows across all indexed images. */
+  classCount = 0;
+
+  /** Number of indexed names. */
+  get size(): number {
+    return this.byName.size;
+  }
+
+  /** Non-empty namespaces, sorted. */
+  get namespaces(): string[] {
+    if (this.sortedNamespaces === null) {
+      this.sortedNamespaces = Array.from(this.byNamespace.keys())
+        .filter(ns => ns.length > 0)
+        .sort();
+    }
+    return this.sortedNamespaces;
+  }
+
+  /** First components of all namespaces, sorted. */
+  get rootNamespaces(): string[] {
+    if (this.sortedRootNamespaces === null) {
+      const roots = new Set(this.namespaces.map(ns => ns.split(".")[0]));
+      this.sortedRootNamespaces = Array.from(roots).sort();
+    }
+    return this.sortedRootNamespaces;
+  }
+
+  /**
+   * Index all type definitions of an image. Already indexed images are ignored.
+   *
+   * @returns true if the image was newly indexed
+   */
+  addImage(image: MonoImage): boolean {
+    const key = image.pointer.toString();
+    if (this.images.has(key)) {
+      return false;
+    }
+    this.images.add(key);
+    this.classCount += image.classCount;
+
+    if (image.metadata.available) {
+      const typeDefs = image.typeDefinitions;
+      const byToken = new Map<number, MetadataTypeDef>();
+      for (const typeDef of typeDefs) {
+        byToken.set(typeDef.token, typeDef);
+      }
+      for (const typeDef of typeDefs) {
+        this.add(typeDef.namespace, nestedTypeName(typeDef, byToken), { image, token: typeDef.token });
+      }
+    } else {
+      this.imagesWithoutNested.push(image);
+      image.enumerateClasses(klass => {
+        this.add(klass.namespace, klass.fullName, { image, token: klass.typeToken });
+      });
+    }
+    return true;
+  }
+
+  lookup(fullName: string): ClassIndexEntry | undefined {
+    const entry = this.byName.get(fullName);
+    if (entry !== undefined || !fullName.includes("/")) {
+      return entry;
+    }
+    // Nested names of images indexed without metadata resolve through mono_class_from_name
+    for (const image of this.imagesWithoutNested) {
+      const klass = image.tryClass(fullName);
+      if (klass) {
+        const found = { image, token: klass.typeToken };
+        this.byName.set(fullName, found);
+        return found;
+      }
+    }
+    return undefined;
+  }
+
+  inNamespace(namespace: string): readonly ClassIndexEntry[] {
+    return this.byNamespace.get(namespace) ?? [];
+  }
+
+  private add(namespace: string, fullName: string, entry: ClassIndexEntry): void {
+    if (!this.byName.has(fullName)) {
+      this.byName.set(fullName, entry);
+    }
+    let entries = this.byNamespace.get(namespace);
+    if (!entries) {
+      entries = [];
+      this.byNamespace.set(namespace, entries);
+      this.sortedNamespaces = null;
+      this.sortedRootNamespaces = null;
+    }
+    entries.push(entry);
+  }
+}
+
+/**
+ * Name of a type as accepted by `mono_class_from_name`: `Namespace.Name` for
+ * top-level types, `Namespace.Outer/Inner` for nested ones.
+ */
+function nestedTypeName(typeDef: MetadataTypeDef, byToken: ReadonlyMap<number, MetadataTypeDef>): string {
+  const enclosing = typeDef.enclosingToken !== 0 ? byToken.get(typeDef.enclosingToken) : undefined;
+  if (enclosing === undefined || enclosing === typeDef) {
+    return typeDef.fullName;
+  }
+  return `${nestedTypeName(enclosing, byToken)}/${typeDef.name}`;
+}
@@ -11,7 +11,14 @@ import { FieldAttribute, getMaskedValue, hasFlag } from "../runtime/metadata";
 import { boxPrimitiveValue } from "../runtime/value-conversion";
 import { lazy } from "../utils/cache";
 import { MonoErrorCodes, raise } from "../utils/errors";
-import { pointerIsNull, tryMakePointer, unwrapInstance, unwrapInstanceRequired } from "../utils/memory";
+import {
+  pointerIsNull,
+  scratchAlloc,
+  tryMakePointer,
+  unwrapInstance,
+  unwrapInstanceRequired,
+  withScratch,
+} from "../utils/memory";
 import { readUtf8String } from "../utils/string";
 import type { CustomAttribute } from "./attribute";
 import { createFieldAttributeContext, getCustomAttributes } from "./attribute";
@@ -21,6 +28,7 @@ import type { MemberAccessibility } from "./handle";
 import { MonoHandle } from "./handle";
 import { MonoObject } from "./object";
 import { MonoString } from "./string";
+import { getStructCodec, readStruct } from "./struct-codec";
 import {
   isArrayKind,
   isPointerLikeKind,
@@ -29,6 +37,7 @@ import {
   MonoTypeKind,
   MonoTypeSummary,
   readPrimitiveValue,
+  writePrimitiveValue,
 } from "./type";
 
 export type FieldAccessibility = MemberAccessibility;
@@ -41,6 +50,8 @@ export interface FieldAccessOptions {
 /** Options for reading a field value into JavaScript types. */
 export interface FieldReadOptions extends FieldAccessOptions {
   coerce?: boolean;
+  /** Decode struct values to plain objects (via their struct codec) instead of returning pointers */
+  decodeStructs?: boolean;
 }
 
 /** Serializable summary of a field and its type metadata. */
@@ -60,6 +71,9 @@ export interface MonoFieldSummary {
   token: number;
 }
 
+/** Size of the MonoObject header (vtable + synchronisation pointers) preceding instance fields. */
+const OBJECT_HEADER_POINTERS = 2;
+
 interface RawFieldValue {
   storage: NativePointer;
   valuePointer: NativePointer;
@@ -85,6 +99,9 @@ const FIELD_ACCESS_NAMES: Record<number, FieldAccessibility> = {
  * - Value access: raw pointer, object wrapper, and JS-coerced reads/writes
  */
 export class MonoField<T = unknown> extends MonoHandle {
+  /** Domain pointer -> static storage address (null when it must be read through Mono) */
+  #staticDataAddresses: Map<string, NativePointer | null> | null = null;
+
   // ===== CORE PROPERTIES =====
 
   /** Gets the name of this field. */
@@ -128,14 +145,14 @@ export class MonoField<T = unknown> extends MonoHandle {
   @lazy
   get parent(): MonoClass {
     const parentPtr = this.native.mono_field_get_parent(this.pointer);
-    return new MonoClass(this.api, parentPtr);
+    return this.api.intern(MonoClass, parentPtr);
   }
 
   /** Gets the type of this field. */
   @lazy
   get type(): MonoType {
     const typePtr = this.native.mono_field_get_type(this.pointer);
-    return new MonoType(this.api, typePtr);
+    return this.api.intern(MonoType, typePtr);
   }
 
   /** Gets the metadata token of this field. */
@@ -185,8 +202,8 @@ export class MonoField<T = unknown> extends MonoHandle {
   @lazy get customAttributes(): CustomAttribute[] {
     return getCustomAttributes(
       createFieldAttributeContext(this.api, this.parent.pointer, this.pointer, this.native),
-      ptr => new MonoClass(this.api, ptr).name,
-      ptr => new MonoClass(this.api, ptr).fullName,
+      ptr => this.api.intern(MonoClass, ptr).name,
+      ptr => this.api.intern(MonoClass, ptr).fullName,
     );
   }
 
@@ -275,13 +292,11 @@ export class MonoField<T = unknown> extends MonoHandle {
         "Use getValue() for non-64-bit fields",
       );
     }
-    const raw = this.readRawValue(instance, options);
-    if (kind === MonoTypeKind.I8) {
-      // Convert Frida's Int64 to native bigint
-      return BigInt(raw.storage.readS64().toString());
-    }
-    // Convert Frida's UInt64 to native bigint
-    return BigInt(raw.storage.readU64().toString());
+    return withScratch(() => {
+      const raw = this.readRawValue(instance, options, true);
+      // Convert Frida's Int64/UInt64 to native bigint
+      return BigInt((kind === MonoTypeKind.I8 ? raw.storage.readS64() : raw.storage.readU64()).toString());
+    });
   }
 
   /**
@@ -310,14 +325,16 @@ export class MonoField<T = unknown> extends MonoHandle {
         "Use setValue() for non-64-bit fields",
       );
     }
-    const storage = Memory.alloc(8);
-    // Convert native bigint to Frida's Int64/UInt64
-    if (kind === MonoTypeKind.I8) {
-      storage.writeS64(int64(value.toString()));
-    } else {
-      storage.writeU64(uint64(value.toString()));
-    }
-    this.setValue(instance, storage, options);
+    withScratch(() => {
+      const storage = scratchAlloc(8);
+      // Convert native bigint to Frida's Int64/UInt64
+      if (kind === MonoTypeKind.I8) {
+        storage.writeS64(int64(value.toString()));
+      } else {
+        storage.writeU64(uint64(value.toString()));
+      }
+      this.setValue(instance, storage, options);
+    });
   }
 
   /**
@@ -337,15 +354,22 @@ export class MonoField<T = unknown> extends MonoHandle {
    * @returns Coerced value or raw pointer
    */
   readValue(instance?: MonoObject | NativePointer | null, options: FieldReadOptions = {}): unknown {
-    const raw = this.readRawValue(instance, options);
-    const type = raw.type;
     if (options.coerce === false) {
-      if (isPointerLikeKind(type.kind)) {
+      const raw = this.readRawValue(instance, options);
+      if (isPointerLikeKind(raw.type.kind)) {
         return raw.storage.readPointer();
       }
       return raw.valuePointer;
     }
-    return this.coerceValue(raw, type);
+    // Inline structs are returned as a pointer to the storage, which must outlive this call
+    const type = this.type;
+    const kind = type.kind;
+    const transient =
+      !type.valueType || isPrimitiveKind(kind) || kind === MonoTypeKind.Enum || options.decodeStructs === true;
+    if (!transient) {
+      return this.coerceValue(this.readRawValue(instance, options), type, options);
+    }
+    return withScratch(() => this.coerceValue(this.readRawValue(instance, options, true), type, options));
   }
 
   // ===== VALUE MODIFICATION (WRITE OPERATIONS) =====
@@ -358,10 +382,11 @@ export class MonoField<T = unknown> extends MonoHandle {
    */
   setValue(instance: MonoObject | NativePointer | null, value: NativePointer, options: FieldAccessOptions = {}): void {
     if (this.isStatic) {
-      const preparedValue = this.prepareValuePointer(value);
       const domainPtr = this.resolveDomainPointer(options.domain);
       const vtable = this.getStaticVTable(domainPtr);
-      this.native.mono_field_static_set_value(vtable, this.pointer, preparedValue);
+      withScratch(() => {
+        this.native.mono_field_static_set_value(vtable, this.pointer, this.prepareValuePointer(value));
+      });
       return;
     }
     const target = unwrapInstanceRequired(instance, this);
@@ -505,6 +530,119 @@ export class MonoField<T = unknown> extends MonoHandle {
     this.setValueObject(null, convertedValue, options);
   }
 
+  // ===== COMPILED ACCESSORS =====
+
+  /**
+   * Compile direct get/set closures for this instance field.
+   *
+   * The field offset and type kind are resolved once; the returned closures
+   * then read and write `instance + offset` directly, without native calls or
+   * scratch allocations. Reference stores go through the GC write barrier.
+   *
+   * Values are coerced like `getTypedValue()`, except that struct-typed fields
+   * return a pointer to the inline value (not a copy).
+   *
+   * @returns Accessor cached on this field
+   * @throws {MonoError} if the field is static
+   *
+   * @example
+   * ```typescript
+   * const health = Player.field("health").compileAccessor();
+   * for (const player of players) {
+   *   if (health.get(player) <= 0) health.set(player, 100);
+   * }
+   * ```
+   */
+  compileAccessor(): FieldAccessor<T> {
+    return this.compiledAccessor;
+  }
+
+  @lazy
+  private get compiledAccessor(): FieldAccessor<T> {
+    if (this.isStatic) {
+      raise(
+        MonoErrorCodes.INVALID_ARGUMENT,
+        `Cannot compile an instance accessor for static field ${this.fullName}`,
+        "Use getTypedStaticValue()/setTypedStaticValue() for static fields",
+      );
+    }
+
+    const api = this.api;
+    const native = this.native;
+    const type = this.type;
+    // Value-type owners are addressed through their unboxed data, which has no object header
+    const offset = this.parent.isValueType ? this.offset - OBJECT_HEADER_POINTERS * Process.pointerSize : this.offset;
+    const kind = type.kind === MonoTypeKind.Enum ? (type.underlyingType?.kind ?? MonoTypeKind.I4) : type.kind;
+    const toReference = (value: unknown): NativePointer => {
+      if (value === null || value === undefined) {
+        return NULL;
+      }
+      if (value instanceof MonoObject) {
+        return value.pointer;
+      }
+      if (value instanceof NativePointer) {
+        return value;
+      }
+      if (typeof value === "string" && kind === MonoTypeKind.String) {
+        return api.stringNew(value);
+      }
+      raise(
+        MonoErrorCodes.TYPE_MISMATCH,
+        `Cannot store ${typeof value} in field ${this.name} (${type.fullName})`,
+        "Pass a MonoObject, NativePointer or null",
+        { fieldName: this.name, value, expectedType: type.fullName },
+      );
+    };
+
+    let read: (address: NativePointer) => unknown;
+    let write: (address: NativePointer, value: unknown) => void;
+
+    if (kind === MonoTypeKind.Char) {
+      read = address => String.fromCharCode(address.readU16());
+      write = (address, value) => address.writeU16(typeof value === "string" ? value.charCodeAt(0) : (value as number));
+    } else if (isPointerLikeKind(kind)) {
+      read = address => address.readPointer();
+      write = (address, value) => address.writePointer(value as NativePointer);
+    } else if (kind === MonoTypeKind.I8 || kind === MonoTypeKind.U8) {
+      read = address => readPrimitiveValue(address, kind);
+      write = (address, value) =>
+        writePrimitiveValue(
+          address,
+          kind,
+          typeof value === "bigint" ? (kind === MonoTypeKind.I8 ? int64 : uint64)(value.toString()) : value,
+        );
+    } else if (isPrimitiveKind(kind)) {
+      read = address => readPrimitiveValue(address, kind);
+      write = (address, value) => writePrimitiveValue(address, kind, value);
+    } else if (kind === MonoTypeKind.String) {
+      read = address => {
+        const str = address.readPointer();
+        return pointerIsNull(str) ? null : api.readMonoString(str, true);
+      };
+      write = (address, value) => native.mono_gc_wbarrier_generic_store(address, toReference(value));
+    } else if (type.valueType) {
+      const klassPtr = type.class?.pointer ?? NULL;
+      read = address => address;
+      write = (address, value) => {
+        const source = value instanceof MonoObject ? value.unbox() : (value as NativePointer);
+        native.mono_gc_wbarrier_value_copy(address, source, 1, klassPtr);
+      };
+    } else {
+      read = address => {
+        const obj = address.readPointer();
+        return pointerIsNull(obj) ? null : new MonoObject(api, obj);
+      };
+      write = (address, value) => native.mono_gc_wbarrier_generic_store(address, toReference(value));
+    }
+
+    return {
+      field: this,
+      offset,
+      get: instance => read(unwrapInstanceRequired(instance, this).add(offset)) as T,
+      set: (instance, value) => write(unwrapInstanceRequired(instance, this).add(offset), value),
+    };
+  }
+
   // ===== UTILITY METHODS =====
 
   /**
@@ -594,34 +732,85 @@ export class MonoField<T = unknown> extends MonoHandle {
    * Read the raw value of this field into allocated storage.
    * @param instance Object instance (null for static fields)
    * @param options Access options
+   * @param transient Storage is consumed before the enclosing scratch scope ends
    * @returns RawFieldValue with storage, valuePointer, and type
    */
   private readRawValue(
     instance: MonoObject | NativePointer | null | undefined,
     options: FieldAccessOptions,
+    transient = false,
   ): RawFieldValue {
     const type = this.type;
+    const kind = type.kind;
+    const isValueType = type.valueType;
+    const treatAsReference = !isValueType && !isPointerLikeKind(kind);
+
+    if (this.isStatic) {
+      const domainPtr = this.resolveDomainPointer(options.domain);
+      const address = this.staticDataAddress(domainPtr);
+      // Transient reads of primitives and references are decoded in place. Everything
+      // else is copied, so pointers returned by getValue() never alias the live static slot.
+      if (transient && address !== null && (!isValueType || isPrimitiveKind(kind) || kind === MonoTypeKind.Enum)) {
+        return { storage: address, valuePointer: treatAsReference ? address.readPointer() : address, type };
+      }
+    }
+
     const { size } = type.valueSize;
     const storageSize = Math.max(size, Process.pointerSize);
-    const storage = Memory.alloc(storageSize);
+    const storage = transient ? scratchAlloc(storageSize) : Memory.alloc(storageSize);
 
     if (this.isStatic) {
       const domainPtr = this.resolveDomainPointer(options.domain);
-      const vtable = this.getStaticVTable(domainPtr);
-      this.native.mono_field_static_get_value(vtable, this.pointer, storage);
+      const address = this.staticDataAddress(domainPtr);
+      if (address !== null) {
+        Memory.copy(storage, address, size);
+      } else {
+        const vtable = this.getStaticVTable(domainPtr);
+        this.native.mono_field_static_get_value(vtable, this.pointer, storage);
+      }
     } else {
       const target = unwrapInstanceRequired(instance, this);
       this.native.mono_field_get_value(target, this.pointer, storage);
     }
 
-    const kind = type.kind;
-    const isValueType = type.valueType;
-    const treatAsReference = !isValueType && !isPointerLikeKind(kind);
     const valuePointer = treatAsReference ? storage.readPointer() : storage;
 
     return { storage, valuePointer, type };
   }
 
+  /**
+   * Resolve (once per domain) the address of this static field's storage.
+   *
+   * Runs the class constructor on first use, like `mono_field_static_get_value`.
+   * Literal and thread/context-static fields have no fixed address, and older
+   * runtimes may lack `mono_vtable_get_static_field_data`; those return null
+   * and keep using the native accessors.
+   */
+  private staticDataAddress(domainPtr: NativePointer): NativePointer | null {
+    if (!this.#staticDataAddresses) {
+      this.#staticDataAddresses = new Map();
+    }
+    const key = domainPtr.toString();
+    const cached = this.#staticDataAddresses.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    let address: NativePointer | null = null;
+    // Special (thread/context) statics report an offset of -1
+    const hasFixedOffset = (this.offset | 0) >= 0;
+    if (!this.isLiteral && hasFixedOffset && this.api.hasExport("mono_vtable_get_static_field_data")) {
+      const vtable = this.getStaticVTable(domainPtr);
+      this.native.mono_runtime_class_init(vtable);
+      const data = this.native.mono_vtable_get_static_field_data(vtable);
+      if (!pointerIsNull(data)) {
+        address = data.add(this.offset);
+      }
+    }
+    this.#staticDataAddresses.set(key, address);
+    return address;
+  }
+
   /**
    * Prepare a value pointer for mono_field_set_value calls.
    * Reference types need an extra level of indirection (object pointer stored in memory).
@@ -633,7 +822,7 @@ export class MonoField<T = unknown> extends MonoHandle {
     if (!needsIndirection) {
       return value;
     }
-    const storage = Memory.alloc(Process.pointerSize);
+    const storage = scratchAlloc(Process.pointerSize);
     storage.writePointer(value);
     return storage;
   }
@@ -677,9 +866,10 @@ export class MonoField<T = unknown> extends MonoHandle {
    * Unified type coercion for field reads - consistent with Mono.memory.readTyped.
    * @param raw Raw field value with storage and type info
    * @param type MonoType of the field
+   * @param options Read options (decodeStructs decodes inline structs)
    * @returns Coerced JavaScript value
    */
-  private coerceValue(raw: RawFieldValue, type: MonoType): unknown {
+  private coerceValue(raw: RawFieldValue, type: MonoType, options: FieldReadOptions = {}): unknown {
     const { storage, valuePointer } = raw;
     const kind = type.kind;
 
@@ -724,7 +914,10 @@ export class MonoField<T = unknown> extends MonoHandle {
     // Handle generic instance
     if (kind === MonoTypeKind.GenericInstance) {
       if (type.valueType) {
-        // Value type - return pointer to inline data
+        // Value type - decode or return pointer to inline data
+        if (options.decodeStructs && type.class) {
+          return readStruct(getStructCodec(type.class), storage);
+        }
         return storage;
       } else {
         if (pointerIsNull(valuePointer)) return null;
@@ -738,8 +931,11 @@ export class MonoField<T = unknown> extends MonoHandle {
       return primitiveResult;
     }
 
-    // Handle value types - return pointer to inline data
+    // Handle value types - decode or return pointer to inline data
     if (type.valueType) {
+      if (options.decodeStructs && type.class) {
+        return readStruct(getStructCodec(type.class), storage);
+      }
       return storage;
     }
 
@@ -868,6 +1064,20 @@ export class MonoField<T = unknown> extends MonoHandle {
 
 // ===== INTERFACES =====
 
+/**
+ * Direct accessor for an instance field, created by `MonoField.compileAccessor()`.
+ */
+export interface FieldAccessor<T = unknown> {
+  /** Field the accessor was compiled for */
+  readonly field: MonoField<T>;
+  /** Byte offset applied to the instance pointer */
+  readonly offset: number;
+  /** Read the field value of an instance */
+  get(instance: MonoObject | NativePointer): T;
+  /** Write the field value of an instance */
+  set(instance: MonoObject | NativePointer, value: T): void;
+}
+
 export interface FieldInfo {
   name: string;
   fullName: string;
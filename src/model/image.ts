@@ -1,11 +1,28 @@
 import type { MonoApi } from "../runtime/api";
+import { MonoEnums } from "../runtime/enums";
+import {
+  createMetadataSnapshot,
+  isMetadataSnapshot,
+  MetadataSnapshot,
+  MetadataSnapshotKey,
+  metadataSnapshotKey,
+  restoreMetadataSnapshot,
+  snapshotKeysMatch,
+} from "../runtime/metadata-snapshot";
+import { MetadataReader, MetadataTypeDef } from "../runtime/metadata-tables";
 import { lazy } from "../utils/cache";
 import { MonoErrorCodes, raise } from "../utils/errors";
 import { pointerIsNull } from "../utils/memory";
 import { readUtf8String } from "../utils/string";
+import { CustomAttributeIndex } from "./attribute";
 import { MonoClass } from "./class";
 import { MonoDomain } from "./domain";
+import type { MonoField } from "./field";
 import { MonoHandle } from "./handle";
+import { MonoMethod } from "./method";
+import type { MonoProperty } from "./property";
+
+const MonoMetaTable = MonoEnums.MonoMetaTableEnum;
 
 /**
  * Summary information for a MonoImage, providing essential metadata about
@@ -141,6 +158,9 @@ export class MonoImage extends MonoHandle {
   /**
    * Get all unique namespaces in this image.
    *
+   * @remarks
+   * Read from the TypeDef table, so no classes are loaded.
+   *
    * @example
    * ```typescript
    * image.namespaces.forEach(ns => console.log(ns || "(global)"));
@@ -149,13 +169,190 @@ export class MonoImage extends MonoHandle {
   @lazy
   get namespaces(): string[] {
     const namespaces = new Set<string>();
-    this.enumerateClasses(klass => {
-      const ns = klass.namespace;
-      namespaces.add(ns);
-    });
+    if (this.metadata.available) {
+      for (const typeDef of this.typeDefinitions) {
+        namespaces.add(typeDef.namespace);
+      }
+    } else {
+      this.enumerateClasses(klass => {
+        namespaces.add(klass.namespace);
+      });
+    }
     return Array.from(namespaces).sort();
   }
 
+  // ===== RAW METADATA =====
+
+  /**
+   * Direct reader for this image's metadata tables and #Strings heap.
+   *
+   * @example
+   * ```typescript
+   * const methods = image.metadata.methodDefs.filter(m => m.name === "Update");
+   * ```
+   */
+  @lazy
+  get metadata(): MetadataReader {
+    return new MetadataReader(this.api, this.pointer);
+  }
+
+  /**
+   * All TypeDef rows of this image (name, namespace, flags, token, member ranges).
+   *
+   * @remarks
+   * Decoded straight from metadata without loading any class. Resolve the rows
+   * you actually need with `classFromTypeDef()`.
+   *
+   * @example
+   * ```typescript
+   * const managers = image.typeDefinitions.filter(t => t.name.endsWith("Manager"));
+   * const classes = managers.map(t => image.classFromTypeDef(t));
+   * ```
+   */
+  @lazy
+  get typeDefinitions(): MetadataTypeDef[] {
+    return this.metadata.typeDefs;
+  }
+
+  /**
+   * Find TypeDef rows matching a predicate without loading any class.
+   *
+   * @param predicate Function to test each TypeDef row
+   * @returns Matching rows
+   */
+  findTypeDefinitions(predicate: (typeDef: MetadataTypeDef) => boolean): MetadataTypeDef[] {
+    return this.typeDefinitions.filter(predicate);
+  }
+
+  /**
+   * Load the class for a TypeDef row.
+   *
+   * @param typeDef Row from `typeDefinitions`
+   * @returns MonoClass, or null if Mono cannot load it
+   */
+  classFromTypeDef(typeDef: MetadataTypeDef): MonoClass | null {
+    return this.getTypeByToken(typeDef.token);
+  }
+
+  // ===== METADATA SNAPSHOTS =====
+
+  /**
+   * Key identifying this image's metadata contents (module MVID and table size).
+   */
+  @lazy
+  get snapshotKey(): MetadataSnapshotKey {
+    return metadataSnapshotKey(this.metadata, this.name);
+  }
+
+  /**
+   * Serialize this image's TypeDef/MethodDef/Field/Property rows into a
+   * JSON-serializable snapshot that the host can persist between sessions.
+   *
+   * @example
+   * ```typescript
+   * send({ type: "mono-metadata-snapshot", snapshot: image.exportMetadataSnapshot() });
+   * ```
+   */
+  exportMetadataSnapshot(): MetadataSnapshot {
+    return createMetadataSnapshot(this.metadata, this.snapshotKey);
+  }
+
+  /**
+   * Restore this image's metadata rows from a snapshot taken in an earlier session.
+   *
+   * @remarks
+   * The snapshot is only used if its key matches this image, so stale snapshots
+   * from a rebuilt assembly are ignored. Import before the image's classes or
+   * namespaces are first queried: once the TypeDef rows were decoded the
+   * snapshot is rejected.
+   *
+   * The rows back `typeDefinitions`, `namespaces` and the metadata-driven
+   * lookups; `classes`, `MonoClass.methods` and `MonoClass.fields` still load
+   * from the runtime.
+   *
+   * @param snapshot Snapshot from `exportMetadataSnapshot()`
+   * @returns True if the snapshot was accepted and will be used
+   */
+  importMetadataSnapshot(snapshot: unknown): boolean {
+    if (!isMetadataSnapshot(snapshot) || !snapshotKeysMatch(snapshot.key, this.snapshotKey)) {
+      return false;
+    }
+    return this.metadata.seed(restoreMetadataSnapshot(snapshot));
+  }
+
+  // ===== CUSTOM ATTRIBUTES =====
+
+  /**
+   * Index of this image's CustomAttribute table, keyed by attribute type and owner.
+   *
+   * @example
+   * ```typescript
+   * const rpcs = image.customAttributeIndex.find("RPC");
+   * console.log(rpcs.map(a => image.customAttributeIndex.ownerName(a.owner)));
+   * ```
+   */
+  @lazy
+  get customAttributeIndex(): CustomAttributeIndex {
+    return new CustomAttributeIndex(this.api, this.pointer, this.metadata);
+  }
+
+  /**
+   * Find all classes, methods, fields and properties carrying an attribute.
+   *
+   * @param attributeType Full or short attribute type name (`Attribute` suffix optional)
+   * @returns Resolved owners; only the owners found are loaded
+   *
+   * @example
+   * ```typescript
+   * const serialized = image.findMembersWithAttribute("UnityEngine.SerializeField");
+   * ```
+   */
+  findMembersWithAttribute(attributeType: string): Array<MonoClass | MonoMethod | MonoField | MonoProperty> {
+    const result: Array<MonoClass | MonoMethod | MonoField | MonoProperty> = [];
+    for (const owner of this.customAttributeIndex.ownersOf(attributeType)) {
+      const member = this.resolveMemberToken(owner);
+      if (member) {
+        result.push(member);
+      }
+    }
+    return result;
+  }
+
+  /**
+   * Resolve a TypeDef, MethodDef, Field or Property token of this image.
+   *
+   * @returns Model object, or null for other tables or unresolvable tokens
+   */
+  resolveMemberToken(token: number): MonoClass | MonoMethod | MonoField | MonoProperty | null {
+    const table = token >>> 24;
+    try {
+      switch (table) {
+        case MonoMetaTable.MONO_TABLE_TYPEDEF:
+          return this.getTypeByToken(token);
+        case MonoMetaTable.MONO_TABLE_METHOD: {
+          const methodPtr = this.native.mono_get_method(this.pointer, token, NULL);
+          return pointerIsNull(methodPtr) ? null : this.api.intern(MonoMethod, methodPtr);
+        }
+        case MonoMetaTable.MONO_TABLE_FIELD:
+        case MonoMetaTable.MONO_TABLE_PROPERTY: {
+          const owner = this.metadata.ownerOf(token);
+          const klass = owner ? this.classFromTypeDef(owner) : null;
+          if (!klass) {
+            return null;
+          }
+          const rid = token & 0x00ffffff;
+          return table === MonoMetaTable.MONO_TABLE_FIELD
+            ? klass.tryField(this.metadata.fieldDefs[rid - 1].name)
+            : klass.tryProperty(this.metadata.propertyDefs[rid - 1].name);
+        }
+        default:
+          return null;
+      }
+    } catch {
+      return null;
+    }
+  }
+
   // ===== CLASS LOOKUP =====
 
   /**
@@ -212,7 +409,7 @@ export class MonoImage extends MonoHandle {
     const nsPtr = this.api.allocUtf8StringCachedOrNullIfEmpty(namespace);
     const namePtr = this.api.allocUtf8StringCached(trimmedName);
     const klassPtr = this.native.mono_class_from_name(this.pointer, nsPtr, namePtr);
-    return pointerIsNull(klassPtr) ? null : new MonoClass(this.api, klassPtr);
+    return pointerIsNull(klassPtr) ? null : this.api.intern(MonoClass, klassPtr);
   }
 
   /**
@@ -358,6 +555,18 @@ export class MonoImage extends MonoHandle {
   getClassesByNamespace(namespace: string): MonoClass[] {
     const classes: MonoClass[] = [];
 
+    if (this.metadata.available) {
+      for (const typeDef of this.typeDefinitions) {
+        if (typeDef.namespace === namespace) {
+          const klass = this.classFromTypeDef(typeDef);
+          if (klass) {
+            classes.push(klass);
+          }
+        }
+      }
+      return classes;
+    }
+
     this.enumerateClasses(klass => {
       if (klass.namespace === namespace) {
         classes.push(klass);
@@ -417,11 +626,84 @@ export class MonoImage extends MonoHandle {
       const token = MONO_METADATA_TOKEN_TYPEDEF | (index + 1);
       const klassPtr = this.native.mono_class_get(this.pointer, token);
       if (!pointerIsNull(klassPtr)) {
-        visitor(new MonoClass(this.api, klassPtr), index);
+        visitor(this.api.intern(MonoClass, klassPtr), index);
+      }
+    }
+  }
+
+  /**
+   * Lazily iterate over the classes of this image.
+   *
+   * @param filter Optional TypeDef predicate; rows it rejects are never loaded
+   *
+   * @remarks
+   * Classes are loaded one at a time as the caller advances, so breaking out
+   * of the loop early avoids loading the rest of the image.
+   *
+   * @example
+   * ```typescript
+   * for (const klass of image.iterClasses(t => t.name.endsWith("Manager"))) {
+   *   console.log(klass.fullName);
+   *   break;
+   * }
+   * ```
+   */
+  *iterClasses(filter?: (typeDef: MetadataTypeDef) => boolean): Generator<MonoClass, void, undefined> {
+    for (const klass of this.scanClasses(filter)) {
+      if (klass) {
+        yield klass;
+      }
+    }
+  }
+
+  /**
+   * Step through the TypeDef rows of this image, one row per step.
+   *
+   * Yields the loaded class for rows accepted by `filter`, and `null` for rows
+   * that were skipped or failed to load. Used by time-sliced scans that need
+   * to account for every row, not only the matches.
+   *
+   * @param filter Optional TypeDef predicate; rows it rejects are never loaded
+   */
+  *scanClasses(filter?: (typeDef: MetadataTypeDef) => boolean): Generator<MonoClass | null, void, undefined> {
+    if (this.metadata.available) {
+      for (const typeDef of this.typeDefinitions) {
+        yield filter && !filter(typeDef) ? null : this.classFromTypeDef(typeDef);
       }
+      return;
+    }
+
+    const count = this.classCount;
+    for (let index = 0; index < count; index += 1) {
+      const klassPtr = this.native.mono_class_get(this.pointer, MONO_METADATA_TOKEN_TYPEDEF | (index + 1));
+      if (pointerIsNull(klassPtr)) {
+        yield null;
+        continue;
+      }
+      const klass = this.api.intern(MonoClass, klassPtr);
+      yield filter && !filter(MonoImage.typeDefOf(klass)) ? null : klass;
     }
   }
 
+  /**
+   * TypeDef-shaped view of a loaded class, for filters when raw metadata is unavailable.
+   */
+  private static typeDefOf(klass: MonoClass): MetadataTypeDef {
+    const token = klass.typeToken;
+    return {
+      token,
+      rid: token & 0x00ffffff,
+      flags: klass.flags,
+      name: klass.name,
+      namespace: klass.namespace,
+      fullName: klass.fullName,
+      extends: 0,
+      fields: { start: 0, end: 0 },
+      methods: { start: 0, end: 0 },
+      enclosingToken: 0,
+    };
+  }
+
   // ===== UTILITY METHODS =====
 
   /**
@@ -447,7 +729,7 @@ export class MonoImage extends MonoHandle {
       if (pointerIsNull(klassPtr)) {
         return null;
       }
-      return new MonoClass(this.api, klassPtr);
+      return this.api.intern(MonoClass, klassPtr);
     } catch {
       return null;
     }
@@ -582,7 +864,19 @@ export class MonoImage extends MonoHandle {
    */
   searchClasses(pattern: string): MonoClass[] {
     const lowerPattern = pattern.toLowerCase();
-    return this.findClasses(klass => klass.name.toLowerCase().includes(lowerPattern));
+    if (!this.metadata.available) {
+      return this.findClasses(klass => klass.name.toLowerCase().includes(lowerPattern));
+    }
+    const result: MonoClass[] = [];
+    for (const typeDef of this.typeDefinitions) {
+      if (typeDef.name.toLowerCase().includes(lowerPattern)) {
+        const klass = this.classFromTypeDef(typeDef);
+        if (klass) {
+          result.push(klass);
+        }
+      }
+    }
+    return result;
   }
 
   // ===== ITERATION SUPPORT =====
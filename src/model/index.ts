@@ -29,7 +29,7 @@ export * from "./reference";
 export { ArrayTypeGuards, MonoArray, MonoArraySummary } from "./array";
 
 // Assembly
-export { MonoAssembly as Assembly, MonoAssembly } from "./assembly";
+export { MonoAssembly as Assembly, AssemblyReferenceGraph, MonoAssembly } from "./assembly";
 
 // Class
 export { MonoClass as Class, MonoClass, MonoClassSummary } from "./class";
@@ -38,11 +38,12 @@ export { MonoClass as Class, MonoClass, MonoClassSummary } from "./class";
 export { MonoDelegate as Delegate, DelegateInvokeOptions, MonoDelegate, MonoDelegateSummary } from "./delegate";
 
 // Domain
-export { MonoDomain as Domain, MonoDomain, MonoDomainSummary } from "./domain";
+export { MonoDomain as Domain, FindAsyncOptions, FindOptions, MonoDomain, MonoDomainSummary } from "./domain";
 
 // Field
 export {
   MonoField as Field,
+  FieldAccessor,
   FieldAccessOptions,
   FieldAccessibility,
   FieldReadOptions,
@@ -53,8 +54,27 @@ export {
 // Image
 export { MonoImage as Image, MonoImage, MonoImageSummary } from "./image";
 
+// Layout
+export {
+  ClassLayout,
+  createDecoder,
+  LayoutDecoder,
+  LayoutField,
+  readViewPointer,
+  writeViewPointer,
+} from "./layout";
+
 // Method
-export { InvokeOptions, MonoMethod as Method, MethodAccessibility, MonoMethod, MonoMethodSummary } from "./method";
+export {
+  CompiledInvoker,
+  InvokeOptions,
+  MonoMethod as Method,
+  MethodAccessibility,
+  MethodNativeSignature,
+  MonoMethod,
+  MonoMethodSummary,
+  NativeMethodFunction,
+} from "./method";
 
 // Method Signature
 export {
@@ -75,6 +95,20 @@ export { MonoProperty, MonoPropertySummary, MonoProperty as Property } from "./p
 // String
 export { MonoString, MonoStringSummary } from "./string";
 
+// Struct Codec
+export {
+  clearStructCodecs,
+  createEncoder,
+  getStructCodec,
+  LayoutEncoder,
+  LayoutStructCodec,
+  readStruct,
+  readStructs,
+  registerStructCodec,
+  StructCodec,
+  writeStruct,
+} from "./struct-codec";
+
 // Type System
 export {
   MonoType,
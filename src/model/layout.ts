@@ -0,0 +1,243 @@
+/**
+ * Class layout plans.
+ *
+ * A layout plan lists the instance fields of a class (including inherited ones)
+ * with their offsets and a decoder per field, so a whole instance can be read
+ * with one `readByteArray` and decoded from a `DataView` without any per-field
+ * native calls.
+ *
+ * @module model/layout
+ */
+
+import type { MonoApi } from "../runtime/api";
+import { pointerIsNull } from "../utils/memory";
+import type { MonoClass } from "./class";
+import type { MonoField } from "./field";
+import { MonoObject } from "./object";
+import { getStructCodec } from "./struct-codec";
+import { getPrimitiveSize, isArrayKind, isPointerLikeKind, MonoType, MonoTypeKind } from "./type";
+
+/** Size of the MonoObject header (vtable + synchronisation pointers). */
+const OBJECT_HEADER_SIZE = 2 * Process.pointerSize;
+
+/**
+ * Decode one value from a view.
+ *
+ * @param view Bytes of the instance region
+ * @param offset Byte offset of the value inside `view`
+ */
+export type LayoutDecoder = (view: DataView, offset: number) => unknown;
+
+/** One instance field of a layout plan. */
+export interface LayoutField {
+  name: string;
+  field: MonoField;
+  /** Offset from the instance pointer (unboxed data for value types) */
+  offset: number;
+  /** Bytes occupied by the field */
+  size: number;
+  /** Type kind, with enums resolved to their underlying kind */
+  kind: MonoTypeKind;
+  decode: LayoutDecoder;
+}
+
+/**
+ * Precomputed instance layout of a class.
+ *
+ * Reference types are addressed from the object pointer; value types from
+ * their unboxed data (as `MonoObject.instancePointer` does).
+ *
+ * @example
+ * ```typescript
+ * const layout = playerClass.layout;
+ * const states = players.map(p => layout.read(p.pointer));
+ * ```
+ */
+export class ClassLayout {
+  /** Instance fields, most derived class first (shadowed base fields included) */
+  readonly fields: readonly LayoutField[];
+  /** First byte covered by the plan, relative to the instance pointer */
+  readonly start: number;
+  /** Number of bytes covered from `start` */
+  readonly size: number;
+  /** Whether any field (directly or in an embedded struct) holds a managed reference */
+  readonly hasReferences: boolean;
+
+  constructor(readonly klass: MonoClass) {
+    const api = klass.api;
+    const headerAdjust = klass.isValueType ? OBJECT_HEADER_SIZE : 0;
+    const fields: LayoutField[] = [];
+    let start = Number.MAX_SAFE_INTEGER;
+    let end = 0;
+    let hasReferences = false;
+
+    for (let current: MonoClass | null = klass; current; current = current.parent) {
+      for (const field of current.fields) {
+        if (field.isStatic) {
+          continue;
+        }
+        const type = field.type;
+        const kind = resolveKind(type);
+        const offset = field.offset - headerAdjust;
+        const size = valueSizeOf(type, kind);
+        fields.push({ name: field.name, field, offset, size, kind, decode: createDecoder(api, type, kind) });
+        hasReferences ||= holdsReference(type, kind);
+        start = Math.min(start, offset);
+        end = Math.max(end, offset + size);
+      }
+    }
+
+    this.fields = fields;
+    this.start = fields.length > 0 ? start : 0;
+    this.size = fields.length > 0 ? end - start : 0;
+    this.hasReferences = hasReferences;
+  }
+
+  /**
+   * Read and decode all instance fields with a single memory read.
+   *
+   * @param instance Object pointer (or unboxed data pointer for value types)
+   * @returns Field name -> decoded value
+   */
+  read(instance: NativePointer): Record<string, unknown> {
+    if (this.size === 0) {
+      return {};
+    }
+    const bytes = instance.add(this.start).readByteArray(this.size);
+    if (bytes === null) {
+      return {};
+    }
+    return this.decode(new DataView(bytes), -this.start);
+  }
+
+  /**
+   * Decode all instance fields from a view.
+   *
+   * @param view Bytes containing the instance
+   * @param base Position in `view` that corresponds to the instance pointer
+   */
+  decode(view: DataView, base: number): Record<string, unknown> {
+    const result: Record<string, unknown> = {};
+    for (const entry of this.fields) {
+      if (Object.prototype.hasOwnProperty.call(result, entry.name)) {
+        continue;
+      }
+      result[entry.name] = entry.decode(view, base + entry.offset);
+    }
+    return result;
+  }
+}
+
+// ============================================================================
+// DECODERS
+// ============================================================================
+
+/** Kind used to store a value of `type`, with enums resolved to their underlying kind. */
+export function resolveKind(type: MonoType): MonoTypeKind {
+  if (type.kind === MonoTypeKind.Enum) {
+    return type.underlyingType?.kind ?? MonoTypeKind.I4;
+  }
+  return type.kind;
+}
+
+/** Whether a value of `type` is a struct stored inline (not a primitive, enum or reference). */
+export function isInlineStruct(type: MonoType, kind: MonoTypeKind): boolean {
+  return (
+    type.valueType &&
+    (kind === MonoTypeKind.ValueType || kind === MonoTypeKind.GenericInstance || kind === MonoTypeKind.TypedByRef)
+  );
+}
+
+function holdsReference(type: MonoType, kind: MonoTypeKind): boolean {
+  if (isInlineStruct(type, kind)) {
+    return type.class?.layout.hasReferences ?? true;
+  }
+  return !type.valueType && !isPointerLikeKind(kind);
+}
+
+function valueSizeOf(type: MonoType, kind: MonoTypeKind): number {
+  if (isInlineStruct(type, kind)) {
+    return type.valueSize.size;
+  }
+  return getPrimitiveSize(kind) || Process.pointerSize;
+}
+
+/** Read a pointer-sized value from a view. */
+export function readViewPointer(view: DataView, offset: number): NativePointer {
+  if (Process.pointerSize === 8) {
+    return ptr("0x" + view.getBigUint64(offset, true).toString(16));
+  }
+  return ptr(view.getUint32(offset, true));
+}
+
+/** Write a pointer-sized value into a view. */
+export function writeViewPointer(view: DataView, offset: number, value: NativePointer): void {
+  if (Process.pointerSize === 8) {
+    view.setBigUint64(offset, BigInt(value.toString()), true);
+  } else {
+    view.setUint32(offset, value.toUInt32(), true);
+  }
+}
+
+/**
+ * Create a decoder for a value of the given type stored inline.
+ *
+ * Primitives decode like `MonoField.getTypedValue()`; references become
+ * `MonoObject`s (strings are read as JS strings); nested structs decode to
+ * plain objects through their struct codec.
+ */
+export function createDecoder(api: MonoApi, type: MonoType, kind: MonoTypeKind = resolveKind(type)): LayoutDecoder {
+  switch (kind) {
+    case MonoTypeKind.Boolean:
+      return (view, offset) => view.getUint8(offset) !== 0;
+    case MonoTypeKind.Char:
+      return (view, offset) => String.fromCharCode(view.getUint16(offset, true));
+    case MonoTypeKind.I1:
+      return (view, offset) => view.getInt8(offset);
+    case MonoTypeKind.U1:
+      return (view, offset) => view.getUint8(offset);
+    case MonoTypeKind.I2:
+      return (view, offset) => view.getInt16(offset, true);
+    case MonoTypeKind.U2:
+      return (view, offset) => view.getUint16(offset, true);
+    case MonoTypeKind.I4:
+      return (view, offset) => view.getInt32(offset, true);
+    case MonoTypeKind.U4:
+      return (view, offset) => view.getUint32(offset, true);
+    case MonoTypeKind.I8:
+      return (view, offset) => Number(view.getBigInt64(offset, true));
+    case MonoTypeKind.U8:
+      return (view, offset) => Number(view.getBigUint64(offset, true));
+    case MonoTypeKind.R4:
+      return (view, offset) => view.getFloat32(offset, true);
+    case MonoTypeKind.R8:
+      return (view, offset) => view.getFloat64(offset, true);
+    case MonoTypeKind.String:
+      return (view, offset) => {
+        const str = readViewPointer(view, offset);
+        return pointerIsNull(str) ? null : api.readMonoString(str, true);
+      };
+  }
+
+  if (isPointerLikeKind(kind)) {
+    return readViewPointer;
+  }
+
+  if (isInlineStruct(type, kind)) {
+    const structClass = type.class;
+    if (structClass) {
+      return (view, offset) => getStructCodec(structClass).decode(view, offset);
+    }
+  }
+
+  if (isArrayKind(kind) || !type.valueType) {
+    return (view, offset) => {
+      const obj = readViewPointer(view, offset);
+      return pointerIsNull(obj) ? null : new MonoObject(api, obj);
+    };
+  }
+
+  // Unknown value type without class information: expose the raw bytes
+  const size = type.valueSize.size;
+  return (view, offset) => view.buffer.slice(view.byteOffset + offset, view.byteOffset + offset + size);
+}
@@ -46,7 +46,7 @@ export class MonoMethodSignature extends MonoHandle {
   @lazy
   get returnType(): MonoType {
     const typePtr = this.native.mono_signature_get_return_type(this.pointer);
-    return new MonoType(this.api, typePtr);
+    return this.api.intern(MonoType, typePtr);
   }
 
   /** Gets the parameter types. */
@@ -125,7 +125,7 @@ export class MonoMethodSignature extends MonoHandle {
       if (pointerIsNull(typePtr)) {
         break;
       }
-      parameters.push(new MonoType(this.api, typePtr));
+      parameters.push(this.api.intern(MonoType, typePtr));
     }
     return parameters;
   }
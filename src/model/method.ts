@@ -11,15 +11,16 @@ import type { MonoApi } from "../runtime/api";
 import { MethodAttribute, MethodImplAttribute, getMaskedValue, hasFlag, pickFlags } from "../runtime/metadata";
 import { tryGetClassPtrFromMonoType } from "../runtime/type-resolution";
 import {
-  allocPrimitiveValue,
+  allocScratchPrimitiveValue,
   boxPrimitiveValue,
   resolveUnderlyingPrimitive,
   unboxValue,
+  writePrimitiveArgument,
 } from "../runtime/value-conversion";
 import { lazy } from "../utils/cache";
 import { MonoErrorCodes, MonoManagedExceptionError, raise, raiseFrom } from "../utils/errors";
 import { Logger } from "../utils/log";
-import { pointerIsNull, unwrapInstance } from "../utils/memory";
+import { pointerIsNull, scratchAlloc, unwrapInstance, withScratch } from "../utils/memory";
 import { readUtf8String } from "../utils/string";
 import { MonoArray } from "./array";
 import type { CustomAttribute } from "./attribute";
@@ -30,7 +31,17 @@ import { MonoHandle } from "./handle";
 import { MonoImage } from "./image";
 import { MonoMethodSignature, MonoParameterInfo } from "./method-signature";
 import { MonoObject } from "./object";
-import { MonoType, MonoTypeKind, MonoTypeSummary, isPointerLikeKind } from "./type";
+import { getStructCodec, readStruct } from "./struct-codec";
+import {
+  MonoType,
+  MonoTypeKind,
+  MonoTypeSummary,
+  getPrimitiveSize,
+  isPointerLikeKind,
+  isPrimitiveKind,
+  monoTypeKindToNative,
+  readPrimitiveValue,
+} from "./type";
 
 export interface InvokeOptions {
   /** Throw a `MonoManagedExceptionError` when the managed method throws. */
@@ -39,6 +50,8 @@ export interface InvokeOptions {
   autoBoxPrimitives?: boolean;
   /** Return Int64/UInt64 as bigint instead of number (prevents precision loss) */
   returnBigInt?: boolean;
+  /** Decode struct results to plain objects (via their struct codec) instead of boxed objects */
+  decodeStructs?: boolean;
 }
 
 /**
@@ -55,6 +68,32 @@ export interface InvokeResult<T = unknown> {
   type: MonoType;
 }
 
+/**
+ * Specialized invoker returned by `MonoMethod.compileInvoker()`.
+ *
+ * Takes the same instance/arguments as `MonoMethod.call()` and returns the
+ * unboxed result.
+ */
+export type CompiledInvoker<T = unknown> = (instance: MonoObject | NativePointer | null, args?: MethodArgument[]) => T;
+
+/**
+ * Direct native callable returned by `MonoMethod.toNativeFunction()`.
+ *
+ * Instance methods take the object pointer as the first argument.
+ */
+export type NativeMethodFunction<R extends NativeFunctionReturnValue = NativeFunctionReturnValue> = (
+  ...args: NativeFunctionArgumentValue[]
+) => R;
+
+/** Native signature of a method's unmanaged thunk (excluding the exception out-param). */
+export interface MethodNativeSignature {
+  returnType: NativeFunctionReturnType;
+  argTypes: NativeFunctionArgumentType[];
+}
+
+/** Converts one JS argument into the pointer passed in the argv array. */
+type ArgumentMarshaller = (value: MethodArgument | undefined) => NativePointer;
+
 /**
  * Type mapping from Mono types to TypeScript types
  */
@@ -167,20 +206,7 @@ export class MonoMethod extends MonoHandle {
    * @returns MonoMethod if found, null otherwise
    */
   static tryFind(api: MonoApi, image: MonoImage, descriptor: string): MonoMethod | null {
-    const descPtr = api.allocUtf8StringCached(descriptor);
-    const methodDesc = api.native.mono_method_desc_new(descPtr, 1);
-    if (pointerIsNull(methodDesc)) {
-      return null;
-    }
-    try {
-      const methodPtr = api.native.mono_method_desc_search_in_image(methodDesc, image.pointer);
-      if (pointerIsNull(methodPtr)) {
-        return null;
-      }
-      return new MonoMethod(api, methodPtr);
-    } finally {
-      api.native.mono_method_desc_free(methodDesc);
-    }
+    return MethodDescriptorCache.of(api, image).resolve(descriptor) ?? null;
   }
 
   /**
@@ -193,28 +219,44 @@ export class MonoMethod extends MonoHandle {
    * @throws {MonoMethodNotFoundError} if method not found
    */
   static find(api: MonoApi, image: MonoImage, descriptor: string): MonoMethod {
-    const descPtr = api.allocUtf8StringCached(descriptor);
-    const methodDesc = api.native.mono_method_desc_new(descPtr, 1);
-    if (pointerIsNull(methodDesc)) {
+    const method = MethodDescriptorCache.of(api, image).resolve(descriptor);
+    if (method === undefined) {
       raise(
         MonoErrorCodes.INVALID_ARGUMENT,
         `Invalid method descriptor '${descriptor}'`,
         "Use format 'Namespace.Class:MethodName'",
       );
     }
-    try {
-      const methodPtr = api.native.mono_method_desc_search_in_image(methodDesc, image.pointer);
-      if (pointerIsNull(methodPtr)) {
-        raise(
-          MonoErrorCodes.METHOD_NOT_FOUND,
-          `Method '${descriptor}' not found in image '${image.name}'`,
-          "Use tryFind() to avoid throwing",
-        );
-      }
-      return new MonoMethod(api, methodPtr);
-    } finally {
-      api.native.mono_method_desc_free(methodDesc);
+    if (method === null) {
+      raise(
+        MonoErrorCodes.METHOD_NOT_FOUND,
+        `Method '${descriptor}' not found in image '${image.name}'`,
+        "Use tryFind() to avoid throwing",
+      );
     }
+    return method;
+  }
+
+  /**
+   * Resolve many descriptors against one image.
+   *
+   * Descriptors naming a namespaced class share one class lookup per class;
+   * the remaining descriptors are matched in a single pass over the image's
+   * MethodDef rows instead of one full image search each. Results are cached
+   * like `tryFind()`.
+   *
+   * @param api MonoApi instance
+   * @param image Image to search in
+   * @param descriptors Method descriptors (e.g., "Game.Player:TakeDamage(int)")
+   * @returns Methods in input order; null for descriptors that are invalid or not found
+   *
+   * @example
+   * ```typescript
+   * const [update, damage] = MonoMethod.findAll(api, image, ["Game.Player:Update()", "Game.Player:TakeDamage(int)"]);
+   * ```
+   */
+  static findAll(api: MonoApi, image: MonoImage, descriptors: readonly string[]): Array<MonoMethod | null> {
+    return MethodDescriptorCache.of(api, image).resolveAll(descriptors);
   }
 
   // ===== CORE PROPERTIES =====
@@ -251,7 +293,7 @@ export class MonoMethod extends MonoHandle {
   @lazy
   get declaringClass(): MonoClass {
     const klassPtr = this.native.mono_method_get_class(this.pointer);
-    return new MonoClass(this.api, klassPtr);
+    return this.api.intern(MonoClass, klassPtr);
   }
 
   /** Gets the flags of this method. */
@@ -263,9 +305,11 @@ export class MonoMethod extends MonoHandle {
   /** Gets the implementation flags of this method. */
   @lazy
   get implementationFlags(): number {
-    const implPtr = Memory.alloc(4);
-    this.native.mono_method_get_flags(this.pointer, implPtr);
-    return implPtr.readU32();
+    return withScratch(() => {
+      const implPtr = scratchAlloc(4);
+      this.native.mono_method_get_flags(this.pointer, implPtr);
+      return implPtr.readU32();
+    });
   }
 
   /** Gets the metadata token of this method. */
@@ -385,8 +429,8 @@ export class MonoMethod extends MonoHandle {
   @lazy get customAttributes(): CustomAttribute[] {
     return getCustomAttributes(
       createMethodAttributeContext(this.api, this.pointer, this.native),
-      ptr => new MonoClass(this.api, ptr).name,
-      ptr => new MonoClass(this.api, ptr).fullName,
+      ptr => this.api.intern(MonoClass, ptr).name,
+      ptr => this.api.intern(MonoClass, ptr).fullName,
     );
   }
 
@@ -678,7 +722,7 @@ export class MonoMethod extends MonoHandle {
         return null;
       }
 
-      return new MonoMethod(this.api, inflatedMethod);
+      return this.api.intern(MonoMethod, inflatedMethod);
     } catch (e) {
       // Silently fail - this approach may not work on all Mono versions
       return null;
@@ -736,7 +780,7 @@ export class MonoMethod extends MonoHandle {
       // Get the MonoMethod from the resulting MethodInfo
       const handleField = this.getMethodHandleFromMethodInfo(resultMethodInfo);
       if (handleField && !pointerIsNull(handleField)) {
-        return new MonoMethod(this.api, handleField);
+        return this.api.intern(MonoMethod, handleField);
       }
 
       return null;
@@ -766,7 +810,7 @@ export class MonoMethod extends MonoHandle {
         return NULL;
       }
 
-      const typeClassObj = new MonoClass(this.api, typeClass);
+      const typeClassObj = this.api.intern(MonoClass, typeClass);
 
       // Create Type[] array via MonoArray wrapper (write barrier logic lives in one place)
       const monoArray = MonoArray.new(this.api, typeClassObj, typeArguments.length);
@@ -938,23 +982,27 @@ export class MonoMethod extends MonoHandle {
    * @param options Invocation options
    * @returns Raw result pointer from mono_runtime_invoke
    * @throws {MonoManagedExceptionError} if method throws and throwOnManagedException is true
+   *
+   * Argument storage comes from the thread's scratch arena and is released when the call returns.
    */
   invoke(
     instance: MonoObject | NativePointer | null,
     args: MethodArgument[] = [],
     options: InvokeOptions = {},
   ): NativePointer {
-    const autoBox = options.autoBoxPrimitives !== false;
-    const prepared = autoBox ? this.prepareArguments(args) : args.map(arg => this.api.prepareInvocationArgument(arg));
-    try {
-      const result = this.api.runtimeInvoke(this.pointer, unwrapInstance(instance), prepared);
-      return result;
-    } catch (error) {
-      if (error instanceof MonoManagedExceptionError && options.throwOnManagedException === false) {
-        return NULL;
+    return withScratch(() => {
+      const autoBox = options.autoBoxPrimitives !== false;
+      const prepared = autoBox ? this.prepareArguments(args) : args.map(arg => this.api.prepareInvocationArgument(arg));
+      try {
+        const result = this.api.runtimeInvoke(this.pointer, unwrapInstance(instance), prepared);
+        return result;
+      } catch (error) {
+        if (error instanceof MonoManagedExceptionError && options.throwOnManagedException === false) {
+          return NULL;
+        }
+        raiseFrom(error);
       }
-      raiseFrom(error);
-    }
+    });
   }
 
   /**
@@ -1012,8 +1060,205 @@ export class MonoMethod extends MonoHandle {
     };
   }
 
+  /**
+   * Compile a specialized invoker for this method.
+   *
+   * The signature is resolved once: each parameter gets a fixed marshaller
+   * (primitive parameters write into a preallocated scratch slot instead of a
+   * fresh allocation), and the result unboxer is selected from the return type
+   * up front. The returned function behaves like `call()` with `options`
+   * applied to every invocation, so keep it around for hot call sites.
+   *
+   * Scratch slots are reused between calls; this is safe because
+   * mono_runtime_invoke copies argument values on entry. Only invokers with
+   * non-primitive parameters open a scratch-arena scope per call.
+   *
+   * @param options Invocation options fixed for every call
+   * @returns Function that invokes this method and returns the unboxed result
+   *
+   * @example
+   * const getHealth = healthMethod.compileInvoker<number>();
+   * for (const player of players) {
+   *   total += getHealth(player);
+   * }
+   */
+  compileInvoker<T = unknown>(options: InvokeOptions = {}): CompiledInvoker<T> {
+    const api = this.api;
+    const methodPtr = this.pointer;
+    const throwOnManagedException = options.throwOnManagedException !== false;
+    const autoBox = options.autoBoxPrimitives !== false;
+    const passThrough: ArgumentMarshaller = value => api.prepareInvocationArgument(value);
+    const parameterTypes = this.signature.parameterTypes;
+    const marshallers = parameterTypes.map((type, index) =>
+      autoBox ? this.createArgumentMarshaller(type, index) : passThrough,
+    );
+    const unbox = this.createResultUnboxer<T>(options);
+    const count = marshallers.length;
+    const prepared: NativePointer[] = new Array(count);
+
+    const invoke = (instance: MonoObject | NativePointer | null, args: MethodArgument[]): T => {
+      for (let index = 0; index < count; index += 1) {
+        prepared[index] = marshallers[index](args[index]);
+      }
+      let rawResult: NativePointer;
+      try {
+        rawResult = api.runtimeInvoke(methodPtr, unwrapInstance(instance), prepared);
+      } catch (error) {
+        if (error instanceof MonoManagedExceptionError && !throwOnManagedException) {
+          return null as unknown as T;
+        }
+        raiseFrom(error);
+      }
+      return pointerIsNull(rawResult) ? (null as unknown as T) : unbox(rawResult);
+    };
+    if (!autoBox || parameterTypes.every(type => primitiveSlotKind(type) !== null)) {
+      return (instance, args = []) => invoke(instance, args);
+    }
+    // Fallback marshallers take argument storage from the scratch arena; release it per call
+    return (instance, args = []) => withScratch(() => invoke(instance, args));
+  }
+
+  /**
+   * Native signature of this method's unmanaged thunk, derived from the managed signature.
+   *
+   * Primitives map to their Frida types, enums to their underlying type, and
+   * everything else (strings, objects, arrays, byref, IntPtr) to `"pointer"`.
+   * Instance methods get a leading `"pointer"` for `this`.
+   *
+   * @throws {MonoError} if a parameter or the return type is a struct passed by value
+   */
+  @lazy get nativeSignature(): MethodNativeSignature {
+    const argTypes: NativeFunctionArgumentType[] = [];
+    if (this.isInstanceMethod) {
+      argTypes.push("pointer");
+    }
+    this.parameterTypes.forEach((type, index) => {
+      argTypes.push(this.nativeTypeFor(type, `Parameter ${index}`) as NativeFunctionArgumentType);
+    });
+    return {
+      returnType: this.nativeTypeFor(this.returnType, "Return type") as NativeFunctionReturnType,
+      argTypes,
+    };
+  }
+
+  /**
+   * Get a direct native callable for this method via its unmanaged thunk.
+   *
+   * Unlike `invoke()`/`compileInvoker()` this bypasses mono_runtime_invoke:
+   * arguments are plain native values (numbers, booleans, pointers) and the
+   * return value comes back unboxed, so there is no boxing or argv marshalling.
+   * Types are taken from {@link nativeSignature}; strings and objects are
+   * passed and returned as raw pointers. Managed exceptions are raised as
+   * `MonoManagedExceptionError`.
+   *
+   * Requires mono_method_get_unmanaged_thunk (mono-2.0-bdwgc builds).
+   *
+   * @returns Cached native callable
+   * @throws {MonoError} if thunks are unsupported or the signature has by-value struct types
+   *
+   * @example
+   * // static int Math.Max(int, int)
+   * const max = maxMethod.toNativeFunction<number>();
+   * max(3, 7); // 7
+   *
+   * // instance float Player.GetHealth()
+   * const getHealth = healthMethod.toNativeFunction<number>();
+   * getHealth(player.pointer);
+   */
+  toNativeFunction<R extends NativeFunctionReturnValue = NativeFunctionReturnValue>(): NativeMethodFunction<R> {
+    return this.unmanagedThunkFunction as NativeMethodFunction<R>;
+  }
+
   // ===== PRIVATE HELPER METHODS =====
 
+  @lazy private get unmanagedThunkFunction(): NativeMethodFunction {
+    const { returnType, argTypes } = this.nativeSignature;
+    const thunk = this.api.getMethodThunk(this.pointer);
+    return this.api.bindUnmanagedThunk(thunk, returnType, argTypes);
+  }
+
+  /**
+   * Map a managed parameter/return type to the Frida type used by the unmanaged thunk.
+   */
+  private nativeTypeFor(type: MonoType, position: string): string {
+    if (type.byRef) {
+      return "pointer";
+    }
+    const kind = resolveUnderlyingPrimitive(type).kind;
+    if (kind === MonoTypeKind.ValueType || (kind === MonoTypeKind.GenericInstance && type.valueType)) {
+      raise(
+        MonoErrorCodes.NOT_SUPPORTED,
+        `${position} of ${this.fullName} is a struct passed by value (${type.fullName})`,
+        "Use invoke() or compileInvoker() for methods with struct parameters or results",
+      );
+    }
+    return monoTypeKindToNative(kind);
+  }
+
+  /**
+   * Build the argument marshaller for one parameter of a compiled invoker.
+   * Primitive parameters get a dedicated scratch slot; everything else falls
+   * back to `prepareArgumentForType`.
+   */
+  private createArgumentMarshaller(type: MonoType, index: number): ArgumentMarshaller {
+    const fallback: ArgumentMarshaller = value => this.prepareArgumentForType(type, value, index);
+    const kind = primitiveSlotKind(type);
+    if (kind === null) {
+      return fallback;
+    }
+
+    const scratch = Memory.alloc(Math.max(getPrimitiveSize(kind), Process.pointerSize));
+    return value => {
+      if (typeof value === "number" || typeof value === "boolean" || typeof value === "bigint") {
+        writePrimitiveArgument(scratch, kind, value);
+        return scratch;
+      }
+      return fallback(value);
+    };
+  }
+
+  /**
+   * Select the result unboxer for a compiled invoker from the return type.
+   * Mirrors `unboxResult`, minus the per-call type inspection.
+   */
+  private createResultUnboxer<T>(options: InvokeOptions): (rawResult: NativePointer) => T {
+    const api = this.api;
+    const retType = this.returnType;
+    const kind = retType.kind;
+
+    if (kind === MonoTypeKind.Void) {
+      return () => undefined as unknown as T;
+    }
+    if (kind === MonoTypeKind.String) {
+      return rawResult => api.readMonoString(rawResult, false) as unknown as T;
+    }
+    if (!retType.valueType) {
+      return rawResult => new MonoObject(api, rawResult) as unknown as T;
+    }
+
+    const readOptions = { returnBigInt: options.returnBigInt };
+    const primitiveKind = kind === MonoTypeKind.Enum ? (retType.underlyingType?.kind ?? MonoTypeKind.I4) : kind;
+    if (isPrimitiveKind(primitiveKind)) {
+      const unbox = this.native.mono_object_unbox;
+      return rawResult =>
+        pointerIsNull(rawResult)
+          ? (null as unknown as T)
+          : (readPrimitiveValue(unbox(rawResult), primitiveKind, readOptions) as T);
+    }
+    // Nullable<T> results arrive boxed as T (or NULL); unboxValue resolves the runtime class
+    if (options.decodeStructs && retType.class && !retType.isNullable) {
+      const codec = getStructCodec<T>(retType.class);
+      const unbox = this.native.mono_object_unbox;
+      return rawResult => (pointerIsNull(rawResult) ? (null as unknown as T) : readStruct(codec, unbox(rawResult)));
+    }
+    return rawResult =>
+      unboxValue(api, rawResult, retType, {
+        returnBigInt: options.returnBigInt,
+        decodeStructs: options.decodeStructs,
+        structAsObject: true,
+      }) as unknown as T;
+  }
+
   /**
    * Unbox the raw result pointer based on the return type.
    * Handles value types, strings, and reference types automatically.
@@ -1043,6 +1288,7 @@ export class MonoMethod extends MonoHandle {
     if (retType.valueType) {
       return unboxValue(this.api, rawResult, retType, {
         returnBigInt: options.returnBigInt,
+        decodeStructs: options.decodeStructs,
         structAsObject: true,
       }) as unknown as T;
     }
@@ -1094,8 +1340,8 @@ export class MonoMethod extends MonoHandle {
           "Pass a NativePointer instead of a primitive value",
         );
       }
-      // Use shared allocPrimitiveValue which returns raw value pointer, NOT boxed object
-      return allocPrimitiveValue(type, value);
+      // Raw value pointer, NOT boxed object; released when the invocation's scratch scope ends
+      return allocScratchPrimitiveValue(type, value);
     }
     return value as NativePointer;
   }
@@ -1116,7 +1362,7 @@ export class MonoMethod extends MonoHandle {
     if (!klass) {
       const klassPtr = tryGetClassPtrFromMonoType(this.api, effectiveType.pointer);
       if (klassPtr) {
-        klass = new MonoClass(this.api, klassPtr);
+        klass = this.api.intern(MonoClass, klassPtr);
       }
     }
     if (!klass) {
@@ -1434,3 +1680,228 @@ export function createMethodInvocation(
 ): MethodInvocation {
   return MethodInvocation.new(method, instance, args, options);
 }
+
+// ============================================================================
+// DESCRIPTOR CACHE
+// ============================================================================
+
+/** Assembly-load journal position meaning loads are not being tracked. */
+const UNTRACKED = -1;
+
+/**
+ * Per-image cache of `mono_method_desc_*` lookups.
+ *
+ * Found methods are cached permanently. Misses are cached until the next
+ * assembly load, since a load can make a previously unresolvable descriptor
+ * resolvable; when loads cannot be tracked, misses are not cached at all.
+ */
+class MethodDescriptorCache {
+  private static readonly caches = new WeakMap<MonoImage, MethodDescriptorCache>();
+
+  static of(api: MonoApi, image: MonoImage): MethodDescriptorCache {
+    let cache = MethodDescriptorCache.caches.get(image);
+    if (!cache) {
+      cache = new MethodDescriptorCache(api, image);
+      MethodDescriptorCache.caches.set(image, cache);
+    }
+    return cache;
+  }
+
+  private readonly results = new Map<string, MonoMethod | null>();
+  private loadCursor: number;
+
+  private constructor(
+    private readonly api: MonoApi,
+    private readonly image: MonoImage,
+  ) {
+    this.loadCursor = api.trackAssemblyLoads() ? api.assemblyLoads.length : UNTRACKED;
+  }
+
+  /**
+   * Resolve one descriptor.
+   *
+   * @returns Method, null if not found, or undefined if the descriptor is invalid
+   */
+  resolve(descriptor: string): MonoMethod | null | undefined {
+    this.sync();
+    const cached = this.results.get(descriptor);
+    if (cached !== undefined) {
+      return cached;
+    }
+    return this.withDescriptor(descriptor, desc => {
+      const methodPtr = this.api.native.mono_method_desc_search_in_image(desc, this.image.pointer);
+      return this.store(descriptor, methodPtr);
+    });
+  }
+
+  resolveAll(descriptors: readonly string[]): Array<MonoMethod | null> {
+    this.sync();
+    const byClass = new Map<string, string[]>();
+    const byMethodName = new Map<string, string[]>();
+
+    for (const descriptor of new Set(descriptors)) {
+      if (this.results.has(descriptor)) {
+        continue;
+      }
+      const parts = splitDescriptor(descriptor);
+      if (!parts) {
+        this.resolve(descriptor);
+      } else if (parts.className.includes(".")) {
+        appendTo(byClass, parts.className, descriptor);
+      } else {
+        appendTo(byMethodName, parts.methodName, descriptor);
+      }
+    }
+
+    for (const [className, group] of byClass) {
+      const klass = this.image.tryClass(className);
+      for (const descriptor of group) {
+        if (!klass) {
+          // Let Mono decide (nested types, unusual spellings, ...)
+          this.resolve(descriptor);
+          continue;
+        }
+        this.withDescriptor(descriptor, desc => {
+          const methodPtr = this.api.native.mono_method_desc_search_in_class(desc, klass.pointer);
+          return this.store(descriptor, methodPtr);
+        });
+      }
+    }
+
+    if (byMethodName.size > 0 && this.image.metadata.available) {
+      this.scanImage(byMethodName);
+    } else {
+      for (const group of byMethodName.values()) {
+        group.forEach(descriptor => this.resolve(descriptor));
+      }
+    }
+
+    return descriptors.map(descriptor => this.results.get(descriptor) ?? null);
+  }
+
+  /**
+   * Match descriptors without a namespaced class in one pass over the MethodDef table.
+   */
+  private scanImage(byMethodName: Map<string, string[]>): void {
+    const pending = new Map<string, Array<{ descriptor: string; desc: NativePointer }>>();
+    try {
+      for (const [methodName, group] of byMethodName) {
+        const entries: Array<{ descriptor: string; desc: NativePointer }> = [];
+        for (const descriptor of group) {
+          const desc = this.api.native.mono_method_desc_new(this.api.allocUtf8StringCached(descriptor), 1);
+          if (!pointerIsNull(desc)) {
+            entries.push({ descriptor, desc });
+          }
+        }
+        pending.set(methodName, entries);
+      }
+
+      for (const row of this.image.metadata.methodDefs) {
+        const entries = pending.get(row.name);
+        if (!entries || entries.length === 0) {
+          continue;
+        }
+        const methodPtr = this.api.native.mono_get_method(this.image.pointer, row.token, NULL);
+        if (pointerIsNull(methodPtr)) {
+          continue;
+        }
+        for (let i = entries.length - 1; i >= 0; i--) {
+          if ((this.api.native.mono_method_desc_full_match(entries[i].desc, methodPtr) as number) !== 0) {
+            this.store(entries[i].descriptor, methodPtr);
+            this.api.native.mono_method_desc_free(entries[i].desc);
+            entries.splice(i, 1);
+          }
+        }
+      }
+
+      for (const entries of pending.values()) {
+        for (const entry of entries) {
+          this.store(entry.descriptor, NULL);
+        }
+      }
+    } finally {
+      for (const entries of pending.values()) {
+        for (const entry of entries) {
+          this.api.native.mono_method_desc_free(entry.desc);
+        }
+      }
+    }
+  }
+
+  private withDescriptor(
+    descriptor: string,
+    search: (desc: NativePointer) => MonoMethod | null,
+  ): MonoMethod | null | undefined {
+    const desc = this.api.native.mono_method_desc_new(this.api.allocUtf8StringCached(descriptor), 1);
+    if (pointerIsNull(desc)) {
+      return undefined;
+    }
+    try {
+      return search(desc);
+    } finally {
+      this.api.native.mono_method_desc_free(desc);
+    }
+  }
+
+  private store(descriptor: string, methodPtr: NativePointer): MonoMethod | null {
+    const method = pointerIsNull(methodPtr) ? null : this.api.intern(MonoMethod, methodPtr);
+    if (method !== null || this.loadCursor !== UNTRACKED) {
+      this.results.set(descriptor, method);
+    }
+    return method;
+  }
+
+  /** Forget cached misses once new assemblies have been loaded. */
+  private sync(): void {
+    const loaded = this.loadCursor === UNTRACKED ? UNTRACKED : this.api.assemblyLoads.length;
+    if (loaded === this.loadCursor) {
+      return;
+    }
+    this.loadCursor = loaded;
+    for (const [descriptor, method] of this.results) {
+      if (method === null) {
+        this.results.delete(descriptor);
+      }
+    }
+  }
+}
+
+/**
+ * Split a descriptor into its class and method name parts.
+ * Returns null for descriptors the fast paths should leave to Mono.
+ */
+function splitDescriptor(descriptor: string): { className: string; methodName: string } | null {
+  const colon = descriptor.indexOf(":");
+  if (colon <= 0) {
+    return null;
+  }
+  const className = descriptor.slice(0, colon);
+  const rest = descriptor.slice(descriptor[colon + 1] === ":" ? colon + 2 : colon + 1);
+  const paren = rest.indexOf("(");
+  const methodName = (paren >= 0 ? rest.slice(0, paren) : rest).trim();
+  if (methodName === "" || methodName.includes("*") || className.includes("*")) {
+    return null;
+  }
+  return { className, methodName };
+}
+
+function appendTo(map: Map<string, string[]>, key: string, value: string): void {
+  const list = map.get(key);
+  if (list) {
+    list.push(value);
+  } else {
+    map.set(key, [value]);
+  }
+}
+
+/**
+ * Primitive kind a compiled invoker writes into a dedicated argument slot for
+ * this parameter, or null if the parameter goes through `prepareArgumentForType`.
+ */
+function primitiveSlotKind(type: MonoType): MonoTypeKind | null {
+  if (type.byRef || isPointerLikeKind(type.kind)) {
+    return null;
+  }
+  const kind = resolveUnderlyingPrimitive(type).kind;
+  return isPrimitiveKind(kind) ? kind : null;
+}
@@ -43,7 +43,7 @@ export class MonoObject extends MonoHandle {
   @lazy
   get class(): MonoClass {
     const klassPtr = this.native.mono_object_get_class(this.pointer);
-    return new MonoClass(this.api, klassPtr);
+    return this.api.intern(MonoClass, klassPtr);
   }
 
   /**
@@ -283,22 +283,22 @@ export class MonoObject extends MonoHandle {
   /**
    * Get a method from this object's class, throwing if not found.
    * @param name Method name
-   * @param paramCount Parameter count (-1 for any)
+   * @param params Parameter count (-1 for any) or parameter type full names
    * @returns MonoMethod
    * @throws {MonoMethodNotFoundError} if method not found
    */
-  method(name: string, paramCount = -1): MonoMethod {
-    return this.class.method(name, paramCount);
+  method(name: string, params: number | readonly string[] = -1): MonoMethod {
+    return this.class.method(name, params);
   }
 
   /**
    * Try to get a method from this object's class without throwing.
    * @param name Method name
-   * @param paramCount Parameter count (-1 for any)
+   * @param params Parameter count (-1 for any) or parameter type full names
    * @returns Method if found, null otherwise
    */
-  tryMethod(name: string, paramCount = -1): MonoMethod | null {
-    return this.class.tryMethod(name, paramCount);
+  tryMethod(name: string, params: number | readonly string[] = -1): MonoMethod | null {
+    return this.class.tryMethod(name, params);
   }
 
   /**
@@ -323,18 +323,21 @@ export class MonoObject extends MonoHandle {
 
   /**
    * Try to get a method from this object's class hierarchy (searches parent classes too) without throwing.
+   *
+   * Uses the class's flattened member table, so repeated lookups are a single map read.
+   * Interface methods are resolved to this object's implementation.
+   *
    * @param name Method name
    * @param paramCount Parameter count (-1 for any)
    * @returns Method if found, null otherwise
    */
   tryMethodInHierarchy(name: string, paramCount = -1): MonoMethod | null {
-    let current: MonoClass | null = this.class;
-    while (current) {
-      const m = current.tryMethod(name, paramCount);
-      if (m) return m;
-      current = current.parent;
+    const m = this.class.tryMethodInHierarchy(name, paramCount);
+    if (!m || !m.declaringClass.isInterface || this.isNull) {
+      return m;
     }
-    return null;
+    const implPtr = this.native.mono_object_get_virtual_method(this.pointer, m.pointer);
+    return pointerIsNull(implPtr) ? m : this.api.intern(MonoMethod, implPtr);
   }
 
   /**
@@ -361,7 +364,7 @@ export class MonoObject extends MonoHandle {
    * pointer as the 'this' argument.
    */
   invoke(name: string, args: MethodArgument[] = []): NativePointer {
-    const m = this.tryMethod(name, args.length) || this.tryMethodInHierarchy(name, args.length);
+    const m = this.tryMethodInHierarchy(name, args.length);
     if (!m) {
       raise(
         MonoErrorCodes.METHOD_NOT_FOUND,
@@ -393,7 +396,7 @@ export class MonoObject extends MonoHandle {
    * const result = obj.call<boolean>("SetValue", [42, "test"]);
    */
   call<T = unknown>(name: string, args: MethodArgument[] = []): T {
-    const m = this.tryMethod(name, args.length) || this.tryMethodInHierarchy(name, args.length);
+    const m = this.tryMethodInHierarchy(name, args.length);
     if (!m) {
       raise(
         MonoErrorCodes.METHOD_NOT_FOUND,
@@ -412,7 +415,7 @@ export class MonoObject extends MonoHandle {
    * @returns Unboxed return value, or null if method not found
    */
   tryCall<T = unknown>(name: string, args: MethodArgument[] = []): T | null {
-    const m = this.tryMethod(name, args.length) || this.tryMethodInHierarchy(name, args.length);
+    const m = this.tryMethodInHierarchy(name, args.length);
     if (!m) {
       return null;
     }
@@ -560,12 +563,20 @@ export class MonoObject extends MonoHandle {
 
   /**
    * Find a member value in this class or its base classes.
+   *
+   * Class levels are searched most derived first; within a level fields are
+   * preferred over properties, and properties over parameterless methods.
+   * Interface methods are considered only when no class in the chain matches.
    */
   private findMember(name: string): { found: true; value: unknown } | { found: false } {
-    let current: MonoClass | null = this.class;
-    while (current) {
-      const f = current.tryField(name);
-      if (f) {
+    const klass = this.class;
+    // Most derived matches from the flattened tables; each level is then a pointer comparison
+    const f = klass.tryField(name);
+    const p = klass.tryProperty(name);
+    const prop = p && !p.hasParameters && p.canRead ? p : null;
+
+    for (let current: MonoClass | null = klass; current; current = current.parent) {
+      if (f && f.parent.pointer.equals(current.pointer)) {
         const instance = f.isStatic ? null : this.pointer;
         let value = f.readValue(instance, { coerce: true });
         value = this.wrapArrayValue(f.type.kind, value);
@@ -573,30 +584,32 @@ export class MonoObject extends MonoHandle {
         return { found: true, value };
       }
 
-      const prop = current.tryProperty(name);
-      if (prop) {
-        if (!prop.hasParameters && prop.canRead) {
-          const instance = prop.isStatic ? null : this;
-          return { found: true, value: prop.getValue(instance) };
-        }
+      if (prop && prop.parent.pointer.equals(current.pointer)) {
+        const instance = prop.isStatic ? null : this;
+        return { found: true, value: prop.getValue(instance) };
       }
 
       const m = current.tryMethod(name, 0);
       if (m) {
-        const instance = m.isStatic ? null : this.instancePointer;
-        let value = m.call(instance, []);
-        const returnType = m.returnType;
-        value = this.wrapArrayValue(returnType.kind, value);
-        value = this.wrapDelegateValue(returnType.class, value);
-        return { found: true, value };
+        return { found: true, value: this.callParameterless(m) };
       }
+    }
 
-      current = current.parent;
+    const m = this.tryMethodInHierarchy(name, 0);
+    if (m) {
+      return { found: true, value: this.callParameterless(m) };
     }
 
     return { found: false };
   }
 
+  private callParameterless(m: MonoMethod): unknown {
+    const instance = m.isStatic ? null : this.instancePointer;
+    const value = m.call(instance, []);
+    const returnType = m.returnType;
+    return this.wrapDelegateValue(returnType.class, this.wrapArrayValue(returnType.kind, value));
+  }
+
   /**
    * Try to get a field, property, or call a parameterless method by name without throwing.
    * @param name Member name
@@ -736,6 +749,23 @@ export class MonoObject extends MonoHandle {
     return result;
   }
 
+  /**
+   * Read all instance field values with a single memory read.
+   *
+   * Unlike `toObject()`, fields are decoded from one copy of the instance bytes
+   * using the class layout plan: primitives become JS values, strings are read
+   * as JS strings, references become `MonoObject`s and embedded structs become
+   * plain objects.
+   *
+   * @returns Field name -> decoded value
+   */
+  snapshot(): Record<string, unknown> {
+    if (this.isNull) {
+      raise(MonoErrorCodes.INVALID_ARGUMENT, "Cannot snapshot a null object", "Check the object pointer");
+    }
+    return this.class.layout.read(this.instancePointer);
+  }
+
   /**
    * Validate object integrity
    */
@@ -954,17 +984,7 @@ export class MonoObject extends MonoHandle {
    * Get all instance fields from this class and its base classes.
    */
   private getAllInstanceFields(): MonoField[] {
-    const fields: MonoField[] = [];
-    let current: MonoClass | null = this.class;
-    while (current) {
-      for (const field of current.fields) {
-        if (!field.isStatic) {
-          fields.push(field);
-        }
-      }
-      current = current.parent;
-    }
-    return fields;
+    return this.class.layout.fields.map(entry => entry.field);
   }
 
   private wrapArrayValue(kind: MonoTypeKind, value: unknown): unknown {
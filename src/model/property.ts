@@ -128,7 +128,7 @@ export class MonoProperty<TValue = unknown> extends MonoHandle {
   @lazy
   get parent(): MonoClass {
     const parentPtr = this.native.mono_property_get_parent(this.pointer);
-    return new MonoClass(this.api, parentPtr);
+    return this.api.intern(MonoClass, parentPtr);
   }
 
   /**
@@ -145,7 +145,7 @@ export class MonoProperty<TValue = unknown> extends MonoHandle {
   @lazy
   get getter(): MonoMethod | null {
     const methodPtr = this.native.mono_property_get_get_method(this.pointer);
-    return pointerIsNull(methodPtr) ? null : new MonoMethod(this.api, methodPtr);
+    return pointerIsNull(methodPtr) ? null : this.api.intern(MonoMethod, methodPtr);
   }
 
   /**
@@ -154,7 +154,7 @@ export class MonoProperty<TValue = unknown> extends MonoHandle {
   @lazy
   get setter(): MonoMethod | null {
     const methodPtr = this.native.mono_property_get_set_method(this.pointer);
-    return pointerIsNull(methodPtr) ? null : new MonoMethod(this.api, methodPtr);
+    return pointerIsNull(methodPtr) ? null : this.api.intern(MonoMethod, methodPtr);
   }
 
   // ===== TYPE INFORMATION =====
@@ -256,8 +256,8 @@ export class MonoProperty<TValue = unknown> extends MonoHandle {
   get customAttributes(): CustomAttribute[] {
     return getCustomAttributes(
       createPropertyAttributeContext(this.api, this.parent.pointer, this.pointer, this.native),
-      ptr => new MonoClass(this.api, ptr).name,
-      ptr => new MonoClass(this.api, ptr).fullName,
+      ptr => this.api.intern(MonoClass, ptr).name,
+      ptr => this.api.intern(MonoClass, ptr).fullName,
     );
   }
 
@@ -612,7 +612,7 @@ export class MonoProperty<TValue = unknown> extends MonoHandle {
       if (!elementClass) {
         const klassPtr = tryGetClassPtrFromMonoType(this.api, elementType.pointer);
         if (klassPtr) {
-          elementClass = new MonoClass(this.api, klassPtr);
+          elementClass = this.api.intern(MonoClass, klassPtr);
         }
       }
 
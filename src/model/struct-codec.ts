@@ -0,0 +1,335 @@
+/**
+ * Struct codecs.
+ *
+ * Converts value-type structs (`Vector3`, `Quaternion`, `Color`, user structs)
+ * between their inline bytes and plain JS objects. The default codec of a
+ * struct class is derived from its layout plan, so a struct is decoded from a
+ * single byte read and encoded back with a single write; custom codecs can be
+ * registered per class.
+ *
+ * @module model/struct-codec
+ */
+
+import type { MonoApi } from "../runtime/api";
+import { GCHandlePool, type GCHandle } from "../runtime/gchandle";
+import { MonoErrorCodes, raise } from "../utils/errors";
+import type { MonoClass } from "./class";
+import { isInlineStruct, writeViewPointer } from "./layout";
+import { MonoObject } from "./object";
+import { MonoString } from "./string";
+import { isPointerLikeKind, MonoType, MonoTypeKind } from "./type";
+
+/**
+ * Encode one value into a view.
+ *
+ * @param view Bytes of the struct region
+ * @param offset Byte offset of the value inside `view`
+ * @param value JS value to store
+ */
+export type LayoutEncoder = (view: DataView, offset: number, value: unknown) => void;
+
+/**
+ * Converts a struct between inline bytes and a JS value.
+ */
+export interface StructCodec<T = Record<string, unknown>> {
+  /** Size of the unboxed struct in bytes */
+  readonly size: number;
+  /** Whether the struct holds managed references (stores need a GC write barrier) */
+  readonly hasReferences: boolean;
+  /** Decode the struct stored at `offset` */
+  decode(view: DataView, offset: number): T;
+  /** Encode `value` into the struct stored at `offset`; missing members keep their bytes */
+  encode(view: DataView, offset: number, value: T): void;
+}
+
+// ============================================================================
+// REGISTRY
+// ============================================================================
+
+/**
+ * Codecs by class pointer. Keyed by pointer rather than wrapper identity because
+ * class wrappers can be evicted from the handle registry and re-created.
+ */
+const codecs = new Map<string, StructCodec<unknown>>();
+
+/**
+ * Register a custom codec for a struct class.
+ *
+ * The codec replaces the layout-derived one everywhere structs are decoded,
+ * including struct fields embedded in other structs and objects.
+ *
+ * @example
+ * ```typescript
+ * registerStructCodec<[number, number, number]>(vector3Class, {
+ *   size: 12,
+ *   hasReferences: false,
+ *   decode: (view, at) => [0, 4, 8].map(i => view.getFloat32(at + i, true)) as [number, number, number],
+ *   encode: (view, at, xyz) => xyz.forEach((v, i) => view.setFloat32(at + i * 4, v, true)),
+ * });
+ * ```
+ */
+export function registerStructCodec<T>(klass: MonoClass, codec: StructCodec<T>): void {
+  codecs.set(klass.pointer.toString(), codec as StructCodec<unknown>);
+}
+
+/**
+ * Forget all registered and derived codecs (called from `Mono.dispose()`).
+ */
+export function clearStructCodecs(): void {
+  codecs.clear();
+  rootPools = new WeakMap();
+}
+
+/**
+ * Get the codec of a struct class, deriving it from the class layout on first use.
+ *
+ * @throws {MonoError} if the class is not a value type
+ */
+export function getStructCodec<T = Record<string, unknown>>(klass: MonoClass): StructCodec<T> {
+  const key = klass.pointer.toString();
+  let codec = codecs.get(key);
+  if (codec === undefined) {
+    if (!klass.isValueType) {
+      raise(
+        MonoErrorCodes.TYPE_MISMATCH,
+        `Class ${klass.fullName} is not a value type`,
+        "Struct codecs only apply to value types; use MonoObject.snapshot() for objects",
+      );
+    }
+    codec = new LayoutStructCodec(klass);
+    codecs.set(key, codec);
+  }
+  return codec as StructCodec<T>;
+}
+
+// ============================================================================
+// MEMORY ACCESS
+// ============================================================================
+
+/**
+ * Decode the struct stored at `address` with one memory read.
+ */
+export function readStruct<T>(codec: StructCodec<T>, address: NativePointer): T {
+  return codec.decode(new DataView(address.readByteArray(codec.size)!), 0);
+}
+
+/**
+ * Decode `count` consecutive structs with one memory read.
+ *
+ * @param stride Distance between elements (defaults to the struct size)
+ */
+export function readStructs<T>(
+  codec: StructCodec<T>,
+  address: NativePointer,
+  count: number,
+  stride: number = codec.size,
+): T[] {
+  if (count <= 0) {
+    return [];
+  }
+  const view = new DataView(address.readByteArray(stride * (count - 1) + codec.size)!);
+  const result = new Array<T>(count);
+  for (let i = 0; i < count; i++) {
+    result[i] = codec.decode(view, i * stride);
+  }
+  return result;
+}
+
+/**
+ * Encode a value into the struct stored at `address`.
+ *
+ * The current bytes are read once, patched with the members present in
+ * `value`, and written back. Structs holding references are stored through
+ * `mono_gc_wbarrier_value_copy` so the GC sees the new references; JS strings
+ * stored into `string` members are held by GC handles until that copy.
+ *
+ * @param klass Struct class (used for the write barrier)
+ */
+export function writeStruct<T>(klass: MonoClass, address: NativePointer, value: T): void {
+  const codec = getStructCodec<T>(klass);
+  const bytes = address.readByteArray(codec.size)!;
+  if (!codec.hasReferences) {
+    codec.encode(new DataView(bytes), 0, value);
+    address.writeByteArray(bytes);
+    return;
+  }
+
+  // Strings created while encoding are only referenced from `bytes` until the copy below
+  const api = klass.api;
+  const outerRoots = pendingRoots;
+  const roots: PendingRoots = { pool: rootPoolFor(api), handles: [] };
+  pendingRoots = roots;
+  try {
+    codec.encode(new DataView(bytes), 0, value);
+    const staging = Memory.alloc(codec.size);
+    staging.writeByteArray(bytes);
+    api.native.mono_gc_wbarrier_value_copy(address, staging, 1, klass.pointer);
+  } finally {
+    pendingRoots = outerRoots;
+    for (const handle of roots.handles) {
+      roots.pool.release(handle);
+    }
+  }
+}
+
+/** Strong handles for strings created by the `writeStruct()` call in progress. */
+interface PendingRoots {
+  pool: GCHandlePool;
+  handles: GCHandle[];
+}
+
+let pendingRoots: PendingRoots | null = null;
+let rootPools = new WeakMap<MonoApi, GCHandlePool>();
+
+function rootPoolFor(api: MonoApi): GCHandlePool {
+  let pool = rootPools.get(api);
+  if (pool === undefined) {
+    pool = new GCHandlePool(api);
+    rootPools.set(api, pool);
+  }
+  return pool;
+}
+
+/**
+ * Create a managed string for a struct member. Inside `writeStruct()` the string
+ * is held by a GC handle until the struct has been copied into place, so later
+ * allocations cannot collect it while it is referenced only from JS bytes.
+ */
+function newMemberString(api: MonoApi, value: string): NativePointer {
+  const pointer = MonoString.new(api, value).pointer;
+  if (pendingRoots !== null) {
+    pendingRoots.handles.push(pendingRoots.pool.create(pointer));
+  }
+  return pointer;
+}
+
+// ============================================================================
+// LAYOUT CODEC
+// ============================================================================
+
+/**
+ * Default codec: decodes to a plain object keyed by field name using the
+ * class layout plan, and encodes back field by field.
+ */
+export class LayoutStructCodec implements StructCodec<Record<string, unknown>> {
+  readonly size: number;
+  readonly hasReferences: boolean;
+  readonly #encoders: ReadonlyArray<{ name: string; offset: number; encode: LayoutEncoder }>;
+
+  constructor(readonly klass: MonoClass) {
+    const layout = klass.layout;
+    this.size = klass.valueSize.size;
+    this.hasReferences = layout.hasReferences;
+    this.#encoders = layout.fields.map(entry => ({
+      name: entry.name,
+      offset: entry.offset,
+      encode: createEncoder(klass.api, entry.field.type, entry.kind),
+    }));
+  }
+
+  decode(view: DataView, offset: number): Record<string, unknown> {
+    return this.klass.layout.decode(view, offset);
+  }
+
+  encode(view: DataView, offset: number, value: Record<string, unknown>): void {
+    if (typeof value !== "object" || value === null) {
+      raise(
+        MonoErrorCodes.TYPE_MISMATCH,
+        `Cannot encode ${String(value)} as ${this.klass.fullName}`,
+        "Pass a plain object keyed by field name",
+      );
+    }
+    for (const entry of this.#encoders) {
+      const member = value[entry.name];
+      if (member !== undefined) {
+        entry.encode(view, offset + entry.offset, member);
+      }
+    }
+  }
+}
+
+// ============================================================================
+// ENCODERS
+// ============================================================================
+
+function toReference(value: unknown): NativePointer {
+  if (value === null) {
+    return NULL;
+  }
+  if (value instanceof MonoObject) {
+    return value.pointer;
+  }
+  if (value instanceof NativePointer) {
+    return value;
+  }
+  raise(
+    MonoErrorCodes.TYPE_MISMATCH,
+    `Cannot store ${typeof value} in a reference field`,
+    "Pass a MonoObject, NativePointer or null",
+  );
+}
+
+function toBigInt(value: unknown): bigint {
+  return typeof value === "bigint" ? value : BigInt(Math.trunc(Number(value)));
+}
+
+/**
+ * Create an encoder for a value of the given type stored inline.
+ * Accepts the values produced by the matching `createDecoder()` decoder.
+ */
+export function createEncoder(api: MonoApi, type: MonoType, kind: MonoTypeKind): LayoutEncoder {
+  switch (kind) {
+    case MonoTypeKind.Boolean:
+      return (view, offset, value) => view.setUint8(offset, value ? 1 : 0);
+    case MonoTypeKind.Char:
+      return (view, offset, value) =>
+        view.setUint16(offset, typeof value === "string" ? value.charCodeAt(0) : Number(value), true);
+    case MonoTypeKind.I1:
+      return (view, offset, value) => view.setInt8(offset, Number(value));
+    case MonoTypeKind.U1:
+      return (view, offset, value) => view.setUint8(offset, Number(value));
+    case MonoTypeKind.I2:
+      return (view, offset, value) => view.setInt16(offset, Number(value), true);
+    case MonoTypeKind.U2:
+      return (view, offset, value) => view.setUint16(offset, Number(value), true);
+    case MonoTypeKind.I4:
+      return (view, offset, value) => view.setInt32(offset, Number(value), true);
+    case MonoTypeKind.U4:
+      return (view, offset, value) => view.setUint32(offset, Number(value), true);
+    case MonoTypeKind.I8:
+      return (view, offset, value) => view.setBigInt64(offset, toBigInt(value), true);
+    case MonoTypeKind.U8:
+      return (view, offset, value) => view.setBigUint64(offset, toBigInt(value), true);
+    case MonoTypeKind.R4:
+      return (view, offset, value) => view.setFloat32(offset, Number(value), true);
+    case MonoTypeKind.R8:
+      return (view, offset, value) => view.setFloat64(offset, Number(value), true);
+    case MonoTypeKind.String:
+      return (view, offset, value) => {
+        const str = typeof value === "string" ? newMemberString(api, value) : toReference(value);
+        writeViewPointer(view, offset, str);
+      };
+  }
+
+  if (isPointerLikeKind(kind)) {
+    return (view, offset, value) =>
+      writeViewPointer(view, offset, value instanceof NativePointer ? value : ptr(value as number));
+  }
+
+  if (isInlineStruct(type, kind) && type.class) {
+    const structClass = type.class;
+    return (view, offset, value) => getStructCodec(structClass).encode(view, offset, value);
+  }
+
+  if (!type.valueType) {
+    return (view, offset, value) => writeViewPointer(view, offset, toReference(value));
+  }
+
+  return () => {
+    raise(
+      MonoErrorCodes.NOT_SUPPORTED,
+      `Cannot encode values of type ${type.fullName}`,
+      "Write the struct bytes directly through a NativePointer",
+    );
+  };
+}
@@ -24,6 +24,7 @@
 import type { MonoApi } from "../runtime/api";
 import { MonoErrorCodes, raise } from "../utils/errors";
 import { Logger } from "../utils/log";
+import { runInSlices, TimeSliceOptions } from "../utils/time-slice";
 import type { MonoClass } from "./class";
 import { MonoDomain } from "./domain";
 import type { MonoField } from "./field";
@@ -930,6 +931,39 @@ export class Tracer {
     };
   }
 
+  /**
+   * Time-sliced variant of `classesByPattern()`.
+   *
+   * Both the class search and the hook installation run in slices of at most
+   * `budgetMs`, yielding to the event loop in between.
+   *
+   * @returns A detach-all function.
+   */
+  async classesByPatternAsync(
+    pattern: string,
+    callbacks: MethodCallbacks,
+    options: TimeSliceOptions = {},
+  ): Promise<() => void> {
+    this.ensureNotDisposed();
+    const domain = MonoDomain.getRoot(this.api);
+    const classes = await domain.findClassesAsync(pattern, options);
+    const detachers: Array<() => void> = [];
+
+    traceLogger.info(`Tracing ${classes.length} classes matching "${pattern}"`);
+
+    await runInSlices(
+      classes,
+      klass => {
+        detachers.push(this.classAll(klass, callbacks));
+      },
+      { budgetMs: options.budgetMs },
+    );
+
+    return () => {
+      detachers.forEach(d => d());
+    };
+  }
+
   /**
    * Best-effort field access tracing.
    *
@@ -228,6 +228,8 @@ export function isArrayKind(kind: MonoTypeKind): boolean {
 export interface ValueReadOptions {
   /** Return Int64/UInt64 as bigint instead of number */
   returnBigInt?: boolean;
+  /** Decode value-type structs to plain objects (via their struct codec) instead of returning pointers */
+  decodeStructs?: boolean;
 }
 
 /**
@@ -475,7 +477,7 @@ export class MonoType extends MonoHandle {
   @lazy
   get class(): MonoClass | null {
     const klassPtr = this.native.mono_type_get_class(this.pointer);
-    return pointerIsNull(klassPtr) ? null : new MonoClass(this.api, klassPtr);
+    return pointerIsNull(klassPtr) ? null : this.api.intern(MonoClass, klassPtr);
   }
 
   /**
@@ -493,7 +495,7 @@ export class MonoType extends MonoHandle {
   @lazy
   get underlyingType(): MonoType | null {
     const typePtr = this.native.mono_type_get_underlying_type(this.pointer);
-    return pointerIsNull(typePtr) ? null : new MonoType(this.api, typePtr);
+    return pointerIsNull(typePtr) ? null : this.api.intern(MonoType, typePtr);
   }
 
   /**
@@ -540,7 +542,7 @@ export class MonoType extends MonoHandle {
         return null;
     }
 
-    return pointerIsNull(elementPtr) ? null : new MonoType(this.api, elementPtr);
+    return pointerIsNull(elementPtr) ? null : this.api.intern(MonoType, elementPtr);
   }
 
   // ===== TYPE CHARACTERISTICS =====
@@ -881,6 +883,15 @@ export class MonoType extends MonoHandle {
     return this.kind === MonoTypeKind.GenericInstance;
   }
 
+  /**
+   * Check if this is an instantiation of `System.Nullable<T>`.
+   * Boxing a nullable yields a boxed `T` (or NULL), never a boxed `Nullable<T>`.
+   */
+  @lazy
+  get isNullable(): boolean {
+    return this.isGenericInstance && this.fullName.startsWith("System.Nullable");
+  }
+
   /**
    * Check if types are equal (by comparing names).
    *
@@ -36,13 +36,15 @@ import { MonoMethod } from "./model/method";
 import { MonoObject } from "./model/object";
 import { MonoProperty } from "./model/property";
 import { MonoString } from "./model/string";
+import { clearStructCodecs } from "./model/struct-codec";
 import { MonoType } from "./model/type";
-import type { MonoApi } from "./runtime/api";
+import type { MonoApi, MonoNativeBindings } from "./runtime/api";
 import { createMonoApi } from "./runtime/api";
 import { MonoModuleInfo, waitForMonoModule } from "./runtime/module";
 import { ThreadManager } from "./runtime/thread";
 import { MonoRuntimeVersion } from "./runtime/version";
 import { handleMonoError, MonoErrorCodes, raise, raiseFrom } from "./utils/errors";
+import { clearScratchArenas, withScratch } from "./utils/memory";
 
 import { buildGCSubsystem, buildICallSubsystem, buildMemorySubsystem, buildTraceSubsystem } from "./subsystems";
 
@@ -241,10 +243,14 @@ export class MonoNamespace {
     tryFind: (image: MonoImage, descriptor: string): MonoMethod | null => {
       return MonoMethod.tryFind(this.api, image, descriptor);
     },
+    /** Resolve many descriptors in one pass, returning null for misses */
+    findAll: (image: MonoImage, descriptors: readonly string[]): Array<MonoMethod | null> => {
+      return MonoMethod.findAll(this.api, image, descriptors);
+    },
 
     /** Wrap an existing method pointer */
     wrap: (ptr: NativePointer): MonoMethod => {
-      return new MonoMethod(this.api, ptr);
+      return this.api.intern(MonoMethod, ptr);
     },
 
     /** Try to wrap an existing method pointer */
@@ -252,7 +258,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoMethod(this.api, ptr);
+      return this.api.intern(MonoMethod, ptr);
     },
   };
 
@@ -271,7 +277,7 @@ export class MonoNamespace {
 
     /** Wrap an existing image pointer */
     wrap: (ptr: NativePointer): MonoImage => {
-      return new MonoImage(this.api, ptr);
+      return this.api.intern(MonoImage, ptr);
     },
 
     /** Try to wrap an existing image pointer */
@@ -279,7 +285,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoImage(this.api, ptr);
+      return this.api.intern(MonoImage, ptr);
     },
   };
 
@@ -299,7 +305,7 @@ export class MonoNamespace {
 
     /** Wrap an existing assembly pointer */
     wrap: (ptr: NativePointer): MonoAssembly => {
-      return new MonoAssembly(this.api, ptr);
+      return this.api.intern(MonoAssembly, ptr);
     },
 
     /** Try to wrap an existing assembly pointer */
@@ -307,7 +313,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoAssembly(this.api, ptr);
+      return this.api.intern(MonoAssembly, ptr);
     },
   };
 
@@ -322,7 +328,7 @@ export class MonoNamespace {
   readonly class = {
     /** Wrap an existing class pointer */
     wrap: (ptr: NativePointer): MonoClass => {
-      return new MonoClass(this.api, ptr);
+      return this.api.intern(MonoClass, ptr);
     },
 
     /** Try to wrap an existing class pointer */
@@ -330,7 +336,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoClass(this.api, ptr);
+      return this.api.intern(MonoClass, ptr);
     },
   };
 
@@ -340,7 +346,7 @@ export class MonoNamespace {
   readonly field = {
     /** Wrap an existing field pointer */
     wrap: <T = unknown>(ptr: NativePointer): MonoField<T> => {
-      return new MonoField<T>(this.api, ptr);
+      return this.api.intern<MonoField<T>>(MonoField, ptr);
     },
 
     /** Try to wrap an existing field pointer */
@@ -348,7 +354,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoField<T>(this.api, ptr);
+      return this.api.intern<MonoField<T>>(MonoField, ptr);
     },
   };
 
@@ -358,7 +364,7 @@ export class MonoNamespace {
   readonly property = {
     /** Wrap an existing property pointer */
     wrap: <TValue = unknown>(ptr: NativePointer): MonoProperty<TValue> => {
-      return new MonoProperty<TValue>(this.api, ptr);
+      return this.api.intern<MonoProperty<TValue>>(MonoProperty, ptr);
     },
 
     /** Try to wrap an existing property pointer */
@@ -366,7 +372,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoProperty<TValue>(this.api, ptr);
+      return this.api.intern<MonoProperty<TValue>>(MonoProperty, ptr);
     },
   };
 
@@ -382,11 +388,11 @@ export class MonoNamespace {
     /** Get MonoType from a class */
     fromClass: (klass: MonoClass): MonoType => {
       const typePtr = this.api.native.mono_class_get_type(klass.pointer);
-      return new MonoType(this.api, typePtr);
+      return this.api.intern(MonoType, typePtr);
     },
     /** Wrap an existing type pointer */
     wrap: (ptr: NativePointer): MonoType => {
-      return new MonoType(this.api, ptr);
+      return this.api.intern(MonoType, ptr);
     },
 
     /** Try to wrap an existing type pointer */
@@ -394,7 +400,7 @@ export class MonoNamespace {
       if (!ptr || ptr.isNull()) {
         return null;
       }
-      return new MonoType(this.api, ptr);
+      return this.api.intern(MonoType, ptr);
     },
   };
 
@@ -436,6 +442,9 @@ export class MonoNamespace {
 
     /** Capacity of the pinned UTF-8 string cache. */
     pinnedStringCacheCapacity: 512,
+
+    /** Per-kind capacity of the interned metadata wrapper registry. */
+    handleCacheCapacity: 4096,
   };
 
   // ============================================================================
@@ -448,7 +457,9 @@ export class MonoNamespace {
    *
    * Thread attachment is owned by `perform()`, not by `initialize()`.
    *
-   * @param callback Function to execute with Mono runtime ready and thread attached
+   * @param callback Function to execute with Mono runtime ready and thread attached.
+   *   It receives `Mono.api.uncheckedNative`: native bindings that skip the per-call
+   *   thread check, valid only in the synchronous part of the callback
    * @param mode Thread detachment strategy:
    *   - `"bind"` (default): Installs unload cleanup hook; thread stays attached until script unload
    *   - `"free"`: Detaches thread after callback completes (if attached by this call)
@@ -460,9 +471,17 @@ export class MonoNamespace {
    *   const Player = Mono.domain.class("Game.Player");
    *   console.log(Player.methods.map(m => m.name));
    * });
+   *
+   * @example
+   * // Hot loops can call native functions without the thread check
+   * await Mono.perform(native => {
+   *   for (const obj of objects) {
+   *     classes.push(native.mono_object_get_class(obj));
+   *   }
+   * });
    */
   async perform<T>(
-    callback: () => T | Promise<T>,
+    callback: (native: MonoNativeBindings) => T | Promise<T>,
     mode: MonoNamespace.PerformMode = this.config.performMode,
   ): Promise<T> {
     // Step 1: Ensure runtime is ready (module loaded, root domain available)
@@ -499,8 +518,10 @@ export class MonoNamespace {
 
     try {
       // Step 5: Execute callback with thread in active attachment context
+      const native = this._api.uncheckedNative;
       const result = await threadManager.runAsync(async () => {
-        const value = callback();
+        // Scratch temporaries allocated by the synchronous part of the callback are released on return
+        const value = withScratch(() => callback(native));
         return value instanceof Promise ? await value : value;
       });
       return result;
@@ -558,8 +579,12 @@ export class MonoNamespace {
       this._api = createMonoApi(this._module, {
         utf8CacheCapacity: this.config.utf8StringCacheCapacity,
         pinnedStringCacheCapacity: this.config.pinnedStringCacheCapacity,
+        handleCacheCapacity: this.config.handleCacheCapacity,
       });
 
+      // Resolve every known export in one enumerateExports() pass
+      this._api.loadExportTable();
+
       // Initialize thread manager
       this._api.setThreadManager(new ThreadManager(this._api));
 
@@ -847,6 +872,12 @@ export class MonoNamespace {
       this._api.dispose();
     }
 
+    // Drop struct codecs; they hold class wrappers of the disposed API
+    clearStructCodecs();
+
+    // Release the per-thread scratch chunks
+    clearScratchArenas();
+
     // Clear all state
     this._initialized = false;
     this._initializing = null;
@@ -875,6 +906,7 @@ export class MonoNamespace {
    * Clears:
    * - API function and address caches
    * - Delegate thunk cache
+   * - Interned class/method/field/type wrappers
    * - GC handles (releases all)
    * - All subsystem caches (memory, find, trace, gc, icall)
    *
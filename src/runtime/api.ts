@@ -13,9 +13,10 @@
 
 import { LruCache } from "../utils/cache";
 import { MonoErrorCodes, raise } from "../utils/errors";
-import { allocPointerArray, pointerIsNull } from "../utils/memory";
+import { PointerArrayPool, pointerIsNull } from "../utils/memory";
 import { readUtf8String } from "../utils/string";
-import { ALL_MONO_EXPORTS, MonoApiName, MonoExportSignature, getSignature, tryGetSignature } from "./exports";
+import { ALL_MONO_EXPORTS, MonoApiName, MonoExportSignature, getSignature } from "./exports";
+import { HandleConstructor, HandleRegistry } from "./handle-registry";
 import { MonoModuleInfo } from "./module";
 import type { ThreadManager } from "./thread";
 
@@ -86,14 +87,18 @@ export interface MonoExceptionDetails {
 const CACHE_LIMITS = {
   /** Maximum number of cached native functions */
   FUNCTION_CACHE: 256,
-  /** Maximum number of cached export addresses */
-  ADDRESS_CACHE: 512,
   /** Maximum number of cached delegate thunks */
   DELEGATE_THUNK_CACHE: 128,
+  /** Maximum number of cached method thunks */
+  METHOD_THUNK_CACHE: 256,
   /** Maximum number of cached UTF-8 string pointers */
   UTF8_STRING_CACHE: 256,
   /** Maximum number of pinned UTF-8 string pointers */
   PINNED_STRING_CACHE: 512,
+  /** Maximum number of interned metadata wrappers per handle kind */
+  HANDLE_REGISTRY: 4096,
+  /** Maximum number of threads with a retained exception slot */
+  EXCEPTION_SLOTS: 64,
 } as const;
 
 /**
@@ -112,6 +117,14 @@ const DEFAULT_TIMEOUTS = {
 // MAIN API CLASS
 // ============================================================================
 
+/** One entry of the assembly-load journal (see `MonoApi.assemblyLoads`). */
+export interface AssemblyLoadRecord {
+  /** Loaded MonoAssembly* */
+  assembly: NativePointer;
+  /** Current domain of the loading thread (NULL if unknown) */
+  domain: NativePointer;
+}
+
 /**
  * Core API wrapper for Mono runtime functions.
  *
@@ -145,25 +158,49 @@ export class MonoApi {
     NativeFunction<NativeFunctionReturnValue, NativeFunctionArgumentValue[]>
   >(CACHE_LIMITS.FUNCTION_CACHE);
 
-  /** LRU cache for export addresses */
-  private readonly addressCache = new LruCache<MonoApiName, NativePointer>(CACHE_LIMITS.ADDRESS_CACHE);
+  /**
+   * Every export of the Mono module (name -> address), built in a single
+   * `enumerateExports()` pass by `loadExportTable()`. Never evicted.
+   */
+  private exportTable: Map<string, NativePointer> | null = null;
+
+  /**
+   * Resolved address for every known Mono API name (null when neither the
+   * name nor any alias is exported). Derived from `exportTable`.
+   */
+  private resolvedExports: Map<MonoApiName, NativePointer | null> | null = null;
 
   /** LRU cache for delegate thunk information */
   private readonly delegateThunkCache = new LruCache<string, DelegateThunkInfo>(CACHE_LIMITS.DELEGATE_THUNK_CACHE);
 
+  /** LRU cache for unmanaged thunks of ordinary methods */
+  private readonly methodThunkCache = new LruCache<string, NativePointer>(CACHE_LIMITS.METHOD_THUNK_CACHE);
+
   /**
    * LRU cache for UTF-8 string pointers.
    * Reduces memory allocation in hot paths like method/field lookups.
    */
   private readonly utf8StringCache: LruCache<string, NativePointer>;
 
+  /**
+   * Identity map for metadata wrappers (classes, methods, fields, ...).
+   * Ensures one wrapper per native pointer so lazily computed state is shared.
+   */
+  private readonly handleRegistry: HandleRegistry;
+
   // ===== RUNTIME STATE =====
 
   /**
-   * Exception slot for mono_runtime_invoke exception handling.
-   * Allocated once and reused for session lifetime (pointer size: ~8 bytes).
+   * Exception slots for mono_runtime_invoke exception handling, one per thread.
+   * Allocated on first use by each thread and reused while the thread stays
+   * among the most recently invoking ones, so invocations from game threads
+   * and the agent thread never share a slot. An evicted slot remains valid for
+   * the invocation that is still holding it.
    */
-  private exceptionSlot: NativePointer | null = null;
+  private readonly exceptionSlots = new LruCache<number, NativePointer>(CACHE_LIMITS.EXCEPTION_SLOTS);
+
+  /** Reusable argv buffers and scratch out-param slots for managed invocation */
+  private readonly argvPool = new PointerArrayPool();
 
   /** Cached root domain pointer */
   private rootDomain: NativePointer | null = null;
@@ -171,6 +208,19 @@ export class MonoApi {
   /** Cached module handle */
   private moduleHandle: Module | null = null;
 
+  /**
+   * Assemblies reported by the assembly-load hook, in load order. Append-only;
+   * consumers keep their own cursor into it.
+   */
+  private readonly assemblyLoadJournal: AssemblyLoadRecord[] = [];
+
+  /**
+   * Load hook state. An Interceptor listener rather than
+   * `mono_install_assembly_load_hook`, which cannot be removed and would call
+   * into freed code once the script unloads.
+   */
+  private assemblyLoadHook: InvocationListener | null = null;
+
   // ===== RESOURCE TRACKING =====
 
   /** Track allocated resources for proper cleanup */
@@ -216,15 +266,43 @@ export class MonoApi {
    * Lazily bound native function invokers.
    * All calls automatically handle thread attachment via ThreadManager.
    */
-  public readonly native: MonoNativeBindings = this.createNativeBindings();
+  public readonly native: MonoNativeBindings = this.createNativeBindings(true);
+
+  /** Bindings without the thread-manager check; built on first use */
+  private uncheckedBindings: MonoNativeBindings | null = null;
+
+  /**
+   * Native function invokers without any thread-attachment check.
+   *
+   * Same fixed-arity wrappers as `native`, minus the per-call thread-manager
+   * lookup. Only valid on a thread that is already attached to Mono, such as
+   * the synchronous part of a `Mono.perform()` callback (which receives this
+   * table as its argument); calling them from an unattached thread crashes
+   * the runtime.
+   *
+   * @example
+   * ```typescript
+   * await Mono.perform(native => {
+   *   const domain = native.mono_domain_get();
+   * });
+   * ```
+   */
+  get uncheckedNative(): MonoNativeBindings {
+    if (this.uncheckedBindings === null) {
+      this.uncheckedBindings = this.createNativeBindings(false);
+    }
+    return this.uncheckedBindings;
+  }
 
   constructor(
     private readonly module: MonoModuleInfo,
     utf8CacheCapacity: number = CACHE_LIMITS.UTF8_STRING_CACHE,
     pinnedStringCacheCapacity: number = CACHE_LIMITS.PINNED_STRING_CACHE,
+    handleCacheCapacity: number = CACHE_LIMITS.HANDLE_REGISTRY,
   ) {
     this.utf8StringCache = new LruCache<string, NativePointer>(utf8CacheCapacity);
     this.pinnedUtf8Strings = new LruCache<string, NativePointer>(pinnedStringCacheCapacity);
+    this.handleRegistry = new HandleRegistry(handleCacheCapacity);
   }
 
   // ============================================================================
@@ -339,6 +417,11 @@ export class MonoApi {
   /**
    * Try to wait for root domain to become ready without throwing.
    *
+   * One-shot hooks on `mono_jit_init`, `mono_jit_init_version` and
+   * `mono_domain_set` signal readiness the instant the root domain exists;
+   * polling `mono_get_root_domain` remains as a fallback for runtimes where
+   * initialization already passed those points or they cannot be hooked.
+   *
    * @param timeoutMs Maximum time to wait for root domain (ms)
    * @param warnAfterMs Time to wait before logging a warning (ms)
    * @param pollIntervalMs Interval between checks (ms)
@@ -360,25 +443,113 @@ export class MonoApi {
     warnAfterMs: number = DEFAULT_TIMEOUTS.WARN_AFTER,
     pollIntervalMs: number = DEFAULT_TIMEOUTS.POLL_INTERVAL,
   ): Promise<NativePointer | null> {
+    const initial = this.tryGetRootDomain();
+    if (initial) {
+      return initial;
+    }
+
     const deadline = Date.now() + timeoutMs;
     const warnAt = Date.now() + warnAfterMs;
     let didWarn = false;
 
-    while (Date.now() < deadline) {
-      const domain = this.tryGetRootDomain();
-      if (domain && !pointerIsNull(domain)) {
-        return domain;
-      }
+    const state: { domain: NativePointer | null; wake: (() => void) | null } = { domain: null, wake: null };
+    const detachHooks = this.hookRootDomainInit(domain => {
+      state.domain = domain;
+      state.wake?.();
+    });
+
+    try {
+      while (Date.now() < deadline) {
+        const domain = state.domain ?? this.tryGetRootDomain();
+        if (domain && !pointerIsNull(domain)) {
+          return domain;
+        }
+
+        if (!didWarn && Date.now() >= warnAt) {
+          didWarn = true;
+          console.warn("[Mono] Waiting for Mono runtime to become ready (root domain is NULL)...");
+        }
 
-      if (!didWarn && Date.now() >= warnAt) {
-        didWarn = true;
-        console.warn("[Mono] Waiting for Mono runtime to become ready (root domain is NULL)...");
+        // Sleep until the next poll, or until an init hook wakes us up
+        await new Promise<void>(resolve => {
+          const timer = setTimeout(() => {
+            state.wake = null;
+            resolve();
+          }, pollIntervalMs);
+          state.wake = () => {
+            clearTimeout(timer);
+            state.wake = null;
+            resolve();
+          };
+        });
       }
 
-      await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+      return null;
+    } finally {
+      detachHooks();
     }
+  }
 
-    return null;
+  /**
+   * Attach one-shot hooks on the runtime initialization entry points.
+   *
+   * `onReady` fires at most once, with the root domain, as soon as one of the
+   * hooked functions returns and the root domain is non-NULL. Hooks detach
+   * themselves after firing.
+   *
+   * @returns Function detaching any hooks that are still attached
+   */
+  private hookRootDomainInit(onReady: (domain: NativePointer) => void): () => void {
+    const listeners: InvocationListener[] = [];
+    const detach = (): void => {
+      for (const listener of listeners.splice(0)) {
+        listener.detach();
+      }
+    };
+
+    // Raw NativeFunction: the hook may run on a thread that is not attached yet,
+    // and mono_get_root_domain only reads a global.
+    const getRootDomain = this.tryGetNativeFunction("mono_get_root_domain") as unknown as (() => NativePointer) | null;
+    let fired = false;
+    const signal = (returned: NativePointer | null): void => {
+      if (fired) {
+        return;
+      }
+      const domain = returned !== null && !returned.isNull() ? returned : (getRootDomain?.() ?? null);
+      if (domain === null || domain.isNull()) {
+        return;
+      }
+      fired = true;
+      this.rootDomain = domain;
+      onReady(domain);
+      setTimeout(detach, 0);
+    };
+
+    // mono_jit_init* return the root domain; mono_domain_set only implies it exists
+    const hooks: ReadonlyArray<[MonoApiName, boolean]> = [
+      ["mono_jit_init", true],
+      ["mono_jit_init_version", true],
+      ["mono_domain_set", false],
+    ];
+    for (const [name, returnsRootDomain] of hooks) {
+      const address = this.tryResolveAddress(name);
+      if (!address) {
+        continue;
+      }
+      try {
+        listeners.push(
+          Interceptor.attach(address, {
+            onLeave(retval) {
+              signal(returnsRootDomain ? retval : null);
+            },
+          }),
+        );
+      } catch (_error) {
+        // Not hookable on this build; polling still covers readiness
+      }
+    }
+
+    return detach;
   }
 
   /**
@@ -417,6 +588,65 @@ export class MonoApi {
     );
   }
 
+  // ============================================================================
+  // ASSEMBLY LOAD TRACKING
+  // ============================================================================
+
+  /**
+   * Start recording assemblies as Mono loads them.
+   *
+   * Hooks `mono_assembly_invoke_load_hook` once: Mono's loaders call it for
+   * every newly loaded assembly regardless of the load path
+   * (`Assembly.Load(byte[])`, `LoadFrom`, reference resolution, dynamic
+   * assemblies). Runtimes without that export fall back to hooking
+   * `mono_assembly_load_from_full`, which only sees file loads. The hook only
+   * appends the assembly and the loading thread's current domain to
+   * `assemblyLoads`. Frida reverts the hook on script unload; `dispose()`
+   * detaches it.
+   *
+   * @returns true if loads are being tracked
+   */
+  trackAssemblyLoads(): boolean {
+    if (this.assemblyLoadHook !== null) {
+      return true;
+    }
+    this.ensureNotDisposed();
+
+    const dispatcher = this.tryResolveAddress("mono_assembly_invoke_load_hook");
+    const address = dispatcher ?? this.tryResolveAddress("mono_assembly_load_from_full");
+    if (!address) {
+      return false;
+    }
+    // Called on the loading thread; a plain NativeFunction avoids the binding's thread checks
+    const domainGetAddress = this.tryResolveAddress("mono_domain_get");
+    const currentDomain = domainGetAddress ? new NativeFunction(domainGetAddress, "pointer", []) : null;
+    const journal = this.assemblyLoadJournal;
+    const record = (assembly: NativePointer): void => {
+      if (!this.disposed && !assembly.isNull()) {
+        journal.push({ assembly, domain: currentDomain !== null ? currentDomain() : NULL });
+      }
+    };
+    const callbacks: InvocationListenerCallbacks = dispatcher
+      ? { onEnter: args => record(args[0]) }
+      : { onLeave: retval => record(retval) };
+    try {
+      this.assemblyLoadHook = Interceptor.attach(address, callbacks);
+      return true;
+    } catch (_error) {
+      return false;
+    }
+  }
+
+  /**
+   * Assemblies loaded since `trackAssemblyLoads()` was first called, in load
+   * order, across all domains. May contain duplicates (the
+   * `mono_assembly_load_from_full` fallback also sees loads that return an
+   * already loaded assembly).
+   */
+  get assemblyLoads(): readonly AssemblyLoadRecord[] {
+    return this.assemblyLoadJournal;
+  }
+
   // ============================================================================
   // STRING AND INVOCATION UTILITIES
   // ============================================================================
@@ -452,21 +682,36 @@ export class MonoApi {
     const invoke = this.native.mono_runtime_invoke;
     const exceptionSlot = this.getExceptionSlot();
     exceptionSlot.writePointer(NULL);
-    const argv = allocPointerArray(args);
-    const result = invoke(method, instance ?? NULL, argv, exceptionSlot);
+    const argv = this.argvPool.acquire(args);
+    let result: NativePointer;
+    try {
+      result = invoke(method, instance ?? NULL, argv, exceptionSlot);
+    } finally {
+      this.argvPool.release(argv, args.length);
+    }
     const exception = exceptionSlot.readPointer();
     if (!pointerIsNull(exception)) {
-      const details = this.extractExceptionDetails(exception);
-      const message = details.message || `Managed exception thrown: ${details.type || "Unknown"}`;
-      raise(MonoErrorCodes.MANAGED_EXCEPTION, message, "Inspect exception details in `error.details`", {
-        exception,
-        exceptionType: details.type,
-        exceptionMessage: details.message,
-      });
+      this.raiseManagedException(exception);
     }
     return result;
   }
 
+  /**
+   * Raise a MonoManagedExceptionError for a managed exception object.
+   *
+   * @param exception Pointer to managed exception object
+   * @throws {MonoManagedExceptionError} always, with extracted exception details
+   */
+  private raiseManagedException(exception: NativePointer): never {
+    const details = this.extractExceptionDetails(exception);
+    const message = details.message || `Managed exception thrown: ${details.type || "Unknown"}`;
+    raise(MonoErrorCodes.MANAGED_EXCEPTION, message, "Inspect exception details in `error.details`", {
+      exception,
+      exceptionType: details.type,
+      exceptionMessage: details.message,
+    });
+  }
+
   /**
    * Attempts to extract type and message from a managed exception object.
    * Falls back gracefully if extraction fails.
@@ -486,13 +731,16 @@ export class MonoApi {
 
       // Try to extract message using mono_object_to_string if available
       if (this.hasExport("mono_object_to_string")) {
-        const excSlot = Memory.alloc(Process.pointerSize);
-        excSlot.writePointer(NULL);
-        const msgObj = this.native.mono_object_to_string(exception, excSlot);
+        const excSlot = this.argvPool.acquireSlot();
+        try {
+          const msgObj = this.native.mono_object_to_string(exception, excSlot);
 
-        if (!pointerIsNull(msgObj) && pointerIsNull(excSlot.readPointer())) {
-          const message = this.readMonoString(msgObj, true);
-          return { type, message };
+          if (!pointerIsNull(msgObj) && pointerIsNull(excSlot.readPointer())) {
+            const message = this.readMonoString(msgObj, true);
+            return { type, message };
+          }
+        } finally {
+          this.argvPool.release(excSlot, 1);
         }
       }
 
@@ -504,13 +752,16 @@ export class MonoApi {
           0,
         );
         if (!pointerIsNull(toStringMethod)) {
-          const excSlot = Memory.alloc(Process.pointerSize);
-          excSlot.writePointer(NULL);
-          const strPtr = this.native.mono_runtime_invoke(toStringMethod, exception, NULL, excSlot);
+          const excSlot = this.argvPool.acquireSlot();
+          try {
+            const strPtr = this.native.mono_runtime_invoke(toStringMethod, exception, NULL, excSlot);
 
-          if (!pointerIsNull(strPtr) && pointerIsNull(excSlot.readPointer())) {
-            const message = this.readMonoString(strPtr, true);
-            return { type, message };
+            if (!pointerIsNull(strPtr) && pointerIsNull(excSlot.readPointer())) {
+              const message = this.readMonoString(strPtr, true);
+              return { type, message };
+            }
+          } finally {
+            this.argvPool.release(excSlot, 1);
           }
         }
       } catch (_) {
@@ -613,6 +864,57 @@ export class MonoApi {
     return arg as NativePointer;
   }
 
+  // ============================================================================
+  // HANDLE INTERNING
+  // ============================================================================
+
+  /**
+   * Get the canonical wrapper for a metadata pointer.
+   *
+   * Repeated lookups of the same class/method/field/type/property/image/assembly
+   * pointer return the same instance, so `@lazy` getters and member caches are
+   * shared. Do not use this for managed objects, whose addresses are not stable.
+   *
+   * @param kind Wrapper constructor (e.g. MonoClass)
+   * @param pointer Native pointer of the runtime structure
+   * @returns Interned wrapper instance
+   *
+   * @example
+   * ```typescript
+   * const a = api.intern(MonoClass, klassPtr);
+   * const b = api.intern(MonoClass, klassPtr);
+   * // a === b
+   * ```
+   */
+  intern<T extends object>(kind: HandleConstructor<T>, pointer: NativePointer): T {
+    this.ensureNotDisposed();
+    return this.handleRegistry.intern(kind, this, pointer);
+  }
+
+  /**
+   * Drop interned wrappers for a pointer (e.g. after an image is unloaded).
+   *
+   * @param pointer Native pointer to invalidate
+   * @param kind Restrict invalidation to one wrapper kind (default: all kinds)
+   * @returns Number of wrappers removed
+   */
+  invalidateHandle(pointer: NativePointer, kind?: HandleConstructor<object>): number {
+    return this.handleRegistry.invalidate(pointer, kind);
+  }
+
+  /**
+   * Drop all interned wrappers, or only those of one kind.
+   * Subsequent lookups create fresh wrappers with empty lazy caches.
+   */
+  clearHandles(kind?: HandleConstructor<object>): void {
+    this.handleRegistry.clear(kind);
+  }
+
+  /** Number of interned metadata wrappers currently retained. */
+  get internedHandleCount(): number {
+    return this.handleRegistry.size;
+  }
+
   // ============================================================================
   // DELEGATE AND INTERNAL CALL MANAGEMENT
   // ============================================================================
@@ -632,15 +934,7 @@ export class MonoApi {
    */
   getDelegateThunk(delegateClass: NativePointer): DelegateThunkInfo {
     this.ensureNotDisposed();
-
-    // NOTE: mono_method_get_unmanaged_thunk is only available in mono-2.0-bdwgc.dll
-    if (!this.hasExport("mono_method_get_unmanaged_thunk")) {
-      raise(
-        MonoErrorCodes.NOT_SUPPORTED,
-        "mono_method_get_unmanaged_thunk is not available on this Mono runtime (only in mono-2.0-bdwgc.dll)",
-        "Consider using runtime_invoke for delegate invocation instead",
-      );
-    }
+    this.ensureUnmanagedThunkSupport("Consider using runtime_invoke for delegate invocation instead");
 
     const key = delegateClass.toString();
     return this.delegateThunkCache.getOrCreate(key, () => {
@@ -664,6 +958,69 @@ export class MonoApi {
     });
   }
 
+  /**
+   * Get or create the cached unmanaged thunk for an ordinary managed method.
+   *
+   * The thunk's native signature is `ret thunk([this,] args..., MonoException** exc)`.
+   * Prefer `bindUnmanagedThunk()` (or `MonoMethod.toNativeFunction()`), which
+   * supplies the exception out-param and thread attachment.
+   *
+   * @param method Pointer to MonoMethod
+   * @returns Unmanaged thunk pointer
+   * @throws {MonoError} if thunks are unsupported or creation fails
+   */
+  getMethodThunk(method: NativePointer): NativePointer {
+    this.ensureNotDisposed();
+    this.ensureUnmanagedThunkSupport("Use MonoMethod.invoke() or compileInvoker() instead");
+
+    return this.methodThunkCache.getOrCreate(method.toString(), () => {
+      const thunk = this.native.mono_method_get_unmanaged_thunk(method);
+      if (pointerIsNull(thunk)) {
+        raise(
+          MonoErrorCodes.NOT_SUPPORTED,
+          "mono_method_get_unmanaged_thunk returned NULL",
+          "This Mono build may not support unmanaged thunks",
+        );
+      }
+      return thunk;
+    });
+  }
+
+  /**
+   * Wrap an unmanaged thunk in a plain callable.
+   *
+   * The returned function appends the trailing `MonoException**` out-param,
+   * attaches the calling thread when needed and raises a
+   * MonoManagedExceptionError if the managed code threw.
+   *
+   * @param thunk Thunk pointer from `getMethodThunk()`
+   * @param returnType Native return type
+   * @param argTypes Native argument types, excluding the exception out-param
+   * @returns Callable taking native argument values
+   */
+  bindUnmanagedThunk(
+    thunk: NativePointer,
+    returnType: NativeFunctionReturnType,
+    argTypes: NativeFunctionArgumentType[],
+  ): (...args: NativeFunctionArgumentValue[]) => NativeFunctionReturnValue {
+    const nativeFn = new NativeFunction<any, any[]>(thunk, returnType as any, [...argTypes, "pointer"] as any[]);
+    const fn = nativeFn as unknown as (...args: NativeFunctionArgumentValue[]) => NativeFunctionReturnValue;
+    const call = (args: NativeFunctionArgumentValue[]): NativeFunctionReturnValue => {
+      const excSlot = this.argvPool.acquireSlot();
+      try {
+        const result = fn(...args, excSlot);
+        const exception = excSlot.readPointer();
+        if (!pointerIsNull(exception)) {
+          this.raiseManagedException(exception);
+        }
+        return result;
+      } finally {
+        this.argvPool.release(excSlot, 1);
+      }
+    };
+    return (...args) => (this.isBindingReady() ? call(args) : this.threadManager!.run(() => call(args)));
+  }
+
   /**
    * Register an internal call (native function callable from managed code).
    *
@@ -700,17 +1057,19 @@ export class MonoApi {
    *
    * Clears:
    * - Native function cache
-   * - Export address cache
-   * - Delegate thunk cache
+   * - Delegate and method thunk caches
+   * - Interned metadata wrappers
    *
-   * Cached items will be re-created on next access.
+   * Cached items will be re-created on next access. The export table is kept,
+   * since a loaded module's exports never change.
    */
   clearCaches(): void {
     this.ensureNotDisposed();
     this.functionCache.clear();
-    this.addressCache.clear();
     this.delegateThunkCache.clear();
+    this.methodThunkCache.clear();
     this.utf8StringCache.clear();
+    this.handleRegistry.clear();
   }
 
   /**
@@ -728,12 +1087,19 @@ export class MonoApi {
     // is actually exiting, preventing script hangs during normal disposal.
     this.threadManager?.detachAll();
 
+    // Stop recording loads; the journal itself stays readable for existing cursors
+    this.assemblyLoadHook?.detach();
+    this.assemblyLoadHook = null;
+
     // Clear all caches
     this.functionCache.clear();
-    this.addressCache.clear();
+    this.exportTable = null;
+    this.resolvedExports = null;
     this.delegateThunkCache.clear();
+    this.methodThunkCache.clear();
     this.utf8StringCache.clear();
     this.pinnedUtf8Strings.clear();
+    this.handleRegistry.clear();
 
     // Note on Memory.alloc cleanup:
     // Frida's Memory.alloc() pointers are managed by Frida's GC and do not require
@@ -743,7 +1109,8 @@ export class MonoApi {
     this.allocatedResources = [];
 
     // Clear pointers
-    this.exceptionSlot = null;
+    this.exceptionSlots.clear();
+    this.argvPool.clear();
     this.rootDomain = null;
     this.moduleHandle = null;
 
@@ -947,6 +1314,58 @@ export class MonoApi {
   // EXPORT RESOLUTION AND MODULE ACCESS
   // ============================================================================
 
+  /**
+   * Build the export table with a single `enumerateExports()` pass.
+   *
+   * Resolves every known signature (and its aliases) up front so that later
+   * `hasExport()`/`tryResolveAddress()` calls are plain map lookups, including
+   * negative results. Called by `Mono.initialize()`; otherwise built lazily on
+   * the first lookup. Does nothing if the table already exists.
+   *
+   * @returns True if the table is available, false if the module is not loaded yet
+   */
+  loadExportTable(): boolean {
+    if (this.resolvedExports) {
+      return true;
+    }
+    if (this.disposed) {
+      return false;
+    }
+    const moduleHandle = this.tryGetModuleHandle();
+    if (!moduleHandle) {
+      return false;
+    }
+
+    const table = new Map<string, NativePointer>();
+    for (const exp of moduleHandle.enumerateExports()) {
+      table.set(exp.name, exp.address);
+    }
+
+    const resolved = new Map<MonoApiName, NativePointer | null>();
+    for (const name of ALL_MONO_EXPORTS) {
+      const signature = getSignature(name);
+      let address = table.get(signature.name) ?? null;
+      if (address === null && signature.aliases) {
+        for (const alias of signature.aliases) {
+          address = table.get(alias) ?? null;
+          if (address !== null) {
+            break;
+          }
+        }
+      }
+      resolved.set(name, address);
+    }
+
+    this.exportTable = table;
+    this.resolvedExports = resolved;
+    return true;
+  }
+
+  /** Number of exports in the module export table (0 until it is built). */
+  get exportCount(): number {
+    return this.exportTable?.size ?? 0;
+  }
+
   /**
    * Check if a Mono export is available.
    * This method accepts any export name string and never throws.
@@ -955,17 +1374,15 @@ export class MonoApi {
    * @returns True if export exists, false otherwise
    */
   hasExport(name: MonoApiName | string): boolean {
-    // First try to get the signature - if it doesn't exist, we can't resolve
-    const signature = tryGetSignature(name);
-    if (!signature) {
-      // Unknown export name - try direct module lookup
-      const moduleHandle = this.tryGetModuleHandle();
-      if (!moduleHandle) {
-        return false;
-      }
-      return moduleHandle.findExportByName(name) !== null;
+    if (!this.loadExportTable()) {
+      return false;
+    }
+    // Known API names resolve through their aliases; anything else is a raw export name
+    const resolved = this.resolvedExports!.get(name as MonoApiName);
+    if (resolved !== undefined) {
+      return resolved !== null;
     }
-    return this.tryResolveAddress(name as MonoApiName, signature) !== null;
+    return this.exportTable!.has(name);
   }
 
   /**
@@ -1022,25 +1439,22 @@ export class MonoApi {
   tryResolveAddress(name: MonoApiName, signature: MonoExportSignature = getSignature(name)): NativePointer | null {
     this.ensureNotDisposed();
 
-    const cached = this.addressCache.get(name);
-    if (cached) {
-      return cached;
+    if (!this.loadExportTable()) {
+      return null;
     }
 
-    const moduleHandle = this.tryGetModuleHandle();
-    if (!moduleHandle) {
-      return null;
+    const resolved = this.resolvedExports!.get(name);
+    if (resolved !== undefined) {
+      return resolved;
     }
 
-    const exportNames = [signature.name, ...(signature.aliases ?? [])];
-    for (const exportName of exportNames) {
-      const address = moduleHandle.findExportByName(exportName);
+    // Signature outside ALL_SIGNATURES: resolve against the raw export table
+    for (const exportName of [signature.name, ...(signature.aliases ?? [])]) {
+      const address = this.exportTable!.get(exportName);
       if (address) {
-        this.addressCache.set(name, address);
         return address;
       }
     }
-
     return null;
   }
 
@@ -1113,8 +1527,14 @@ export class MonoApi {
   /**
    * Create native bindings with automatic thread management.
    * Uses lazy property getters to initialize functions on first access.
+   *
+   * Each binding is specialized for its signature's arity so hot calls avoid
+   * rest-parameter arrays and per-call `args.map()` allocations.
+   *
+   * @param checked Route calls through the thread manager unless the calling
+   *   thread is already in an attached context
    */
-  private createNativeBindings(): MonoNativeBindings {
+  private createNativeBindings(checked: boolean): MonoNativeBindings {
     const bindings: Partial<MonoNativeBindings> = {};
     const target = bindings as Record<MonoApiName, (...args: MonoArg[]) => any>;
     for (const name of ALL_MONO_EXPORTS) {
@@ -1123,19 +1543,10 @@ export class MonoApi {
         enumerable: true,
         get: () => {
           const nativeFn = this.getNativeFunction(name);
-          const wrapper = (...args: MonoArg[]) => {
-            const invoke = () => nativeFn(...args.map(normalizeArg));
-            const manager = this.threadManager;
-
-            if (manager) {
-              if (manager.isInAttachedContext()) {
-                return invoke();
-              }
-              return manager.run(invoke);
-            }
-
-            return invoke();
-          };
+          const signature = getSignature(name);
+          const wrapper = checked
+            ? this.createBinding(nativeFn, signature)
+            : this.createUncheckedBinding(nativeFn, signature);
           Object.defineProperty(target, name, {
             configurable: false,
             enumerable: true,
@@ -1149,14 +1560,124 @@ export class MonoApi {
     return target as MonoNativeBindings;
   }
 
+  /**
+   * Build a fixed-arity wrapper for a native function.
+   *
+   * Argument normalizers are chosen once per parameter from the signature, so an
+   * already attached call only costs the thread-manager check and the native call.
+   */
+  private createBinding(
+    nativeFn: NativeFunction<NativeFunctionReturnValue, NativeFunctionArgumentValue[]>,
+    signature: MonoExportSignature,
+  ): MonoNativeFunction {
+    const fn = nativeFn as unknown as (...args: NativeFunctionArgumentValue[]) => any;
+    const n = signature.argTypes.map(argNormalizerFor);
+    // Closures are only allocated on the slow path, when the thread still has to be attached.
+    const ready = (): boolean => this.isBindingReady();
+    const attach = <T>(invoke: () => T): T => this.threadManager!.run(invoke);
+
+    switch (n.length) {
+      case 0:
+        return () => (ready() ? fn() : attach(() => fn()));
+      case 1: {
+        const [n0] = n;
+        return (a0: MonoArg) => (ready() ? fn(n0(a0)) : attach(() => fn(n0(a0))));
+      }
+      case 2: {
+        const [n0, n1] = n;
+        return (a0: MonoArg, a1: MonoArg) => (ready() ? fn(n0(a0), n1(a1)) : attach(() => fn(n0(a0), n1(a1))));
+      }
+      case 3: {
+        const [n0, n1, n2] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg) =>
+          ready() ? fn(n0(a0), n1(a1), n2(a2)) : attach(() => fn(n0(a0), n1(a1), n2(a2)));
+      }
+      case 4: {
+        const [n0, n1, n2, n3] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg, a3: MonoArg) =>
+          ready() ? fn(n0(a0), n1(a1), n2(a2), n3(a3)) : attach(() => fn(n0(a0), n1(a1), n2(a2), n3(a3)));
+      }
+      case 5: {
+        const [n0, n1, n2, n3, n4] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg, a3: MonoArg, a4: MonoArg) =>
+          ready()
+            ? fn(n0(a0), n1(a1), n2(a2), n3(a3), n4(a4))
+            : attach(() => fn(n0(a0), n1(a1), n2(a2), n3(a3), n4(a4)));
+      }
+      default:
+        return (...args: MonoArg[]) => {
+          const invoke = () => fn(...args.map((arg, index) => (n[index] ?? normalizeArg)(arg)));
+          return ready() ? invoke() : attach(invoke);
+        };
+    }
+  }
+
+  /**
+   * Build a fixed-arity wrapper that only normalizes arguments (see `uncheckedNative`).
+   */
+  private createUncheckedBinding(
+    nativeFn: NativeFunction<NativeFunctionReturnValue, NativeFunctionArgumentValue[]>,
+    signature: MonoExportSignature,
+  ): MonoNativeFunction {
+    const fn = nativeFn as unknown as (...args: NativeFunctionArgumentValue[]) => any;
+    const n = signature.argTypes.map(argNormalizerFor);
+
+    switch (n.length) {
+      case 0:
+        return () => fn();
+      case 1: {
+        const [n0] = n;
+        return (a0: MonoArg) => fn(n0(a0));
+      }
+      case 2: {
+        const [n0, n1] = n;
+        return (a0: MonoArg, a1: MonoArg) => fn(n0(a0), n1(a1));
+      }
+      case 3: {
+        const [n0, n1, n2] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg) => fn(n0(a0), n1(a1), n2(a2));
+      }
+      case 4: {
+        const [n0, n1, n2, n3] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg, a3: MonoArg) => fn(n0(a0), n1(a1), n2(a2), n3(a3));
+      }
+      case 5: {
+        const [n0, n1, n2, n3, n4] = n;
+        return (a0: MonoArg, a1: MonoArg, a2: MonoArg, a3: MonoArg, a4: MonoArg) =>
+          fn(n0(a0), n1(a1), n2(a2), n3(a3), n4(a4));
+      }
+      default:
+        return (...args: MonoArg[]) => fn(...args.map((arg, index) => (n[index] ?? normalizeArg)(arg)));
+    }
+  }
+
+  /**
+   * Whether a native call may proceed without going through the thread manager.
+   */
+  private isBindingReady(): boolean {
+    const manager = this.threadManager;
+    return manager === undefined || manager.isInAttachedContext();
+  }
+
+  /**
+   * Raise NOT_SUPPORTED unless mono_method_get_unmanaged_thunk is exported.
+   * It is only available in mono-2.0-bdwgc.dll style builds.
+   */
+  private ensureUnmanagedThunkSupport(hint: string): void {
+    if (!this.hasExport("mono_method_get_unmanaged_thunk")) {
+      raise(
+        MonoErrorCodes.NOT_SUPPORTED,
+        "mono_method_get_unmanaged_thunk is not available on this Mono runtime (only in mono-2.0-bdwgc.dll)",
+        hint,
+      );
+    }
+  }
+
   private getExceptionSlot(): NativePointer {
     this.ensureNotDisposed();
 
-    if (this.exceptionSlot && !pointerIsNull(this.exceptionSlot)) {
-      return this.exceptionSlot;
-    }
-    this.exceptionSlot = this.trackAllocation(Memory.alloc(Process.pointerSize));
-    return this.exceptionSlot;
+    // Not tracked in allocatedResources: evicted slots are reclaimed by Frida's GC
+    return this.exceptionSlots.getOrCreate(Process.getCurrentThreadId(), () => Memory.alloc(Process.pointerSize));
   }
 }
 
@@ -1180,6 +1701,24 @@ function normalizeArg(arg: MonoArg): NativeFunctionArgumentValue {
   return arg as NativeFunctionArgumentValue;
 }
 
+/**
+ * Normalize a pointer argument: null/undefined become NULL, everything else is passed through.
+ */
+function normalizePointerArg(arg: MonoArg): NativeFunctionArgumentValue {
+  if (arg === null || arg === undefined) {
+    return NULL;
+  }
+  return arg as NativeFunctionArgumentValue;
+}
+
+/**
+ * Pick the argument normalizer for a native parameter type.
+ * Pointer parameters only need NULL substitution; scalar parameters also map booleans.
+ */
+function argNormalizerFor(type: NativeFunctionArgumentType): (arg: MonoArg) => NativeFunctionArgumentValue {
+  return type === "pointer" ? normalizePointerArg : normalizeArg;
+}
+
 /**
  * Options for creating a MonoApi instance.
  */
@@ -1198,6 +1737,13 @@ export interface CreateMonoApiOptions {
    * @default 512
    */
   pinnedStringCacheCapacity?: number;
+
+  /**
+   * Maximum number of interned metadata wrappers retained per handle kind.
+   * Evicted wrappers are re-created on demand.
+   * @default 4096
+   */
+  handleCacheCapacity?: number;
 }
 
 /**
@@ -1215,5 +1761,10 @@ export interface CreateMonoApiOptions {
  * ```
  */
 export function createMonoApi(module: MonoModuleInfo, options?: CreateMonoApiOptions): MonoApi {
-  return new MonoApi(module, options?.utf8CacheCapacity, options?.pinnedStringCacheCapacity);
+  return new MonoApi(
+    module,
+    options?.utf8CacheCapacity,
+    options?.pinnedStringCacheCapacity,
+    options?.handleCacheCapacity,
+  );
 }
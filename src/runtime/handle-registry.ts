@@ -0,0 +1,122 @@
+/**
+ * Handle registry - pointer-keyed identity map for metadata wrappers.
+ *
+ * Metadata handles (MonoClass, MonoMethod, MonoField, MonoType, MonoProperty,
+ * MonoImage, MonoAssembly) are immutable views over runtime structures whose
+ * addresses are stable for the lifetime of the owning image. Interning them
+ * means every lookup of the same pointer yields the same wrapper, so `@lazy`
+ * getters and per-instance caches are computed once instead of per wrapper.
+ *
+ * Managed objects (MonoObject and subclasses) must NOT be interned: the GC may
+ * move or collect them, and their pointers can be reused for unrelated objects.
+ *
+ * @module runtime/handle-registry
+ */
+
+import { LruCache } from "../utils/cache";
+import type { MonoApi } from "./api";
+
+/**
+ * Constructor shape shared by all interned handle types.
+ */
+export type HandleConstructor<T extends object> = new (api: MonoApi, pointer: NativePointer) => T;
+
+/**
+ * Bounded identity map from `(handle kind, native pointer)` to wrapper instance.
+ *
+ * Each kind gets its own LRU so a burst of one kind (e.g. enumerating every
+ * method of a large image) cannot evict frequently used wrappers of another.
+ * Evicted entries are simply re-created on next access.
+ */
+export class HandleRegistry {
+  private readonly kinds = new Map<HandleConstructor<object>, LruCache<string, object>>();
+
+  /**
+   * @param capacity Maximum number of wrappers retained per handle kind
+   */
+  constructor(private readonly capacity: number) {}
+
+  /**
+   * Get the canonical wrapper for a pointer, creating it on first use.
+   *
+   * @param kind Wrapper constructor (e.g. MonoClass)
+   * @param api Mono API instance passed to the constructor
+   * @param pointer Native pointer of the runtime structure
+   * @returns Shared wrapper instance for this pointer
+   */
+  intern<T extends object>(kind: HandleConstructor<T>, api: MonoApi, pointer: NativePointer): T {
+    const cache = this.cacheFor(kind);
+    const key = pointer.toString();
+    const cached = cache.get(key);
+    if (cached !== undefined) {
+      return cached as T;
+    }
+    const wrapper = new kind(api, pointer);
+    cache.set(key, wrapper);
+    return wrapper;
+  }
+
+  /**
+   * Look up an interned wrapper without creating one.
+   */
+  peek<T extends object>(kind: HandleConstructor<T>, pointer: NativePointer): T | null {
+    const cache = this.kinds.get(kind as HandleConstructor<object>);
+    if (!cache) {
+      return null;
+    }
+    return (cache.peek(pointer.toString()) as T | undefined) ?? null;
+  }
+
+  /**
+   * Drop the wrapper for a pointer.
+   *
+   * @param pointer Native pointer to invalidate
+   * @param kind Restrict invalidation to one handle kind (default: all kinds)
+   * @returns Number of wrappers removed
+   */
+  invalidate(pointer: NativePointer, kind?: HandleConstructor<object>): number {
+    const key = pointer.toString();
+    if (kind) {
+      return this.kinds.get(kind)?.delete(key) ? 1 : 0;
+    }
+    let removed = 0;
+    for (const cache of this.kinds.values()) {
+      if (cache.delete(key)) {
+        removed++;
+      }
+    }
+    return removed;
+  }
+
+  /**
+   * Drop every wrapper of one kind, or all wrappers when no kind is given.
+   */
+  clear(kind?: HandleConstructor<object>): void {
+    if (kind) {
+      this.kinds.get(kind)?.clear();
+      return;
+    }
+    for (const cache of this.kinds.values()) {
+      cache.clear();
+    }
+    this.kinds.clear();
+  }
+
+  /** Total number of interned wrappers across all kinds. */
+  get size(): number {
+    let total = 0;
+    for (const cache of this.kinds.values()) {
+      total += cache.size;
+    }
+    return total;
+  }
+
+  private cacheFor(kind: HandleConstructor<object>): LruCache<string, object> {
+    let cache = this.kinds.get(kind);
+    if (!cache) {
+      cache = new LruCache<string, object>(this.capacity);
+      this.kinds.set(kind, cache);
+    }
+    return cache;
+  }
+}
@@ -16,6 +16,10 @@
 // Main interface to Mono C API with caching and thread management
 export * from "./api";
 
+// ===== HANDLE REGISTRY =====
+// Pointer-keyed identity map for metadata wrappers
+export * from "./handle-registry";
+
 // ===== THREAD MANAGEMENT =====
 // Thread attachment and execution context management
 export * from "./thread";
@@ -36,6 +40,14 @@ export * from "./version";
 // Attribute flags and utilities
 export * from "./metadata";
 
+// ===== METADATA TABLES =====
+// Direct ECMA-335 table and #Strings heap reader
+export * from "./metadata-tables";
+
+// ===== METADATA SNAPSHOTS =====
+// Portable metadata row snapshots keyed by module MVID
+export * from "./metadata-snapshot";
+
 // ===== EXPORTS =====
 // Mono export mappings and signature lookup
 export * from "./exports";
@@ -0,0 +1,277 @@
+/**
+ * Metadata Snapshots - Portable, JSON-serializable copies of an image's metadata rows.
+ *
+ * A snapshot holds the decoded TypeDef, MethodDef, Field and Property rows
+ * (names, tokens, flags, signature blob indices) of one image, keyed by the
+ * module MVID and the byte size of its metadata tables. The host can persist
+ * snapshots between sessions and hand them back on the next attach; a snapshot
+ * whose key still matches the loaded image replaces decoding its tables.
+ *
+ * Rows are stored as flat number arrays with a shared string table, which keeps
+ * a snapshot of a large game assembly small enough to pass through `send()`.
+ *
+ * @module runtime/metadata-snapshot
+ */
+
+import { MonoEnums } from "./enums";
+import type {
+  MetadataFieldDef,
+  MetadataMethodDef,
+  MetadataPropertyDef,
+  MetadataReader,
+  MetadataRowRange,
+  MetadataRows,
+  MetadataTypeDef,
+} from "./metadata-tables";
+import { makeMetadataToken } from "./metadata-tables";
+
+const MonoMetaTable = MonoEnums.MonoMetaTableEnum;
+
+/** Snapshot layout version; bumped whenever the row encoding changes. */
+export const METADATA_SNAPSHOT_FORMAT = 1;
+
+/** Message type used when snapshots are sent to the host. */
+export const METADATA_SNAPSHOT_MESSAGE = "mono-metadata-snapshot";
+
+// Numbers stored per row in the flat arrays
+const TYPEDEF_STRIDE = 8; // flags, name, namespace, extends, fieldStart, fieldEnd, methodStart, methodEnd
+const METHOD_STRIDE = 5; // rva, implFlags, flags, name, signature
+const MEMBER_STRIDE = 3; // flags, name, signature
+const RANGE_STRIDE = 3; // typeRid, start, end
+
+// ============================================================================
+// TYPE DEFINITIONS
+// ============================================================================
+
+/** Identity of the image a snapshot was taken from. */
+export interface MetadataSnapshotKey {
+  /** Image name, informational only */
+  image: string;
+  /** Module version id; changes on every recompilation */
+  mvid: string;
+  /** Byte size of all metadata table rows */
+  size: number;
+}
+
+/**
+ * Compact, JSON-serializable snapshot of one image's metadata rows.
+ *
+ * @remarks
+ * String columns hold indices into `strings`. Treat the row arrays as opaque;
+ * restore them with `restoreMetadataSnapshot()`.
+ */
+export interface MetadataSnapshot {
+  format: number;
+  key: MetadataSnapshotKey;
+  strings: string[];
+  typeDefs: number[];
+  methodDefs: number[];
+  fieldDefs: number[];
+  propertyDefs: number[];
+  /** Nested TypeDef rid / enclosing TypeDef rid pairs */
+  nestedClasses: number[];
+  propertyRanges: number[];
+}
+
+// ============================================================================
+// ENCODING
+// ============================================================================
+
+/**
+ * Compute the snapshot key of an image's metadata.
+ *
+ * @param reader Metadata reader of the image
+ * @param image Image name stored alongside the key
+ */
+export function metadataSnapshotKey(reader: MetadataReader, image: string): MetadataSnapshotKey {
+  return { image, mvid: reader.mvid, size: reader.tablesSize };
+}
+
+/**
+ * Whether two snapshot keys identify the same image contents.
+ */
+export function snapshotKeysMatch(a: MetadataSnapshotKey, b: MetadataSnapshotKey): boolean {
+  return a.mvid !== "" && a.mvid === b.mvid && a.size === b.size;
+}
+
+/**
+ * Encode an image's metadata rows into a snapshot.
+ *
+ * @param reader Metadata reader of the image
+ * @param key Key identifying the image (see `metadataSnapshotKey()`)
+ */
+export function createMetadataSnapshot(reader: MetadataReader, key: MetadataSnapshotKey): MetadataSnapshot {
+  const strings: string[] = [];
+  const stringIds = new Map<string, number>();
+  const intern = (value: string): number => {
+    let id = stringIds.get(value);
+    if (id === undefined) {
+      id = strings.length;
+      strings.push(value);
+      stringIds.set(value, id);
+    }
+    return id;
+  };
+
+  const typeDefs: number[] = [];
+  for (const type of reader.typeDefs) {
+    typeDefs.push(
+      type.flags,
+      intern(type.name),
+      intern(type.namespace),
+      type.extends,
+      type.fields.start,
+      type.fields.end,
+      type.methods.start,
+      type.methods.end,
+    );
+  }
+
+  const methodDefs: number[] = [];
+  for (const method of reader.methodDefs) {
+    methodDefs.push(method.rva, method.implFlags, method.flags, intern(method.name), method.signature);
+  }
+
+  const encodeMembers = (rows: Array<MetadataFieldDef | MetadataPropertyDef>): number[] => {
+    const result: number[] = [];
+    for (const row of rows) {
+      result.push(row.flags, intern(row.name), row.signature);
+    }
+    return result;
+  };
+
+  const nestedClasses: number[] = [];
+  for (const [nested, enclosing] of reader.nestedClasses) {
+    nestedClasses.push(nested & 0x00ffffff, enclosing & 0x00ffffff);
+  }
+
+  const propertyRanges: number[] = [];
+  for (const [typeRid, range] of reader.propertyRanges) {
+    propertyRanges.push(typeRid, range.start, range.end);
+  }
+
+  return {
+    format: METADATA_SNAPSHOT_FORMAT,
+    key,
+    strings,
+    typeDefs,
+    methodDefs,
+    fieldDefs: encodeMembers(reader.fieldDefs),
+    propertyDefs: encodeMembers(reader.propertyDefs),
+    nestedClasses,
+    propertyRanges,
+  };
+}
+
+// ============================================================================
+// DECODING
+// ============================================================================
+
+/**
+ * Check that a value received from the host has the shape of a snapshot of
+ * the current format.
+ */
+export function isMetadataSnapshot(value: unknown): value is MetadataSnapshot {
+  if (typeof value !== "object" || value === null) {
+    return false;
+  }
+  const snapshot = value as Partial<MetadataSnapshot>;
+  return (
+    snapshot.format === METADATA_SNAPSHOT_FORMAT &&
+    typeof snapshot.key?.mvid === "string" &&
+    typeof snapshot.key.size === "number" &&
+    Array.isArray(snapshot.strings) &&
+    Array.isArray(snapshot.typeDefs) &&
+    snapshot.typeDefs.length % TYPEDEF_STRIDE === 0 &&
+    Array.isArray(snapshot.methodDefs) &&
+    snapshot.methodDefs.length % METHOD_STRIDE === 0 &&
+    Array.isArray(snapshot.fieldDefs) &&
+    snapshot.fieldDefs.length % MEMBER_STRIDE === 0 &&
+    Array.isArray(snapshot.propertyDefs) &&
+    snapshot.propertyDefs.length % MEMBER_STRIDE === 0 &&
+    Array.isArray(snapshot.nestedClasses) &&
+    snapshot.nestedClasses.length % 2 === 0 &&
+    Array.isArray(snapshot.propertyRanges) &&
+    snapshot.propertyRanges.length % RANGE_STRIDE === 0
+  );
+}
+
+/**
+ * Decode a snapshot back into metadata rows, ready for `MetadataReader.seed()`.
+ *
+ * @param snapshot Snapshot produced by `createMetadataSnapshot()`
+ */
+export function restoreMetadataSnapshot(snapshot: MetadataSnapshot): MetadataRows {
+  const strings = snapshot.strings;
+
+  const nestedClasses = new Map<number, number>();
+  for (let i = 0; i < snapshot.nestedClasses.length; i += 2) {
+    nestedClasses.set(
+      makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, snapshot.nestedClasses[i]),
+      makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, snapshot.nestedClasses[i + 1]),
+    );
+  }
+
+  const typeDefs: MetadataTypeDef[] = [];
+  for (let i = 0, rid = 1; i < snapshot.typeDefs.length; i += TYPEDEF_STRIDE, rid += 1) {
+    const row = snapshot.typeDefs;
+    const name = strings[row[i + 1]] ?? "";
+    const namespace = strings[row[i + 2]] ?? "";
+    const token = makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, rid);
+    typeDefs.push({
+      token,
+      rid,
+      flags: row[i],
+      name,
+      namespace,
+      fullName: namespace ? `${namespace}.${name}` : name,
+      extends: row[i + 3],
+      fields: { start: row[i + 4], end: row[i + 5] },
+      methods: { start: row[i + 6], end: row[i + 7] },
+      enclosingToken: nestedClasses.get(token) ?? 0,
+    });
+  }
+
+  const methodDefs: MetadataMethodDef[] = [];
+  for (let i = 0, rid = 1; i < snapshot.methodDefs.length; i += METHOD_STRIDE, rid += 1) {
+    const row = snapshot.methodDefs;
+    methodDefs.push({
+      token: makeMetadataToken(MonoMetaTable.MONO_TABLE_METHOD, rid),
+      rid,
+      rva: row[i],
+      implFlags: row[i + 1],
+      flags: row[i + 2],
+      name: strings[row[i + 3]] ?? "",
+      signature: row[i + 4],
+    });
+  }
+
+  const decodeMembers = (row: number[], table: number): MetadataFieldDef[] => {
+    const result: MetadataFieldDef[] = [];
+    for (let i = 0, rid = 1; i < row.length; i += MEMBER_STRIDE, rid += 1) {
+      result.push({
+        token: makeMetadataToken(table, rid),
+        rid,
+        flags: row[i],
+        name: strings[row[i + 1]] ?? "",
+        signature: row[i + 2],
+      });
+    }
+    return result;
+  };
+
+  const propertyRanges = new Map<number, MetadataRowRange>();
+  for (let i = 0; i < snapshot.propertyRanges.length; i += RANGE_STRIDE) {
+    const row = snapshot.propertyRanges;
+    propertyRanges.set(row[i], { start: row[i + 1], end: row[i + 2] });
+  }
+
+  return {
+    typeDefs,
+    methodDefs,
+    fieldDefs: decodeMembers(snapshot.fieldDefs, MonoMetaTable.MONO_TABLE_FIELD),
+    propertyDefs: decodeMembers(snapshot.propertyDefs, MonoMetaTable.MONO_TABLE_PROPERTY),
+    nestedClasses,
+    propertyRanges,
+  };
+}
@@ -0,0 +1,864 @@
+/**
+ * Metadata Tables - Direct ECMA-335 table reader for loaded images.
+ *
+ * Decodes metadata rows (TypeDef, Field, MethodDef, Property, NestedClass, ...)
+ * and the #Strings heap straight from an image's mapped metadata, without
+ * asking Mono to load or set up classes. Per table only the `MonoTableInfo`
+ * lookup crosses into native code; rows and strings are then read from memory.
+ *
+ * Column widths are taken from Mono's own size bitfield in `MonoTableInfo`, so
+ * heap-index and coded-index sizes always match the image. If the in-memory
+ * layout does not look as expected, rows are decoded through
+ * `mono_metadata_decode_row` instead.
+ *
+ * @module runtime/metadata-tables
+ */
+
+import { lazy } from "../utils/cache";
+import { pointerIsNull } from "../utils/memory";
+import type { MonoApi } from "./api";
+import { MonoEnums } from "./enums";
+
+const MonoMetaTable = MonoEnums.MonoMetaTableEnum;
+
+// ============================================================================
+// TYPE DEFINITIONS
+// ============================================================================
+
+/** Half-open range of 1-based row ids `[start, end)` in a member table. */
+export interface MetadataRowRange {
+  start: number;
+  end: number;
+}
+
+/** Decoded TypeDef row. */
+export interface MetadataTypeDef {
+  /** TypeDef token (0x02xxxxxx) */
+  token: number;
+  /** 1-based row id */
+  rid: number;
+  /** TypeAttributes flags */
+  flags: number;
+  name: string;
+  namespace: string;
+  /** `namespace.name`, matching `MonoClass.fullName` */
+  fullName: string;
+  /** Raw TypeDefOrRef coded index of the base type (0 for none) */
+  extends: number;
+  /** Field rows owned by this type */
+  fields: MetadataRowRange;
+  /** MethodDef rows owned by this type */
+  methods: MetadataRowRange;
+  /** Token of the enclosing type for nested types, 0 otherwise */
+  enclosingToken: number;
+}
+
+/** Decoded MethodDef row. */
+export interface MetadataMethodDef {
+  /** MethodDef token (0x06xxxxxx) */
+  token: number;
+  rid: number;
+  rva: number;
+  /** MethodImplAttributes flags */
+  implFlags: number;
+  /** MethodAttributes flags */
+  flags: number;
+  name: string;
+  /** #Blob heap index of the signature */
+  signature: number;
+}
+
+/** Decoded Field row. */
+export interface MetadataFieldDef {
+  /** Field token (0x04xxxxxx) */
+  token: number;
+  rid: number;
+  /** FieldAttributes flags */
+  flags: number;
+  name: string;
+  /** #Blob heap index of the signature */
+  signature: number;
+}
+
+/** Decoded Property row. */
+export interface MetadataPropertyDef {
+  /** Property token (0x17xxxxxx) */
+  token: number;
+  rid: number;
+  /** PropertyAttributes flags */
+  flags: number;
+  name: string;
+  /** #Blob heap index of the signature */
+  signature: number;
+}
+
+/** Decoded AssemblyRef row. */
+export interface MetadataAssemblyRef {
+  /** AssemblyRef token (0x23xxxxxx) */
+  token: number;
+  rid: number;
+  name: string;
+  culture: string;
+  /** `major.minor.build.revision` */
+  version: string;
+  /** AssemblyFlags */
+  flags: number;
+}
+
+/** Decoded TypeRef row. */
+export interface MetadataTypeRef {
+  /** TypeRef token (0x01xxxxxx) */
+  token: number;
+  rid: number;
+  name: string;
+  namespace: string;
+  fullName: string;
+}
+
+/** Decoded MemberRef row. */
+export interface MetadataMemberRef {
+  /** MemberRef token (0x0Axxxxxx) */
+  token: number;
+  rid: number;
+  /** Token of the declaring type (TypeDef, TypeRef, TypeSpec, ...) */
+  parent: number;
+  name: string;
+  /** #Blob heap index of the signature */
+  signature: number;
+}
+
+/** Decoded CustomAttribute row. */
+export interface MetadataCustomAttribute {
+  /** CustomAttribute token (0x0Cxxxxxx) */
+  token: number;
+  rid: number;
+  /** Token of the attributed entity (TypeDef, MethodDef, Field, Property, Assembly, ...) */
+  parent: number;
+  /** Token of the attribute constructor (MethodDef or MemberRef) */
+  type: number;
+  /** #Blob heap index of the attribute value */
+  value: number;
+}
+
+/** Decoded rows that can be restored from a snapshot instead of read from the image. */
+export interface MetadataRows {
+  typeDefs: MetadataTypeDef[];
+  methodDefs: MetadataMethodDef[];
+  fieldDefs: MetadataFieldDef[];
+  propertyDefs: MetadataPropertyDef[];
+  nestedClasses: Map<number, number>;
+  propertyRanges: Map<number, MetadataRowRange>;
+}
+
+/** Location of a #Blob heap entry. */
+export interface MetadataBlob {
+  /** First byte of the blob data (after the length prefix) */
+  pointer: NativePointer;
+  size: number;
+}
+
+// ============================================================================
+// TABLE VIEW
+// ============================================================================
+
+/**
+ * Read-only view over one metadata table.
+ */
+export class MetadataTableView {
+  private readonly base: NativePointer;
+  private readonly rowSize: number;
+  private readonly columnOffsets: number[];
+  private readonly columnSizes: number[];
+  private readonly direct: boolean;
+  private decodeBuffer: NativePointer | null = null;
+
+  /**
+   * @param api Mono API instance
+   * @param info `MonoTableInfo*` for the table
+   * @param rows Row count reported by Mono
+   * @param columnCount Number of columns defined by ECMA-335 for this table
+   */
+  constructor(
+    private readonly api: MonoApi,
+    private readonly info: NativePointer,
+    readonly rows: number,
+    readonly columnCount: number,
+  ) {
+    // struct _MonoTableInfo { const char *base; guint rows : 24; guint row_size : 8; guint32 size_bitfield; }
+    const pointerSize = Process.pointerSize;
+    this.base = info.readPointer();
+    const rowBits = info.add(pointerSize).readU32();
+    const sizeBitfield = info.add(pointerSize + 4).readU32();
+    this.rowSize = rowBits >>> 24;
+
+    this.columnSizes = [];
+    this.columnOffsets = [];
+    let offset = 0;
+    for (let column = 0; column < columnCount; column += 1) {
+      const size = ((sizeBitfield >>> (column * 2)) & 0x3) + 1;
+      this.columnSizes.push(size);
+      this.columnOffsets.push(offset);
+      offset += size;
+    }
+
+    this.direct =
+      !pointerIsNull(this.base) &&
+      (rowBits & 0xffffff) === rows &&
+      sizeBitfield >>> 24 === columnCount &&
+      offset === this.rowSize &&
+      this.columnSizes.every(size => size !== 3);
+  }
+
+  /**
+   * Read one cell.
+   *
+   * @param rid 1-based row id
+   * @param column 0-based column index
+   */
+  cell(rid: number, column: number): number {
+    if (!this.direct) {
+      return this.decode(rid)[column] ?? 0;
+    }
+    const pointer = this.base.add((rid - 1) * this.rowSize + this.columnOffsets[column]);
+    switch (this.columnSizes[column]) {
+      case 1:
+        return pointer.readU8();
+      case 2:
+        return pointer.readU16();
+      default:
+        return pointer.readU32();
+    }
+  }
+
+  /**
+   * Read all columns of a row.
+   *
+   * @param rid 1-based row id
+   */
+  row(rid: number): number[] {
+    if (!this.direct) {
+      return this.decode(rid);
+    }
+    const values: number[] = [];
+    for (let column = 0; column < this.columnCount; column += 1) {
+      values.push(this.cell(rid, column));
+    }
+    return values;
+  }
+
+  private decode(rid: number): number[] {
+    if (this.decodeBuffer === null) {
+      this.decodeBuffer = Memory.alloc(this.columnCount * 4);
+    }
+    const buffer = this.decodeBuffer;
+    this.api.native.mono_metadata_decode_row(this.info, rid - 1, buffer, this.columnCount);
+    const values: number[] = [];
+    for (let column = 0; column < this.columnCount; column += 1) {
+      values.push(buffer.add(column * 4).readU32());
+    }
+    return values;
+  }
+}
+
+// ============================================================================
+// METADATA READER
+// ============================================================================
+
+/** ECMA-335 column counts for the tables the reader decodes. */
+const COLUMN_COUNTS: Readonly<Record<number, number>> = Object.freeze({
+  [MonoMetaTable.MONO_TABLE_TYPEDEF]: 6,
+  [MonoMetaTable.MONO_TABLE_FIELD_POINTER]: 1,
+  [MonoMetaTable.MONO_TABLE_FIELD]: 3,
+  [MonoMetaTable.MONO_TABLE_METHOD_POINTER]: 1,
+  [MonoMetaTable.MONO_TABLE_METHOD]: 6,
+  [MonoMetaTable.MONO_TABLE_PROPERTYMAP]: 2,
+  [MonoMetaTable.MONO_TABLE_PROPERTY_POINTER]: 1,
+  [MonoMetaTable.MONO_TABLE_PROPERTY]: 3,
+  [MonoMetaTable.MONO_TABLE_NESTEDCLASS]: 2,
+  [MonoMetaTable.MONO_TABLE_ASSEMBLYREF]: 9,
+  [MonoMetaTable.MONO_TABLE_TYPEREF]: 3,
+  [MonoMetaTable.MONO_TABLE_MEMBERREF]: 3,
+  [MonoMetaTable.MONO_TABLE_CUSTOMATTRIBUTE]: 3,
+});
+
+/** Tables addressed by a HasCustomAttribute coded index (5 tag bits), in tag order. */
+const HAS_CUSTOM_ATTRIBUTE_TABLES: readonly number[] = [
+  MonoMetaTable.MONO_TABLE_METHOD,
+  MonoMetaTable.MONO_TABLE_FIELD,
+  MonoMetaTable.MONO_TABLE_TYPEREF,
+  MonoMetaTable.MONO_TABLE_TYPEDEF,
+  MonoMetaTable.MONO_TABLE_PARAM,
+  MonoMetaTable.MONO_TABLE_INTERFACEIMPL,
+  MonoMetaTable.MONO_TABLE_MEMBERREF,
+  MonoMetaTable.MONO_TABLE_MODULE,
+  MonoMetaTable.MONO_TABLE_DECLSECURITY,
+  MonoMetaTable.MONO_TABLE_PROPERTY,
+  MonoMetaTable.MONO_TABLE_EVENT,
+  MonoMetaTable.MONO_TABLE_STANDALONESIG,
+  MonoMetaTable.MONO_TABLE_MODULEREF,
+  MonoMetaTable.MONO_TABLE_TYPESPEC,
+  MonoMetaTable.MONO_TABLE_ASSEMBLY,
+  MonoMetaTable.MONO_TABLE_ASSEMBLYREF,
+  MonoMetaTable.MONO_TABLE_FILE,
+  MonoMetaTable.MONO_TABLE_EXPORTEDTYPE,
+  MonoMetaTable.MONO_TABLE_MANIFESTRESOURCE,
+  MonoMetaTable.MONO_TABLE_GENERICPARAM,
+  MonoMetaTable.MONO_TABLE_GENERICPARAMCONSTRAINT,
+  MonoMetaTable.MONO_TABLE_METHODSPEC,
+];
+
+/** Tables addressed by a CustomAttributeType coded index (3 tag bits); -1 marks unused tags. */
+const CUSTOM_ATTRIBUTE_TYPE_TABLES: readonly number[] = [
+  -1,
+  -1,
+  MonoMetaTable.MONO_TABLE_METHOD,
+  MonoMetaTable.MONO_TABLE_MEMBERREF,
+  -1,
+];
+
+/** Tables addressed by a MemberRefParent coded index (3 tag bits), in tag order. */
+const MEMBER_REF_PARENT_TABLES: readonly number[] = [
+  MonoMetaTable.MONO_TABLE_TYPEDEF,
+  MonoMetaTable.MONO_TABLE_TYPEREF,
+  MonoMetaTable.MONO_TABLE_MODULEREF,
+  MonoMetaTable.MONO_TABLE_METHOD,
+  MonoMetaTable.MONO_TABLE_TYPESPEC,
+];
+
+/**
+ * Decode a coded index into a metadata token.
+ *
+ * @returns Token, or 0 for a null or unknown reference
+ */
+function decodeCodedIndex(value: number, tagBits: number, tables: readonly number[]): number {
+  const rid = value >>> tagBits;
+  const table = tables[value & ((1 << tagBits) - 1)];
+  if (rid === 0 || table === undefined || table < 0) {
+    return 0;
+  }
+  return makeMetadataToken(table, rid);
+}
+
+/**
+ * Build a metadata token from a table id and 1-based row id.
+ */
+export function makeMetadataToken(table: number, rid: number): number {
+  return ((table << 24) | rid) >>> 0;
+}
+
+/**
+ * Reader for the metadata tables of one image.
+ *
+ * All decoded collections are computed lazily and cached; images are
+ * immutable once loaded, so the results never go stale.
+ *
+ * @example
+ * ```typescript
+ * const reader = new MetadataReader(api, image.pointer);
+ * for (const type of reader.typeDefs) {
+ *   console.log(type.fullName, type.token.toString(16));
+ * }
+ * ```
+ */
+export class MetadataReader {
+  private readonly tables = new Map<number, MetadataTableView | null>();
+  private readonly strings = new Map<number, string>();
+  private stringHeap: NativePointer | null = null;
+  private blobHeap: NativePointer | null = null;
+  private seeded: MetadataRows | null = null;
+
+  constructor(
+    private readonly api: MonoApi,
+    private readonly image: NativePointer,
+  ) {}
+
+  /** Whether the TypeDef table could be located for this image. */
+  get available(): boolean {
+    return this.table(MonoMetaTable.MONO_TABLE_TYPEDEF) !== null;
+  }
+
+  /** Module version id (GUID string) of the image. */
+  @lazy
+  get mvid(): string {
+    const guid = this.api.native.mono_image_get_guid(this.image) as NativePointer;
+    return pointerIsNull(guid) ? "" : (guid.readUtf8String() ?? "");
+  }
+
+  /** Total byte size of all metadata table rows; changes whenever the tables do. */
+  @lazy
+  get tablesSize(): number {
+    let size = 0;
+    for (let table = 0; table <= MonoMetaTable.MONO_TABLE_GENERICPARAMCONSTRAINT; table += 1) {
+      const info = this.api.native.mono_image_get_table_info(this.image, table) as NativePointer;
+      if (!pointerIsNull(info)) {
+        // rows : 24, row_size : 8 (see MetadataTableView)
+        const rowBits = info.add(Process.pointerSize).readU32();
+        size += (rowBits & 0xffffff) * (rowBits >>> 24);
+      }
+    }
+    return size;
+  }
+
+  /**
+   * Use previously decoded rows (e.g. from a metadata snapshot) instead of
+   * reading them from the image. Must be called before the rows are first used.
+   *
+   * @returns False (and nothing is seeded) if the TypeDef rows were already decoded
+   */
+  seed(rows: MetadataRows): boolean {
+    // `typeDefs` is @lazy: once read it is an own property and ignores `seeded`
+    if (Object.prototype.hasOwnProperty.call(this, "typeDefs")) {
+      return false;
+    }
+    this.seeded = rows;
+    return true;
+  }
+
+  /** Whether rows were restored via `seed()`. */
+  get isSeeded(): boolean {
+    return this.seeded !== null;
+  }
+
+  /**
+   * Get a view over a metadata table.
+   *
+   * @param table Table id (see `MonoEnums.MonoMetaTableEnum`)
+   * @param columnCount Column count; required for tables the reader does not decode itself
+   * @returns Table view, or null if the table is missing
+   */
+  table(table: number, columnCount: number = COLUMN_COUNTS[table] ?? 0): MetadataTableView | null {
+    if (this.tables.has(table)) {
+      return this.tables.get(table)!;
+    }
+    let view: MetadataTableView | null = null;
+    const info = this.api.native.mono_image_get_table_info(this.image, table);
+    if (!pointerIsNull(info) && columnCount > 0) {
+      const rows = this.api.native.mono_table_info_get_rows(info) as number;
+      view = new MetadataTableView(this.api, info, rows, columnCount);
+    }
+    this.tables.set(table, view);
+    return view;
+  }
+
+  /** Number of rows in a table (0 if missing). */
+  rowCount(table: number): number {
+    if (COLUMN_COUNTS[table] === undefined) {
+      return this.api.native.mono_image_get_table_rows(this.image, table) as number;
+    }
+    return this.table(table)?.rows ?? 0;
+  }
+
+  /**
+   * Read a string from the #Strings heap.
+   *
+   * @param index Heap offset
+   */
+  string(index: number): string {
+    if (index === 0) {
+      return "";
+    }
+    const cached = this.strings.get(index);
+    if (cached !== undefined) {
+      return cached;
+    }
+    if (this.stringHeap === null) {
+      this.stringHeap = this.api.native.mono_metadata_string_heap(this.image, 0) as NativePointer;
+    }
+    const value = this.stringHeap.add(index).readUtf8String() ?? "";
+    this.strings.set(index, value);
+    return value;
+  }
+
+  /**
+   * Locate an entry of the #Blob heap.
+   *
+   * @param index Heap offset
+   */
+  blob(index: number): MetadataBlob {
+    if (this.blobHeap === null) {
+      this.blobHeap = this.api.native.mono_metadata_blob_heap(this.image, 0) as NativePointer;
+    }
+    // ECMA-335 II.24.2.4 compressed length prefix
+    const start = this.blobHeap.add(index);
+    const first = start.readU8();
+    if ((first & 0x80) === 0) {
+      return { pointer: start.add(1), size: first };
+    }
+    if ((first & 0xc0) === 0x80) {
+      return { pointer: start.add(2), size: ((first & 0x3f) << 8) | start.add(1).readU8() };
+    }
+    const size =
+      ((first & 0x1f) << 24) | (start.add(1).readU8() << 16) | (start.add(2).readU8() << 8) | start.add(3).readU8();
+    return { pointer: start.add(4), size };
+  }
+
+  /**
+   * All TypeDef rows, in token order. Row 1 is the `<Module>` pseudo-type.
+   */
+  @lazy
+  get typeDefs(): MetadataTypeDef[] {
+    if (this.seeded) {
+      return this.seeded.typeDefs;
+    }
+    const typeDefs = this.table(MonoMetaTable.MONO_TABLE_TYPEDEF);
+    if (!typeDefs) {
+      return [];
+    }
+    const fieldEnd = this.rowCount(MonoMetaTable.MONO_TABLE_FIELD) + 1;
+    const methodEnd = this.rowCount(MonoMetaTable.MONO_TABLE_METHOD) + 1;
+    const enclosing = this.nestedClasses;
+
+    const result: MetadataTypeDef[] = [];
+    for (let rid = 1; rid <= typeDefs.rows; rid += 1) {
+      const [flags, nameIndex, namespaceIndex, extendsIndex, fieldList, methodList] = typeDefs.row(rid);
+      const hasNext = rid < typeDefs.rows;
+      const name = this.string(nameIndex);
+      const namespace = this.string(namespaceIndex);
+      const token = makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, rid);
+      result.push({
+        token,
+        rid,
+        flags,
+        name,
+        namespace,
+        fullName: namespace ? `${namespace}.${name}` : name,
+        extends: extendsIndex,
+        fields: { start: fieldList, end: hasNext ? typeDefs.cell(rid + 1, 4) : fieldEnd },
+        methods: { start: methodList, end: hasNext ? typeDefs.cell(rid + 1, 5) : methodEnd },
+        enclosingToken: enclosing.get(token) ?? 0,
+      });
+    }
+    return result;
+  }
+
+  /** All MethodDef rows, in token order. */
+  @lazy
+  get methodDefs(): MetadataMethodDef[] {
+    if (this.seeded) {
+      return this.seeded.methodDefs;
+    }
+    const methods = this.table(MonoMetaTable.MONO_TABLE_METHOD);
+    if (!methods) {
+      return [];
+    }
+    const result: MetadataMethodDef[] = [];
+    for (let rid = 1; rid <= methods.rows; rid += 1) {
+      const [rva, implFlags, flags, nameIndex, signature] = methods.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_METHOD, rid),
+        rid,
+        rva,
+        implFlags,
+        flags,
+        name: this.string(nameIndex),
+        signature,
+      });
+    }
+    return result;
+  }
+
+  /** All Field rows, in token order. */
+  @lazy
+  get fieldDefs(): MetadataFieldDef[] {
+    if (this.seeded) {
+      return this.seeded.fieldDefs;
+    }
+    const fields = this.table(MonoMetaTable.MONO_TABLE_FIELD);
+    if (!fields) {
+      return [];
+    }
+    const result: MetadataFieldDef[] = [];
+    for (let rid = 1; rid <= fields.rows; rid += 1) {
+      const [flags, nameIndex, signature] = fields.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_FIELD, rid),
+        rid,
+        flags,
+        name: this.string(nameIndex),
+        signature,
+      });
+    }
+    return result;
+  }
+
+  /** All Property rows, in token order. */
+  @lazy
+  get propertyDefs(): MetadataPropertyDef[] {
+    if (this.seeded) {
+      return this.seeded.propertyDefs;
+    }
+    const properties = this.table(MonoMetaTable.MONO_TABLE_PROPERTY);
+    if (!properties) {
+      return [];
+    }
+    const result: MetadataPropertyDef[] = [];
+    for (let rid = 1; rid <= properties.rows; rid += 1) {
+      const [flags, nameIndex, signature] = properties.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_PROPERTY, rid),
+        rid,
+        flags,
+        name: this.string(nameIndex),
+        signature,
+      });
+    }
+    return result;
+  }
+
+  /** All AssemblyRef rows, in token order. */
+  @lazy
+  get assemblyRefs(): MetadataAssemblyRef[] {
+    const refs = this.table(MonoMetaTable.MONO_TABLE_ASSEMBLYREF);
+    if (!refs) {
+      return [];
+    }
+    const result: MetadataAssemblyRef[] = [];
+    for (let rid = 1; rid <= refs.rows; rid += 1) {
+      const [major, minor, build, revision, flags, _publicKey, nameIndex, cultureIndex] = refs.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_ASSEMBLYREF, rid),
+        rid,
+        name: this.string(nameIndex),
+        culture: this.string(cultureIndex),
+        version: `${major}.${minor}.${build}.${revision}`,
+        flags,
+      });
+    }
+    return result;
+  }
+
+  /** All TypeRef rows, in token order. */
+  @lazy
+  get typeRefs(): MetadataTypeRef[] {
+    const refs = this.table(MonoMetaTable.MONO_TABLE_TYPEREF);
+    if (!refs) {
+      return [];
+    }
+    const result: MetadataTypeRef[] = [];
+    for (let rid = 1; rid <= refs.rows; rid += 1) {
+      const name = this.string(refs.cell(rid, 1));
+      const namespace = this.string(refs.cell(rid, 2));
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEREF, rid),
+        rid,
+        name,
+        namespace,
+        fullName: namespace ? `${namespace}.${name}` : name,
+      });
+    }
+    return result;
+  }
+
+  /** All MemberRef rows, in token order. */
+  @lazy
+  get memberRefs(): MetadataMemberRef[] {
+    const refs = this.table(MonoMetaTable.MONO_TABLE_MEMBERREF);
+    if (!refs) {
+      return [];
+    }
+    const result: MetadataMemberRef[] = [];
+    for (let rid = 1; rid <= refs.rows; rid += 1) {
+      const [parent, nameIndex, signature] = refs.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_MEMBERREF, rid),
+        rid,
+        parent: decodeCodedIndex(parent, 3, MEMBER_REF_PARENT_TABLES),
+        name: this.string(nameIndex),
+        signature,
+      });
+    }
+    return result;
+  }
+
+  /** All CustomAttribute rows, in token order (sorted by parent). */
+  @lazy
+  get customAttributes(): MetadataCustomAttribute[] {
+    const attributes = this.table(MonoMetaTable.MONO_TABLE_CUSTOMATTRIBUTE);
+    if (!attributes) {
+      return [];
+    }
+    const result: MetadataCustomAttribute[] = [];
+    for (let rid = 1; rid <= attributes.rows; rid += 1) {
+      const [parent, type, value] = attributes.row(rid);
+      result.push({
+        token: makeMetadataToken(MonoMetaTable.MONO_TABLE_CUSTOMATTRIBUTE, rid),
+        rid,
+        parent: decodeCodedIndex(parent, 5, HAS_CUSTOM_ATTRIBUTE_TABLES),
+        type: decodeCodedIndex(type, 3, CUSTOM_ATTRIBUTE_TYPE_TABLES),
+        value,
+      });
+    }
+    return result;
+  }
+
+  /**
+   * Owning TypeDef of a MethodDef, Field or Property token.
+   *
+   * @returns TypeDef row, or null if the member is not owned by a known type
+   */
+  ownerOf(memberToken: number): MetadataTypeDef | null {
+    const table = memberToken >>> 24;
+    const rid = memberToken & 0x00ffffff;
+    const owners = this.memberOwners.get(table);
+    return owners?.get(rid) ?? null;
+  }
+
+  /**
+   * Display name of any TypeDef/TypeRef/MethodDef/MemberRef/Field/Property token,
+   * e.g. `Game.Player` or `Game.Player::Update`.
+   */
+  nameOf(token: number): string {
+    const table = token >>> 24;
+    const rid = token & 0x00ffffff;
+    switch (table) {
+      case MonoMetaTable.MONO_TABLE_TYPEDEF:
+        return this.typeDefs[rid - 1]?.fullName ?? "";
+      case MonoMetaTable.MONO_TABLE_TYPEREF:
+        return this.typeRefs[rid - 1]?.fullName ?? "";
+      case MonoMetaTable.MONO_TABLE_MEMBERREF: {
+        const ref = this.memberRefs[rid - 1];
+        return ref ? `${this.nameOf(ref.parent)}::${ref.name}` : "";
+      }
+      case MonoMetaTable.MONO_TABLE_METHOD:
+      case MonoMetaTable.MONO_TABLE_FIELD:
+      case MonoMetaTable.MONO_TABLE_PROPERTY: {
+        const rows: { name: string }[] =
+          table === MonoMetaTable.MONO_TABLE_METHOD
+            ? this.methodDefs
+            : table === MonoMetaTable.MONO_TABLE_FIELD
+              ? this.fieldDefs
+              : this.propertyDefs;
+        const member = rows[rid - 1];
+        if (!member) {
+          return "";
+        }
+        const owner = this.ownerOf(token);
+        return owner ? `${owner.fullName}::${member.name}` : member.name;
+      }
+      default:
+        return "";
+    }
+  }
+
+  /**
+   * Declaring type name of an attribute constructor (MethodDef or MemberRef token).
+   */
+  declaringTypeNameOf(constructorToken: number): string {
+    const table = constructorToken >>> 24;
+    if (table === MonoMetaTable.MONO_TABLE_METHOD) {
+      return this.ownerOf(constructorToken)?.fullName ?? "";
+    }
+    if (table === MonoMetaTable.MONO_TABLE_MEMBERREF) {
+      const ref = this.memberRefs[(constructorToken & 0x00ffffff) - 1];
+      return ref ? this.nameOf(ref.parent) : "";
+    }
+    return "";
+  }
+
+  /** Member table id -> (member rid -> owning TypeDef). */
+  @lazy
+  private get memberOwners(): Map<number, Map<number, MetadataTypeDef>> {
+    const methods = new Map<number, MetadataTypeDef>();
+    const fields = new Map<number, MetadataTypeDef>();
+    const properties = new Map<number, MetadataTypeDef>();
+    for (const typeDef of this.typeDefs) {
+      for (const method of this.methodsOf(typeDef)) {
+        methods.set(method.rid, typeDef);
+      }
+      for (const field of this.fieldsOf(typeDef)) {
+        fields.set(field.rid, typeDef);
+      }
+      for (const property of this.propertiesOf(typeDef)) {
+        properties.set(property.rid, typeDef);
+      }
+    }
+    return new Map([
+      [MonoMetaTable.MONO_TABLE_METHOD, methods],
+      [MonoMetaTable.MONO_TABLE_FIELD, fields],
+      [MonoMetaTable.MONO_TABLE_PROPERTY, properties],
+    ]);
+  }
+
+  /** Nested TypeDef token -> enclosing TypeDef token. */
+  @lazy
+  get nestedClasses(): Map<number, number> {
+    if (this.seeded) {
+      return this.seeded.nestedClasses;
+    }
+    const result = new Map<number, number>();
+    const nested = this.table(MonoMetaTable.MONO_TABLE_NESTEDCLASS);
+    if (!nested) {
+      return result;
+    }
+    for (let rid = 1; rid <= nested.rows; rid += 1) {
+      const [nestedRid, enclosingRid] = nested.row(rid);
+      result.set(
+        makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, nestedRid),
+        makeMetadataToken(MonoMetaTable.MONO_TABLE_TYPEDEF, enclosingRid),
+      );
+    }
+    return result;
+  }
+
+  /** TypeDef row id -> Property row range, from the PropertyMap table. */
+  @lazy
+  get propertyRanges(): Map<number, MetadataRowRange> {
+    if (this.seeded) {
+      return this.seeded.propertyRanges;
+    }
+    const result = new Map<number, MetadataRowRange>();
+    const map = this.table(MonoMetaTable.MONO_TABLE_PROPERTYMAP);
+    if (!map) {
+      return result;
+    }
+    const propertyEnd = this.rowCount(MonoMetaTable.MONO_TABLE_PROPERTY) + 1;
+    for (let rid = 1; rid <= map.rows; rid += 1) {
+      const [parent, start] = map.row(rid);
+      const end = rid < map.rows ? map.cell(rid + 1, 1) : propertyEnd;
+      result.set(parent, { start, end });
+    }
+    return result;
+  }
+
+  /** TypeDef lookup by token. */
+  typeDef(token: number): MetadataTypeDef | null {
+    const rid = token & 0x00ffffff;
+    return this.typeDefs[rid - 1] ?? null;
+  }
+
+  /** Methods declared by a type. */
+  methodsOf(typeDef: MetadataTypeDef): MetadataMethodDef[] {
+    return this.sliceMembers(this.methodDefs, typeDef.methods, MonoMetaTable.MONO_TABLE_METHOD_POINTER);
+  }
+
+  /** Fields declared by a type. */
+  fieldsOf(typeDef: MetadataTypeDef): MetadataFieldDef[] {
+    return this.sliceMembers(this.fieldDefs, typeDef.fields, MonoMetaTable.MONO_TABLE_FIELD_POINTER);
+  }
+
+  /** Properties declared by a type. */
+  propertiesOf(typeDef: MetadataTypeDef): MetadataPropertyDef[] {
+    const range = this.propertyRanges.get(typeDef.rid);
+    if (!range) {
+      return [];
+    }
+    return this.sliceMembers(this.propertyDefs, range, MonoMetaTable.MONO_TABLE_PROPERTY_POINTER);
+  }
+
+  /**
+   * Resolve a member range, going through the *Pointer indirection table when
+   * the image uses uncompressed (#-) metadata.
+   */
+  private sliceMembers<T>(rows: T[], range: MetadataRowRange, pointerTable: number): T[] {
+    const indirection = this.rowCount(pointerTable) > 0 ? this.table(pointerTable) : null;
+    const result: T[] = [];
+    for (let index = range.start; index < range.end; index += 1) {
+      const rid = indirection ? indirection.cell(index, 0) : index;
+      const row = rows[rid - 1];
+      if (row !== undefined) {
+        result.push(row);
+      }
+    }
+    return result;
+  }
+}
@@ -4,7 +4,7 @@
  * Provides utilities for discovering the Mono runtime in a process:
  * - Automatic detection by common module names
  * - Export-based heuristic detection
- * - Async waiting for delayed module loading
+ * - Async waiting for delayed module loading (module observer, polling fallback)
  * - Manual module name specification
  *
  * @module runtime/module
@@ -41,7 +41,7 @@ export interface MonoModuleWaitOptions {
   timeoutMs: number;
   /** Time before logging a warning (milliseconds) */
   warnAfterMs: number;
-  /** Polling interval (milliseconds, default: 50) */
+  /** Polling interval when module observers are unavailable (milliseconds, default: 50) */
   pollIntervalMs?: number;
 }
 
@@ -161,6 +161,11 @@ export function tryFindMonoModuleWithDetails(moduleName?: string | string[]): Mo
 /**
  * Try to wait for the Mono module to load without throwing.
  *
+ * Discovery is event driven: a module observer checks each newly loaded module
+ * against the candidate names and probe exports, and the promise resolves as
+ * soon as Mono's image is mapped. Falls back to polling `enumerateModules()`
+ * when `Process.attachModuleObserver` is unavailable.
+ *
  * @param options Wait options
  * @returns MonoModuleInfo if found within timeout, null on timeout
  *
@@ -176,28 +181,10 @@ export function tryFindMonoModuleWithDetails(moduleName?: string | string[]): Mo
  * ```
  */
 export async function tryWaitForMonoModule(options: MonoModuleWaitOptions): Promise<MonoModuleInfo | null> {
-  const pollIntervalMs = options.pollIntervalMs ?? 50;
-  const deadline = Date.now() + options.timeoutMs;
-  const warnAt = Date.now() + options.warnAfterMs;
-  let didWarn = false;
-
-  while (Date.now() < deadline) {
-    const moduleInfo = tryFindMonoModule(options.moduleName);
-    if (moduleInfo) {
-      return moduleInfo;
-    }
-
-    if (!didWarn && Date.now() >= warnAt) {
-      didWarn = true;
-      const candidates = normalizeCandidates(options.moduleName);
-      const hint = candidates.length > 0 ? ` (candidates: ${candidates.join(", ")})` : "";
-      console.warn(`[Mono] Waiting for Mono module to load${hint}...`);
-    }
-
-    await delay(pollIntervalMs);
+  if (typeof Process.attachModuleObserver !== "function") {
+    return await pollForMonoModule(options);
   }
-
-  return null;
+  return await observeMonoModule(options);
 }
 
 /**
@@ -306,6 +293,105 @@ export function getCommonModuleNames(): readonly string[] {
 // INTERNAL HELPERS
 // ============================================================================
 
+function observeMonoModule(options: MonoModuleWaitOptions): Promise<MonoModuleInfo | null> {
+  const candidates = normalizeCandidates(options.moduleName);
+
+  return new Promise(resolve => {
+    let settled = false;
+    let observer: ModuleObserver | null = null;
+    let warnTimer: ReturnType<typeof setTimeout> | null = null;
+    let deadlineTimer: ReturnType<typeof setTimeout> | null = null;
+
+    const finish = (moduleInfo: MonoModuleInfo | null): void => {
+      if (settled) {
+        return;
+      }
+      settled = true;
+      if (warnTimer !== null) clearTimeout(warnTimer);
+      if (deadlineTimer !== null) clearTimeout(deadlineTimer);
+      // Detach outside the observer callback, which runs under the loader lock
+      setTimeout(() => observer?.detach(), 0);
+      resolve(moduleInfo);
+    };
+
+    observer = Process.attachModuleObserver({
+      onAdded(mod) {
+        if (!settled) {
+          const moduleInfo = findAmongModules([mod], candidates);
+          if (moduleInfo) {
+            finish(moduleInfo);
+          }
+        }
+      },
+    });
+
+    // Catch modules mapped before the observer was attached
+    if (!settled) {
+      const existing = findAmongModules(Process.enumerateModules(), candidates);
+      if (existing) {
+        finish(existing);
+      }
+    }
+
+    if (!settled) {
+      warnTimer = setTimeout(() => {
+        const hint = candidates.length > 0 ? ` (candidates: ${candidates.join(", ")})` : "";
+        console.warn(`[Mono] Waiting for Mono module to load${hint}...`);
+      }, options.warnAfterMs);
+      deadlineTimer = setTimeout(() => finish(null), options.timeoutMs);
+    }
+  });
+}
+
+async function pollForMonoModule(options: MonoModuleWaitOptions): Promise<MonoModuleInfo | null> {
+  const pollIntervalMs = options.pollIntervalMs ?? 50;
+  const deadline = Date.now() + options.timeoutMs;
+  const warnAt = Date.now() + options.warnAfterMs;
+  let didWarn = false;
+
+  while (Date.now() < deadline) {
+    const moduleInfo = tryFindMonoModule(options.moduleName);
+    if (moduleInfo) {
+      return moduleInfo;
+    }
+
+    if (!didWarn && Date.now() >= warnAt) {
+      didWarn = true;
+      const candidates = normalizeCandidates(options.moduleName);
+      const hint = candidates.length > 0 ? ` (candidates: ${candidates.join(", ")})` : "";
+      console.warn(`[Mono] Waiting for Mono module to load${hint}...`);
+    }
+
+    await delay(pollIntervalMs);
+  }
+
+  return null;
+}
+
+/**
+ * Cheap discovery over a set of modules: explicit candidates, then common names,
+ * then modules exporting every probe symbol (looked up by name, without
+ * enumerating export tables).
+ */
+function findAmongModules(modules: Module[], candidates: string[]): MonoModuleInfo | null {
+  for (const name of [...candidates, ...COMMON_MODULE_NAMES]) {
+    const moduleInfo = findModuleByName(modules, name);
+    if (moduleInfo) {
+      return normalizeModuleInfo(moduleInfo);
+    }
+  }
+  for (const mod of modules) {
+    try {
+      if (PROBE_EXPORT_NAMES.every(name => mod.findExportByName(name) !== null)) {
+        return normalizeModuleInfo(mod);
+      }
+    } catch (_error) {
+      // Some system modules cannot be queried; ignore
+    }
+  }
+  return null;
+}
+
 function findModuleByName(modules: Module[], name: string): Module | undefined {
   return modules.find(m => m.name === name || m.path.endsWith(`/${name}`) || m.path.endsWith(`\\${name}`));
 }
@@ -17,12 +17,13 @@ import type { MonoApi } from "./api";
 
 import type { TypedReadOptions } from "../types";
 import { MonoErrorCodes, raise } from "../utils/errors";
-import { pointerIsNull } from "../utils/memory";
+import { pointerIsNull, scratchAlloc, withScratch } from "../utils/memory";
 
 import { MonoArray } from "../model/array";
 import { MonoDelegate } from "../model/delegate";
 import { MonoObject } from "../model/object";
 import { MonoString } from "../model/string";
+import { getStructCodec, readStruct, writeStruct } from "../model/struct-codec";
 import {
   MonoType,
   MonoTypeKind,
@@ -143,16 +144,46 @@ export function validateNumericValue(value: number, typeName: string): number {
  * NOT a boxed MonoObject*. This function returns the raw storage pointer.
  */
 export function allocPrimitiveValue(type: MonoType, value: number | boolean | bigint): NativePointer {
+  return allocPrimitiveStorage(type, value, Memory.alloc);
+}
+
+/**
+ * Like `allocPrimitiveValue`, but takes the storage from the current scratch scope.
+ * The pointer is only valid until the enclosing `withScratch()` scope ends.
+ *
+ * @internal
+ */
+export function allocScratchPrimitiveValue(type: MonoType, value: number | boolean | bigint): NativePointer {
+  return allocPrimitiveStorage(type, value, scratchAlloc);
+}
+
+function allocPrimitiveStorage(
+  type: MonoType,
+  value: number | boolean | bigint,
+  alloc: (size: number) => NativePointer,
+): NativePointer {
   const effectiveType = resolveUnderlyingPrimitive(type);
-  const kind = effectiveType.kind;
   const { size } = effectiveType.valueSize;
-  const storageSize = Math.max(size, Process.pointerSize);
-  const storage = Memory.alloc(storageSize);
+  const storage = alloc(Math.max(size, Process.pointerSize));
+  writePrimitiveArgument(storage, effectiveType.kind, value);
+  return storage;
+}
 
+/**
+ * Write a JS primitive into argument storage for the given (already resolved) kind.
+ *
+ * Shared by `allocPrimitiveValue` and compiled invokers, which reuse a
+ * preallocated storage slot per parameter instead of allocating per call.
+ */
+export function writePrimitiveArgument(
+  storage: NativePointer,
+  kind: MonoTypeKind,
+  value: number | boolean | bigint,
+): void {
   // Handle boolean specially to ensure proper type conversion
   if (kind === MonoTypeKind.Boolean) {
     storage.writeU8(value ? 1 : 0);
-    return storage;
+    return;
   }
 
   // Handle bigint specially for 64-bit types
@@ -165,18 +196,17 @@ export function allocPrimitiveValue(type: MonoType, value: number | boolean | bi
       // Best-effort truncate
       storage.writeS64(int64(value.toString()));
     }
-    return storage;
+    return;
   }
 
   // Use unified primitive write for all other cases
   if (isPrimitiveKind(kind) || kind === MonoTypeKind.Char) {
     writePrimitiveValue(storage, kind, value);
-    return storage;
+    return;
   }
 
   // Fallback - write as pointer-sized value
   storage.writeS32(value as number);
-  return storage;
 }
 
 /**
@@ -218,6 +248,11 @@ export function unboxValue(
     return null;
   }
 
+  // Nullable<T> is boxed as T: unbox using the runtime class of the box
+  if (type.isNullable) {
+    return unboxValue(api, boxedPtr, new MonoObject(api, boxedPtr).class.type, options);
+  }
+
   const unboxed = api.native.mono_object_unbox(boxedPtr);
   const kind = type.kind;
 
@@ -239,7 +274,10 @@ export function unboxValue(
 
     case MonoTypeKind.ValueType:
     case MonoTypeKind.GenericInstance:
-      // Structs: either return pointer to unboxed data or keep the boxed object.
+      // Structs: decode, return pointer to unboxed data or keep the boxed object.
+      if (options.decodeStructs && type.class) {
+        return readStruct(getStructCodec(type.class), unboxed);
+      }
       if (options.structAsObject) {
         return new MonoObject(api, boxedPtr);
       }
@@ -306,6 +344,9 @@ export function readTypedValue(
   if (kind === MonoTypeKind.GenericInstance) {
     if (monoType.valueType) {
       // Value type is inlined.
+      if (options.decodeStructs && monoType.class) {
+        return readStruct(getStructCodec(monoType.class), storagePtr);
+      }
       return storagePtr;
     }
     const objPtr = storagePtr.readPointer();
@@ -314,8 +355,11 @@ export function readTypedValue(
     return new Ctor(api, objPtr);
   }
 
-  // Value type: return pointer to inlined data.
+  // Value type: decode or return pointer to inlined data.
   if (kind === MonoTypeKind.ValueType) {
+    if (options.decodeStructs && monoType.class) {
+      return readStruct(getStructCodec(monoType.class), storagePtr);
+    }
     return storagePtr;
   }
 
@@ -396,6 +440,8 @@ export function writeTypedValue(api: MonoApi, storagePtr: NativePointer, value:
       if (value instanceof NativePointer) {
         const size = monoType.valueSize.size;
         Memory.copy(storagePtr, value, size);
+      } else if (typeof value === "object" && !(value instanceof MonoObject) && monoType.class) {
+        writeStruct(monoType.class, storagePtr, value);
       }
       return;
     }
@@ -411,6 +457,8 @@ export function writeTypedValue(api: MonoApi, storagePtr: NativePointer, value:
     if (value instanceof NativePointer) {
       const size = monoType.valueSize.size;
       Memory.copy(storagePtr, value, size);
+    } else if (typeof value === "object" && !(value instanceof MonoObject) && monoType.class) {
+      writeStruct(monoType.class, storagePtr, value);
     }
     return;
   }
@@ -440,8 +488,8 @@ export function boxPrimitiveValue(
   value: number | boolean | bigint,
   domain: NativePointer = api.getRootDomain(),
 ): NativePointer {
-  const storage = allocPrimitiveValue(type, value);
-  return api.native.mono_value_box(domain, klassPtr, storage);
+  // mono_value_box copies the value, so the storage can be released right away
+  return withScratch(() => api.native.mono_value_box(domain, klassPtr, allocScratchPrimitiveValue(type, value)));
 }
 
 /**
@@ -30,6 +30,7 @@ import { boxPrimitiveValue, boxValueTypePtr, readTypedValue, writeTypedValue } f
 import type { GC, ICall, MemoryReadOptions, MemorySubsystem, MemoryType, Trace, TypedReadOptions } from "./types";
 import { MonoErrorCodes, raise } from "./utils/errors";
 import { pointerIsNull } from "./utils/memory";
+import type { TimeSliceOptions } from "./utils/time-slice";
 
 export function buildGCSubsystem(gc: GarbageCollector): GC {
   return {
@@ -170,6 +171,8 @@ export function buildTraceSubsystem(tracer: Tracer): Trace {
     classAll: (k: MonoClass, cb: MethodCallbacks) => tracer.classAll(k, cb),
     methodsByPattern: (pattern: string, callbacks: MethodCallbacks) => tracer.methodsByPattern(pattern, callbacks),
     classesByPattern: (pattern: string, callbacks: MethodCallbacks) => tracer.classesByPattern(pattern, callbacks),
+    classesByPatternAsync: (pattern: string, callbacks: MethodCallbacks, options?: TimeSliceOptions) =>
+      tracer.classesByPatternAsync(pattern, callbacks, options),
     replaceReturnValue: (m: MonoMethod, r: ReturnValueReplacer) => tracer.replaceReturnValue(m, r),
     tryReplaceReturnValue: (m: MonoMethod, r: ReturnValueReplacer) => tracer.tryReplaceReturnValue(m, r),
     field: (f: MonoField, cb: FieldAccessCallbacks) => tracer.field(f, cb),
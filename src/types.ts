@@ -34,6 +34,13 @@ export interface Config {
    * @default 512
    */
   pinnedStringCacheCapacity?: number;
+
+  /**
+   * Maximum number of interned metadata wrappers (classes, methods, fields, ...)
+   * retained per handle kind before LRU eviction.
+   * @default 4096
+   */
+  handleCacheCapacity?: number;
 }
 
 export type MemoryType =
@@ -301,6 +308,11 @@ export interface Trace {
   classAll(klass: import("./model/class").MonoClass, callbacks: import("./model/trace").MethodCallbacks): () => void;
   methodsByPattern(pattern: string, callbacks: import("./model/trace").MethodCallbacks): () => void;
   classesByPattern(pattern: string, callbacks: import("./model/trace").MethodCallbacks): () => void;
+  classesByPatternAsync(
+    pattern: string,
+    callbacks: import("./model/trace").MethodCallbacks,
+    options?: import("./utils/time-slice").TimeSliceOptions,
+  ): Promise<() => void>;
   replaceReturnValue(
     monoMethod: import("./model/method").MonoMethod,
     replacement: (originalRetval: NativePointer, thisPtr: NativePointer, args: NativePointer[]) => NativePointer | void,
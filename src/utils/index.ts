@@ -14,3 +14,4 @@ export * from "./log";
 
 // Infrastructure utilities
 export * from "./cache";
+export * from "./time-slice";
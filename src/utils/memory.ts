@@ -3,13 +3,15 @@
  *
  * Provides:
  * - Pointer type guards and resolution
- * - Pointer array allocation
+ * - Pointer array allocation and pooling
+ * - Per-thread scratch arenas for short-lived temporaries
  * - Instance unwrapping for Mono objects
  * - Memory address validation
  *
  * @module utils/memory
  */
 
+import { LruCache } from "./cache";
 import { MonoErrorCodes, raise, raiseFrom } from "./errors";
 
 const POINTER_SIZE = Process.pointerSize;
@@ -59,6 +61,228 @@ export function allocPointerArray(items: NativePointer[]): NativePointer {
   return buffer;
 }
 
+/**
+ * Size-classed pool of reusable pointer arrays.
+ *
+ * Buffers are grouped by power-of-two slot count so a request for 3 slots
+ * reuses a 4-slot buffer. Acquire/release must be balanced; a buffer handed
+ * out is never given to another caller until it is released, so nested
+ * (re-entrant) use on the same thread is safe.
+ */
+export class PointerArrayPool {
+  private readonly freeLists = new Map<number, NativePointer[]>();
+
+  /**
+   * @param maxPooledSlots Largest slot count served from the pool; bigger requests allocate directly
+   * @param maxFreePerClass Maximum number of idle buffers kept per size class
+   */
+  constructor(
+    private readonly maxPooledSlots = 16,
+    private readonly maxFreePerClass = 8,
+  ) {}
+
+  /**
+   * Acquire a buffer holding the given pointers.
+   * @returns Buffer pointer, or NULL for an empty list
+   */
+  acquire(items: readonly NativePointer[]): NativePointer {
+    const count = items.length;
+    if (count === 0) {
+      return NULL;
+    }
+    const buffer = this.acquireSlots(count);
+    for (let index = 0; index < count; index += 1) {
+      buffer.add(index * POINTER_SIZE).writePointer(items[index] ?? NULL);
+    }
+    return buffer;
+  }
+
+  /**
+   * Acquire a single pointer slot initialised to NULL (e.g. an exception out-param).
+   */
+  acquireSlot(): NativePointer {
+    const slot = this.acquireSlots(1);
+    slot.writePointer(NULL);
+    return slot;
+  }
+
+  /**
+   * Return a buffer obtained from `acquire()`/`acquireSlot()` to the pool.
+   * @param buffer Buffer to release (NULL is ignored)
+   * @param count Slot count the buffer was acquired with
+   */
+  release(buffer: NativePointer, count: number): void {
+    if (count === 0 || buffer.isNull()) {
+      return;
+    }
+    const sizeClass = sizeClassFor(count);
+    if (sizeClass > this.maxPooledSlots) {
+      return;
+    }
+    let free = this.freeLists.get(sizeClass);
+    if (!free) {
+      free = [];
+      this.freeLists.set(sizeClass, free);
+    }
+    if (free.length < this.maxFreePerClass) {
+      free.push(buffer);
+    }
+  }
+
+  /** Drop all idle buffers so Frida can reclaim them. */
+  clear(): void {
+    this.freeLists.clear();
+  }
+
+  private acquireSlots(count: number): NativePointer {
+    const sizeClass = sizeClassFor(count);
+    if (sizeClass > this.maxPooledSlots) {
+      return Memory.alloc(count * POINTER_SIZE);
+    }
+    const pooled = this.freeLists.get(sizeClass)?.pop();
+    return pooled ?? Memory.alloc(sizeClass * POINTER_SIZE);
+  }
+}
+
+function sizeClassFor(count: number): number {
+  let sizeClass = 1;
+  while (sizeClass < count) {
+    sizeClass <<= 1;
+  }
+  return sizeClass;
+}
+
+// ============================================================================
+// SCRATCH ARENA
+// ============================================================================
+
+/** Size of each arena chunk in bytes */
+const SCRATCH_CHUNK_SIZE = 4096;
+/** Alignment of every scratch allocation */
+const SCRATCH_ALIGNMENT = 16;
+/** Maximum number of threads whose scratch arenas are retained */
+const SCRATCH_ARENA_LIMIT = 64;
+
+/**
+ * Bump allocator for short-lived native temporaries (out-params, value
+ * storage, argument slots).
+ *
+ * Allocations are carved from retained chunks and released together when the
+ * enclosing `scope()` returns, so hot paths do not create a GC-tracked
+ * `Memory.alloc` block per call. When the outermost scope exits, chunks beyond
+ * the first are dropped, so a burst of large temporaries is not kept alive. Scopes nest: each one restores the bump
+ * position it started from. Outside any scope `alloc()` falls back to
+ * `Memory.alloc`, so memory handed out there stays valid for as long as the
+ * caller holds it.
+ *
+ * Scratch memory is not zeroed and must not be kept past the scope that
+ * allocated it.
+ */
+export class ScratchArena {
+  private readonly chunks: NativePointer[] = [];
+  private chunkIndex = 0;
+  private offset = 0;
+  private depth = 0;
+
+  /**
+   * @param chunkSize Bytes per chunk; larger requests are served by `Memory.alloc`
+   */
+  constructor(private readonly chunkSize = SCRATCH_CHUNK_SIZE) {}
+
+  /** Whether a scope is open, i.e. allocations are released on scope exit */
+  get active(): boolean {
+    return this.depth > 0;
+  }
+
+  /**
+   * Allocate `size` bytes, aligned to 16 bytes.
+   */
+  alloc(size: number): NativePointer {
+    const aligned = (size + SCRATCH_ALIGNMENT - 1) & ~(SCRATCH_ALIGNMENT - 1);
+    if (this.depth === 0 || aligned > this.chunkSize) {
+      return Memory.alloc(size);
+    }
+    if (this.offset + aligned > this.chunkSize) {
+      this.chunkIndex += 1;
+      this.offset = 0;
+    }
+    if (this.chunkIndex === this.chunks.length) {
+      this.chunks.push(Memory.alloc(this.chunkSize));
+    }
+    const pointer = this.chunks[this.chunkIndex].add(this.offset);
+    this.offset += aligned;
+    return pointer;
+  }
+
+  /**
+   * Run `body` in a scope; everything allocated inside is released when it returns.
+   *
+   * Only the synchronous part of `body` is covered: allocations made after an
+   * `await` inside an async `body` use `Memory.alloc`.
+   */
+  scope<T>(body: () => T): T {
+    const chunkIndex = this.chunkIndex;
+    const offset = this.offset;
+    this.depth += 1;
+    try {
+      return body();
+    } finally {
+      this.depth -= 1;
+      this.chunkIndex = chunkIndex;
+      this.offset = offset;
+      this.trim();
+    }
+  }
+
+  /** Release retained chunks beyond the first; no-op while a scope is open. */
+  trim(): void {
+    if (this.depth === 0) {
+      this.chunks.length = Math.min(this.chunks.length, 1);
+    }
+  }
+}
+
+const scratchArenas = new LruCache<number, ScratchArena>(SCRATCH_ARENA_LIMIT);
+
+/**
+ * Get the scratch arena of the calling thread.
+ *
+ * Native calls release the JS lock, so other threads may run agent code while
+ * a scope is open; each thread therefore bumps its own arena. Arenas of the
+ * least recently active threads are dropped so thread churn cannot grow the
+ * set without bound; a scope still open on a dropped arena keeps using it.
+ */
+export function getScratchArena(): ScratchArena {
+  return scratchArenas.getOrCreate(Process.getCurrentThreadId(), () => new ScratchArena());
+}
+
+/**
+ * Allocate a temporary from the calling thread's scratch arena.
+ * Falls back to `Memory.alloc` when no scratch scope is open.
+ */
+export function scratchAlloc(size: number): NativePointer {
+  return getScratchArena().alloc(size);
+}
+
+/**
+ * Drop the scratch arenas of all threads (called from `Mono.dispose()`).
+ */
+export function clearScratchArenas(): void {
+  scratchArenas.clear();
+}
+
+/**
+ * Run `body` in a scratch scope on the calling thread's arena.
+ *
+ * @example
+ * ```typescript
+ * const total = withScratch(() => players.reduce((sum, p) => sum + healthField.getTypedValue(p), 0));
+ * ```
+ */
+export function withScratch<T>(body: () => T): T {
+  return getScratchArena().scope(body);
+}
+
 // ============================================================================
 // POINTER UTILITIES
 // ============================================================================
@@ -327,6 +551,12 @@ export function safeWriteMemory(pointer: NativePointer, data: ArrayBuffer | numb
 // MONO HANDLE ENUMERATION
 // ============================================================================
 
+/**
+ * Iterator state slots. Pooled rather than taken from the scratch arena:
+ * a lazy iteration can outlive the scope it was started in.
+ */
+const iteratorSlots = new PointerArrayPool(1, 16);
+
 /**
  * Lazy generator for Mono handle enumeration.
  * Creates wrapper objects on-demand as you iterate, reducing memory usage
@@ -357,17 +587,21 @@ export function* iterateMonoHandles<T>(
   // Mono iteration functions (e.g., mono_class_get_methods) expect a pointer
   // to a gpointer that they update in-place to track iteration state.
   // Initialize with NULL to signal "start from beginning".
-  const iterator = Memory.alloc(Process.pointerSize);
-  iterator.writePointer(NULL);
+  const iterator = iteratorSlots.acquireSlot();
 
   // Iterate until fetch returns NULL (end of enumeration).
   // The fetch function updates the iterator pointer in-place for the next iteration.
-  while (true) {
-    const handle = fetch(iterator);
-    if (pointerIsNull(handle)) {
-      break;
+  // The slot goes back to the pool on completion or early exit (break/return).
+  try {
+    while (true) {
+      const handle = fetch(iterator);
+      if (pointerIsNull(handle)) {
+        break;
+      }
+      yield factory(handle);
     }
-    yield factory(handle);
+  } finally {
+    iteratorSlots.release(iterator, 1);
   }
 }
 
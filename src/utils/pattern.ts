@@ -1,3 +1,4 @@
+import { LruCache } from "./cache";
 import { MonoErrorCodes, raise } from "./errors";
 
 /**
@@ -37,11 +38,89 @@ export function createMatcher(pattern: string, options: PatternMatchOptions = {}
   return wildcardToRegex(pattern, caseInsensitive);
 }
 
+/**
+ * A compiled pattern, reusable across any number of names.
+ */
+export interface PatternMatcher {
+  /** Source pattern */
+  readonly pattern: string;
+  /** Test a name against the pattern */
+  test(name: string): boolean;
+}
+
+/** Maximum number of compiled patterns kept by `compilePattern` */
+const COMPILED_PATTERN_CACHE_SIZE = 256;
+
+const compiledPatterns = new LruCache<string, PatternMatcher>(COMPILED_PATTERN_CACHE_SIZE);
+
+/**
+ * Compile a wildcard or regex pattern into a reusable matcher.
+ *
+ * Wildcard patterns whose only `*` are at the ends (`Foo`, `Foo*`, `*Foo`,
+ * `*Foo*`) are matched with plain string comparisons; everything else goes
+ * through a single `RegExp`. Compiled matchers are cached by pattern and options.
+ *
+ * @example
+ * ```typescript
+ * const matcher = compilePattern("*Manager");
+ * const managers = names.filter(name => matcher.test(name));
+ * ```
+ */
+export function compilePattern(pattern: string, options: PatternMatchOptions = {}): PatternMatcher {
+  const caseInsensitive = options.caseInsensitive !== false;
+  const key = `${options.regex ? "r" : "w"}${caseInsensitive ? "i" : "s"}:${pattern}`;
+  return compiledPatterns.getOrCreate(key, () => buildMatcher(pattern, options.regex === true, caseInsensitive));
+}
+
+function buildMatcher(pattern: string, regex: boolean, caseInsensitive: boolean): PatternMatcher {
+  // "" and "*" match everything in both modes, as `matchesPattern` always did
+  if (pattern === "" || /^\*+$/.test(pattern)) {
+    return { pattern, test: () => true };
+  }
+  if (!regex) {
+    const simple = buildSimpleMatcher(pattern, caseInsensitive);
+    if (simple) {
+      return { pattern, test: simple };
+    }
+  }
+  const compiled = createMatcher(pattern, { regex, caseInsensitive });
+  return { pattern, test: name => compiled.test(name) };
+}
+
+/**
+ * Build a string-comparison matcher for exact/prefix/suffix/contains wildcards.
+ * Returns null when the pattern needs a regex.
+ */
+function buildSimpleMatcher(pattern: string, caseInsensitive: boolean): ((name: string) => boolean) | null {
+  if (pattern.includes("?")) {
+    return null;
+  }
+
+  const leading = pattern.startsWith("*");
+  const trailing = pattern.endsWith("*");
+  const needle = pattern.slice(leading ? 1 : 0, trailing ? -1 : undefined);
+  if (needle.includes("*")) {
+    return null;
+  }
+
+  const target = caseInsensitive ? needle.toLowerCase() : needle;
+  const normalize = caseInsensitive ? (name: string) => name.toLowerCase() : (name: string) => name;
+  if (leading && trailing) {
+    return name => normalize(name).includes(target);
+  }
+  if (leading) {
+    return name => normalize(name).endsWith(target);
+  }
+  if (trailing) {
+    return name => normalize(name).startsWith(target);
+  }
+  return name => normalize(name) === target;
+}
+
 export function matchesPattern(name: string, pattern: string, options: PatternMatchOptions = {}): boolean {
   if (pattern === "*" || pattern === "") {
     return true;
   }
 
-  const regex = createMatcher(pattern, options);
-  return regex.test(name);
+  return compilePattern(pattern, options).test(name);
 }
@@ -0,0 +1,85 @@
+/**
+ * Time-sliced iteration for long-running scans.
+ *
+ * Drives a (usually lazy) iterable in bounded time slices and yields to the
+ * Frida event loop between slices, so large domain-wide queries do not block
+ * the host thread for seconds at a time.
+ *
+ * @module utils/time-slice
+ */
+
+/** Default time budget per slice (ms) */
+export const DEFAULT_SLICE_BUDGET_MS = 8;
+
+/**
+ * Progress report passed to `onProgress` after each slice.
+ */
+export interface TimeSliceProgress {
+  /** Work items processed so far */
+  processed: number;
+  /** Total work items, when known up front */
+  total?: number;
+  /** Wall-clock time since the scan started (ms) */
+  elapsedMs: number;
+}
+
+/**
+ * Options for time-sliced operations.
+ */
+export interface TimeSliceOptions {
+  /** Maximum time spent per slice before yielding (ms, default: 8) */
+  budgetMs?: number;
+  /** Called after each slice and once on completion */
+  onProgress?: (progress: TimeSliceProgress) => void;
+}
+
+/**
+ * Yield to the event loop so pending messages, timers and RPC calls can run.
+ */
+export function yieldToEventLoop(): Promise<void> {
+  return new Promise<void>(resolve => setTimeout(resolve, 0));
+}
+
+/**
+ * Visit every item of an iterable, pausing whenever a slice exceeds its budget.
+ *
+ * @param source Items to visit; pulled lazily, one at a time
+ * @param visit Called for each item; return `false` to stop early
+ * @param options Slice budget and progress reporting
+ * @param total Total item count for progress reports, if known
+ * @returns Number of items visited
+ *
+ * @example
+ * ```typescript
+ * const names: string[] = [];
+ * await runInSlices(domain.assemblies, asm => { names.push(asm.name); }, { budgetMs: 4 });
+ * ```
+ */
+export async function runInSlices<T>(
+  source: Iterable<T>,
+  visit: (item: T) => boolean | void,
+  options: TimeSliceOptions = {},
+  total?: number,
+): Promise<number> {
+  const budgetMs = Math.max(1, options.budgetMs ?? DEFAULT_SLICE_BUDGET_MS);
+  const onProgress = options.onProgress;
+  const startedAt = Date.now();
+  let sliceStart = startedAt;
+  let processed = 0;
+
+  for (const item of source) {
+    processed++;
+    if (visit(item) === false) {
+      break;
+    }
+    const now = Date.now();
+    if (now - sliceStart >= budgetMs) {
+      onProgress?.({ processed, total, elapsedMs: now - startedAt });
+      await yieldToEventLoop();
+      sliceStart = Date.now();
+    }
+  }
+
+  onProgress?.({ processed, total, elapsedMs: Date.now() - startedAt });
+  return processed;
+}
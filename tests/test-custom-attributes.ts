@@ -321,5 +321,29 @@ export async function createCustomAttributeTests(): Promise<TestResult[]> {
     }),
   );
 
+  // ===== ATTRIBUTE INDEX TESTS =====
+
+  results.push(
+    await withDomain("Image.customAttributeIndex finds owners without walking members", ({ domain }) => {
+      const image = domain.assembly("mscorlib").image;
+      const index = image.customAttributeIndex;
+
+      const obsolete = index.find("Obsolete");
+      if (obsolete.length === 0) {
+        skipTest("mscorlib has no [Obsolete] members");
+      }
+      assert(obsolete.every(a => a.type === "System.ObsoleteAttribute"), "Short names should resolve to the full type");
+      assert(index.find("System.ObsoleteAttribute").length === obsolete.length, "Full and short lookups should agree");
+
+      const decoded = index.decode(obsolete[0]);
+      assert(decoded.type === "System.ObsoleteAttribute", "Decoded attribute should keep its type");
+      assert(index.decode(obsolete[0]) === decoded, "Decoded attributes should be cached");
+
+      const owners = image.findMembersWithAttribute("ObsoleteAttribute");
+      assert(owners.length > 0, "Owners should resolve to model objects");
+      console.log(`  [INFO] ${owners.length} [Obsolete] members, first: ${index.ownerName(obsolete[0].owner)}`);
+    }),
+  );
+
   return results;
 }
@@ -11,6 +11,7 @@ import {
   isValidPointer,
   pointerIsNull,
   safeAlloc,
+  ScratchArena,
   unwrapInstance,
   unwrapInstanceRequired,
 } from "../src/utils/memory";
@@ -100,6 +101,26 @@ export async function createIntegrationTests(): Promise<TestResult> {
     }),
   );
 
+  suite.addResult(
+    createStandaloneTest("ScratchArena should reuse memory across scopes", () => {
+      const arena = new ScratchArena(64);
+      const first = arena.scope(() => arena.alloc(8));
+      const second = arena.scope(() => arena.alloc(8));
+      assert(first.equals(second), "Scopes should release their allocations on exit");
+
+      arena.scope(() => {
+        const outer = arena.alloc(8);
+        const inner = arena.scope(() => arena.alloc(8));
+        assert(!outer.equals(inner), "Nested scopes should not reuse live outer allocations");
+        assert(arena.alloc(8).equals(inner), "Inner scope memory should be reused after it exits");
+        assert(!arena.alloc(128).isNull(), "Oversized requests should still be served");
+      });
+
+      assert(!arena.active, "Arena should be idle outside scopes");
+      assert(!arena.alloc(8).equals(first), "Allocations outside a scope should not come from the arena");
+    }),
+  );
+
   // ============================================================================
   // MONO-DEPENDENT UTILITIES TESTS
   // ============================================================================
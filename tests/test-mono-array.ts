@@ -1063,5 +1063,42 @@ export async function createMonoArrayTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoArray - struct elements round-trip through the struct codec", ({ domain }) => {
+      const guidClass = domain.tryClass("System.Guid");
+      assertNotNull(guidClass, "System.Guid should be available");
+      const arr = Mono.array.new<Record<string, unknown>>(guidClass, 3);
+      const first = guidClass.layout.fields[0].name;
+
+      arr.setTyped(1, { [first]: 7 });
+      const decoded = arr.readStructs();
+      assert(decoded.length === 3, "All elements should be decoded");
+      assert(decoded[1][first] === 7, "Encoded member should be read back");
+      assert(decoded[0][first] === 0, "Other elements should be untouched");
+      assert(arr.readStructs(1, 1)[0][first] === 7, "Partial ranges should decode from the start index");
+    }),
+  );
+
+  results.push(
+    await withDomain("MonoArray - struct string members survive a GC after the write", ({ domain }) => {
+      const pairClass = domain.tryClass("System.Collections.Generic.KeyValuePair`2");
+      const stringClass = domain.tryClass("System.String");
+      const pairOfStrings = pairClass?.makeGenericType([stringClass!, stringClass!]);
+      if (!pairOfStrings) {
+        console.log("    KeyValuePair<string, string> not available (optional)");
+        return;
+      }
+      const [keyName, valueName] = pairOfStrings.layout.fields.map(entry => entry.name);
+      const arr = Mono.array.new<Record<string, unknown>>(pairOfStrings, 2);
+
+      arr.setTyped(0, { [keyName]: "first-key", [valueName]: "first-value" });
+      Mono.gc.collect();
+
+      const [pair] = arr.readStructs(0, 1);
+      assert(pair[keyName] === "first-key", "First string member should still be readable");
+      assert(pair[valueName] === "first-value", "Second string member should still be readable");
+    }),
+  );
+
   return results;
 }
@@ -544,6 +544,19 @@ export async function createMonoAssemblyTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withAssemblies("Assembly reference graph edges should be symmetric", ({ mscorlib }) => {
+      assertNotNull(mscorlib, "mscorlib should exist");
+
+      for (const dependent of mscorlib!.referencingAssemblies.slice(0, 10)) {
+        assert(
+          dependent.referencedAssemblies.some(ref => ref.pointer.equals(mscorlib!.pointer)),
+          `${dependent.name} should list mscorlib among its references`,
+        );
+      }
+    }),
+  );
+
   results.push(
     await withAssemblies("MonoAssembly.referencingAssemblies should return valid assemblies", ({ mscorlib }) => {
       assertNotNull(mscorlib, "mscorlib should exist");
@@ -82,6 +82,28 @@ export async function createMonoClassTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withCoreClasses("MonoClass should resolve overloads by parameter types", ({ stringClass }) => {
+      const byStrings = stringClass.tryMethod("Concat", ["System.String", "System.String"]);
+      const byObjects = stringClass.tryMethod("Concat", ["System.Object", "System.Object"]);
+      assertNotNull(byStrings, "Should find Concat(String, String)");
+      assertNotNull(byObjects, "Should find Concat(Object, Object)");
+      assert(byStrings !== byObjects, "Same-arity overloads should resolve to different methods");
+      assert(
+        byStrings.parameterTypes.every(t => t.fullName === "System.String"),
+        "Resolved overload should have the requested parameter types",
+      );
+
+      assert(stringClass.overloads("Concat").length > 2, "Concat should have several overloads");
+      assert(
+        stringClass.tryMethod("Concat", ["System.Int32", "System.Int32"]) === null,
+        "Unknown signature should return null",
+      );
+      assert(stringClass.tryField("Empty") !== null, "Index should back field lookup");
+      assert(stringClass.tryProperty("Length") !== null, "Index should back property lookup");
+    }),
+  );
+
   results.push(
     await withCoreClasses("MonoClass should return null for non-existent methods", ({ stringClass }) => {
       const nonExistentMethod = stringClass.tryMethod("NonExistentMethod");
@@ -350,6 +350,128 @@ export async function createMonoDomainTests(): Promise<TestResult> {
     }),
   );
 
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain class index should agree with image lookups", domain => {
+      const mscorlib = domain.tryAssembly("mscorlib");
+      assertNotNull(mscorlib, "mscorlib should be loaded");
+
+      const fromIndex = domain.tryClass("System.String");
+      const fromImage = mscorlib!.image.tryClass("System.String");
+      assertNotNull(fromIndex, "System.String should be indexed");
+      assert(fromIndex!.pointer.equals(fromImage!.pointer), "Index and image lookups should resolve the same class");
+
+      assert(domain.hasClass("System.Object"), "hasClass should use the index");
+      assert(!domain.hasClass("No.Such.Namespace.Type"), "Missing names should not be indexed");
+
+      const generic = domain.getClassesInNamespace("System.Collections.Generic");
+      assert(
+        generic.some(klass => klass.name === "List`1"),
+        "Namespace index should contain System.Collections.Generic.List`1",
+      );
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain class index should resolve nested type names", domain => {
+      const mscorlib = domain.tryAssembly("mscorlib");
+      assertNotNull(mscorlib, "mscorlib should be loaded");
+
+      const fromIndex = domain.tryClass("System.Environment/SpecialFolder");
+      const fromImage = mscorlib!.image.tryClass("System.Environment/SpecialFolder");
+      assertNotNull(fromImage, "Image lookup should resolve the nested type");
+      assertNotNull(fromIndex, "Nested type should be resolved through the index");
+      assert(fromIndex!.pointer.equals(fromImage!.pointer), "Index and image should agree on nested types");
+      assert(domain.hasClass("System.Environment/SpecialFolder"), "hasClass should see nested types");
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain assembly list should be maintained incrementally", domain => {
+      const first = domain.assemblies;
+      const second = domain.assemblies;
+      assert(first === second, "Assembly list should not be re-enumerated");
+
+      const keys = new Set(first.map(asm => asm.pointer.toString()));
+      assert(keys.size === first.length, "Assembly list should not contain duplicates");
+
+      const expected = first.reduce((sum, asm) => sum + asm.image.classCount, 0);
+      assert(domain.totalClassCount === expected, "Total class count should cover every listed assembly");
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain assembly list should pick up assemblies defined at runtime", domain => {
+      const before = domain.assemblies.length;
+      const define = domain
+        .tryClass("System.Reflection.Emit.AssemblyBuilder")
+        ?.tryMethod("DefineDynamicAssembly", [
+          "System.Reflection.AssemblyName",
+          "System.Reflection.Emit.AssemblyBuilderAccess",
+        ]);
+      const nameClass = domain.tryClass("System.Reflection.AssemblyName");
+      if (!define || !nameClass) {
+        console.log("    AssemblyBuilder.DefineDynamicAssembly not available (optional)");
+        return;
+      }
+
+      // Dynamic assemblies never pass through mono_assembly_load_from_full
+      const assemblyName = nameClass.newObject([Mono.api.stringNew("FridaMonoBridgeLoadProbe")]);
+      define.invoke(null, [assemblyName, 1 /* AssemblyBuilderAccess.Run */]);
+
+      const after = domain.assemblies;
+      assert(after.length === before + 1, "Runtime-defined assembly should be appended to the list");
+      assert(after[after.length - 1].name === "FridaMonoBridgeLoadProbe", "Appended assembly should be the probe");
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain search generators should stream and honour limits", domain => {
+      const first = domain.iterClasses("System.*").next();
+      assert(!first.done && first.value.namespace.startsWith("System"), "iterClasses should yield a match lazily");
+
+      const limited = domain.findMethods("System.String.*", { limit: 3 });
+      assert(limited.length === 3, "findMethods should stop at the limit");
+      assert(
+        limited.every(method => method.declaringClass.fullName === "System.String"),
+        "Class part of the pattern should be applied",
+      );
+
+      let seen = 0;
+      for (const _field of domain.iterFields("*", { limit: 5 })) {
+        seen++;
+      }
+      assert(seen === 5, "iterFields should yield exactly limit items");
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain member search should accept regex patterns", domain => {
+      const methods = domain.findMethods("^get_", { regex: true, limit: 3 });
+      assert(methods.length === 3, "Regex findMethods should not reject the implicit class pattern");
+      assert(
+        methods.every(method => method.name.toLowerCase().startsWith("get_")),
+        "Regex member pattern should be applied",
+      );
+    }),
+  );
+
+  await suite.addResultAsync(
+    createDomainTestAsync("Domain async search should match the synchronous result", async domain => {
+      let reports = 0;
+      const asyncResult = await domain.findClassesAsync("System.Collections.Generic.*", {
+        budgetMs: 1,
+        onProgress: () => reports++,
+      });
+      const syncResult = domain.findClasses("System.Collections.Generic.*");
+
+      assert(asyncResult.length === syncResult.length, "Async and sync searches should find the same classes");
+      assert(reports > 0, "Progress should be reported at least once");
+
+      const roots = await domain.rootNamespacesAsync({ budgetMs: 1 });
+      assert(roots.includes("System"), "Async root namespaces should include System");
+    }),
+  );
+
   await suite.addResultAsync(
     createDomainTestAsync("Domain should provide namespace information", domain => {
       // getRootNamespaces can be slow, so we use a timeout wrapper
@@ -81,6 +81,19 @@ export async function createMonoFieldTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withCoreClasses("MonoField should read static fields from cached storage", ({ stringClass }) => {
+      const emptyField = stringClass.tryField("Empty");
+      assertNotNull(emptyField, "String.Empty should exist");
+      assert(emptyField.getTypedStaticValue() === "", "First static read should return the empty string");
+      assert(emptyField.getTypedStaticValue() === "", "Cached static read should return the same value");
+
+      const raw = emptyField.getStaticValue();
+      assert(!raw.isNull(), "Static reference should not be null");
+      assert(raw.equals(emptyField.getStaticValue()), "Repeated raw reads should return the same object");
+    }),
+  );
+
   results.push(
     await withDomain("MonoField should set static field values", ({ domain }) => {
       // Try to find a class with a writable static field
@@ -362,6 +375,40 @@ export async function createMonoFieldTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoField compiled accessors should match typed reads", ({ domain }) => {
+      const listClass = domain.tryClass("System.Collections.ArrayList");
+      assertNotNull(listClass, "ArrayList should be available");
+      const list = listClass.newObject();
+      list.call("Add", [list.pointer]);
+
+      const sizeField = listClass.tryField("_size");
+      const itemsField = listClass.tryField("_items");
+      if (!sizeField || !itemsField) {
+        console.log("  - ArrayList layout differs on this runtime, skipping");
+        return;
+      }
+
+      const size = sizeField.compileAccessor();
+      assert(size === sizeField.compileAccessor(), "Accessor should be cached per field");
+      assert(size.get(list) === sizeField.getTypedValue(list), "Primitive read should match getTypedValue");
+      size.set(list, 1);
+      assert(sizeField.getTypedValue(list) === 1, "Primitive write should be visible to getTypedValue");
+
+      const items = itemsField.compileAccessor();
+      const array = items.get(list) as any;
+      assertNotNull(array, "Reference read should return an object");
+      assert(array.pointer.equals((itemsField.getTypedValue(list) as any).pointer), "Reference read should match");
+      items.set(list, array);
+      assert(items.get(list) !== null, "Reference write should keep the array");
+
+      const staticField = listClass.fields.find(f => f.isStatic);
+      if (staticField) {
+        assertThrows(() => staticField.compileAccessor(), "Static fields should not compile instance accessors");
+      }
+    }),
+  );
+
   // ===== FIELD ATTRIBUTES AND METADATA TESTS =====
 
   results.push(
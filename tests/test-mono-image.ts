@@ -5,6 +5,8 @@
  */
 
 import Mono from "../src";
+import { restoreMetadataSnapshot } from "../src/runtime/metadata-snapshot";
+import { MetadataReader } from "../src/runtime/metadata-tables";
 import { withDomain } from "./test-fixtures";
 import {
   TestResult,
@@ -199,6 +201,62 @@ export async function createMonoImageTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoImage should decode TypeDef rows without loading classes", ({ domain }) => {
+      const mscorlib = domain.tryAssembly("mscorlib");
+
+      const image = mscorlib!.image;
+      assert(image.metadata.available, "Metadata reader should locate the TypeDef table");
+
+      const typeDefs = image.typeDefinitions;
+      assert(typeDefs.length === image.classCount, "TypeDef rows should match class count");
+
+      const stringDef = typeDefs.find(t => t.fullName === "System.String");
+      assertNotNull(stringDef, "System.String should appear in TypeDef rows");
+      const klass = image.classFromTypeDef(stringDef!);
+      assertNotNull(klass, "TypeDef row should resolve to a class");
+      assert(klass!.fullName === "System.String", "Resolved class should match the TypeDef name");
+
+      const methods = image.metadata.methodsOf(stringDef!);
+      assert(
+        methods.some(m => m.name === "Concat"),
+        "MethodDef range of System.String should contain Concat",
+      );
+    }),
+  );
+
+  results.push(
+    await withDomain("MonoImage should round-trip metadata snapshots", ({ domain }) => {
+      const mscorlib = domain.tryAssembly("mscorlib");
+      assertNotNull(mscorlib, "mscorlib should be available");
+      const image = mscorlib!.image;
+
+      const key = image.snapshotKey;
+      assert(key.mvid.length > 0, "Image should report an MVID");
+      assert(key.size > 0, "Image should report a metadata size");
+
+      const snapshot = JSON.parse(JSON.stringify(image.exportMetadataSnapshot()));
+      const reader = new MetadataReader(domain.api, image.pointer);
+      assert(reader.seed(restoreMetadataSnapshot(snapshot)), "Fresh reader should accept seeded rows");
+      assert(reader.isSeeded, "Reader should use the restored rows");
+      assert(reader.typeDefs.length === image.metadata.typeDefs.length, "TypeDef count should survive the round trip");
+
+      const stringDef = reader.typeDefs.find(t => t.fullName === "System.String");
+      assertNotNull(stringDef, "System.String should survive the round trip");
+      assert(
+        reader.methodsOf(stringDef!).some(m => m.name === "Concat"),
+        "Restored MethodDef ranges should still resolve members",
+      );
+
+      assert(!reader.seed(restoreMetadataSnapshot(snapshot)), "Seeding after TypeDef rows are decoded should fail");
+      // Exporting decoded this image's rows, so even a matching snapshot can no longer take effect
+      assert(!image.importMetadataSnapshot(snapshot), "Snapshot should be rejected once rows are decoded");
+      const stale = { ...snapshot, key: { ...snapshot.key, size: key.size + 1 } };
+      assert(!image.importMetadataSnapshot(stale), "Snapshot with a different key should be rejected");
+      assert(!image.importMetadataSnapshot({ format: 0 }), "Malformed snapshot should be rejected");
+    }),
+  );
+
   // ===== UNITY IMAGE HANDLING TESTS =====
 
   results.push(
@@ -145,6 +145,40 @@ export async function createMonoMethodTests(): Promise<TestResult[]> {
     }),
   );
 
+  // ===== DESCRIPTOR LOOKUP TESTS =====
+
+  results.push(
+    await withDomain("MonoMethod descriptor lookups should be cached and batchable", ({ domain }) => {
+      const mscorlib = domain.tryAssembly("mscorlib");
+      assertNotNull(mscorlib, "mscorlib should be available");
+      const image = mscorlib.image;
+
+      const first = Mono.method.tryFind(image, "System.String:Concat(string,string)");
+      assertNotNull(first, "Descriptor should resolve");
+      assert(Mono.method.tryFind(image, "System.String:Concat(string,string)") === first, "Cached lookup should match");
+      assert(Mono.method.tryFind(image, "System.String:NoSuchMethod()") === null, "Missing method should be null");
+
+      const descriptors = [
+        "System.String:Concat(string,string)",
+        "String:IsNullOrEmpty(string)",
+        "System.String:NoSuchMethod()",
+        "System.Object:ToString()",
+        "String:ToString()",
+      ];
+      const resolved = Mono.method.findAll(image, descriptors);
+      assert(resolved.length === descriptors.length, "findAll should return one result per descriptor");
+      assert(resolved[0] === first, "Batch result should match single lookup");
+      assert(resolved[1]?.name === "IsNullOrEmpty", "Unqualified class descriptor should resolve in the image scan");
+      assert(resolved[1]?.declaringClass.fullName === "System.String", "Image scan should match the class name");
+      assert(resolved[2] === null, "Missing method should be null in batch results");
+      assert(resolved[3]?.declaringClass.fullName === "System.Object", "Namespaced descriptor should resolve");
+      assert(
+        resolved[4]?.declaringClass.fullName === "System.String",
+        "Image scan should not return a same-named method of another class",
+      );
+    }),
+  );
+
   // ===== GENERIC METHOD HANDLING TESTS =====
 
   results.push(
@@ -253,6 +287,53 @@ export async function createMonoMethodTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withCoreClasses("MonoMethod compiled invoker should match call()", ({ stringClass, int32Class }) => {
+      const concatMethod = stringClass.tryMethod("Concat", 2);
+      assertNotNull(concatMethod, "Concat method should be found");
+
+      const concat = concatMethod.compileInvoker<string>();
+      assert(concat(null, ["Hello", " World"]) === "Hello World", "Compiled Concat should return the joined string");
+      assert(
+        concat(null, ["a", "b"]) === concatMethod.call<string>(null, ["a", "b"]),
+        "Compiled invoker should agree with call()",
+      );
+
+      const parseMethod = int32Class.tryMethod("Parse", 1);
+      if (parseMethod) {
+        const parse = parseMethod.compileInvoker<number>();
+        assert(parse(null, ["42"]) === 42, "Compiled Int32.Parse should return an unboxed number");
+        assert(parse(null, ["-7"]) === -7, "Compiled invoker should be reusable");
+
+        const parseQuiet = parseMethod.compileInvoker<number | null>({ throwOnManagedException: false });
+        assert(parseQuiet(null, ["not a number"]) === null, "Managed exceptions should yield null when not thrown");
+      }
+    }),
+  );
+
+  results.push(
+    await withCoreClasses("MonoMethod toNativeFunction should call through the unmanaged thunk", ({ stringClass }) => {
+      if (!Mono.api.hasExport("mono_method_get_unmanaged_thunk")) {
+        console.log("  - mono_method_get_unmanaged_thunk not available, skipping");
+        return;
+      }
+
+      const getLength = stringClass.tryMethod("get_Length", 0);
+      assertNotNull(getLength, "String.get_Length should be found");
+
+      const signature = getLength.nativeSignature;
+      assert(signature.returnType === "int32", `get_Length should return int32, got: ${signature.returnType}`);
+      assert(
+        signature.argTypes.length === 1 && signature.argTypes[0] === "pointer",
+        "Instance thunk should take the object pointer first",
+      );
+
+      const nativeGetLength = getLength.toNativeFunction<number>();
+      assert(nativeGetLength === getLength.toNativeFunction(), "Native function should be cached per method");
+      assert(nativeGetLength(Mono.api.stringNew("Hello")) === 5, "Thunk call should return the string length");
+    }),
+  );
+
   // ===== METHOD ATTRIBUTES AND METADATA TESTS =====
 
   results.push(
@@ -9,6 +9,7 @@
  */
 
 import Mono from "../src";
+import { tryWaitForMonoModule } from "../src/runtime/module";
 import { withDomain } from "./test-fixtures";
 import {
   assert,
@@ -83,6 +84,18 @@ export async function createMonoModuleTests(): Promise<TestResult> {
     }),
   );
 
+  await suite.addResultAsync(
+    withDomain("Module wait should resolve immediately for a loaded module", async () => {
+      const start = Date.now();
+      const moduleInfo = await tryWaitForMonoModule({ timeoutMs: 5000, warnAfterMs: 5000 });
+      const elapsed = Date.now() - start;
+
+      assertNotNull(moduleInfo, "Already-loaded Mono module should be discovered");
+      assert(moduleInfo.base.equals(Mono.module.base), "Discovered module should match Mono.module");
+      assert(elapsed < 1000, `Discovery of a loaded module should not wait for a timeout (took ${elapsed}ms)`);
+    }),
+  );
+
   await suite.addResultAsync(
     withDomain("Module should have valid memory layout", () => {
       const module = Mono.module;
@@ -182,6 +182,61 @@ export async function createMonoObjectTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoObject should resolve inherited members", ({ domain }) => {
+      const listClass = domain.tryClass("System.Collections.ArrayList");
+      assertNotNull(listClass, "ArrayList should be available");
+      const list = listClass.newObject();
+
+      const getType = list.tryMethodInHierarchy("GetType", 0);
+      assertNotNull(getType, "Inherited method should be found through the hierarchy table");
+      assert(getType.declaringClass.fullName === "System.Object", "GetType should come from System.Object");
+      assert(list.tryMethodInHierarchy("GetType", 0) === getType, "Repeated lookups should return the same method");
+
+      assert(listClass.tryMethodInHierarchy("GetType", 0) === getType, "Class and object lookups should agree");
+
+      list.call("Add", [list.pointer]);
+      assert(list.get<number>("Count") === 1, "Inherited/declared getter should be callable via get()");
+      assert(list.tryGetMember<number>("Count") === 1, "Unified member access should find the property");
+    }),
+  );
+
+  results.push(
+    await withDomain("MonoObject should resolve explicit interface implementations", ({ domain }) => {
+      const stringClass = domain.tryClass("System.String");
+      assertNotNull(stringClass, "System.String should be available");
+
+      // String implements IConvertible.ToInt32 explicitly, so only the interface declares "ToInt32"
+      const declared = stringClass.tryMethodInHierarchy("ToInt32", 1);
+      assertNotNull(declared, "Interface method should be found through the hierarchy table");
+      assert(
+        declared.declaringClass.fullName === "System.IConvertible",
+        "Class lookup should return the interface slot",
+      );
+
+      const str = new MonoObject(Mono.api, Mono.api.stringNew("42"));
+      const impl = str.tryMethodInHierarchy("ToInt32", 1);
+      assertNotNull(impl, "Object lookup should resolve the implementation");
+      assert(impl.declaringClass.fullName === "System.String", "Implementation should be declared by System.String");
+      assert(impl.name === "System.IConvertible.ToInt32", `Expected explicit implementation, got ${impl.name}`);
+      assert(str.call<number>("ToInt32", [null]) === 42, "Calling by name should dispatch to the implementation");
+    }),
+  );
+
+  results.push(
+    await withDomain("MonoObject snapshot should decode fields from one read", ({ domain }) => {
+      const listClass = domain.tryClass("System.Collections.ArrayList");
+      assertNotNull(listClass, "ArrayList should be available");
+      const list = listClass.newObject();
+      list.call("Add", [list.pointer]);
+
+      const snapshot = list.snapshot();
+      assert(snapshot._size === list.getFieldValue<number>("_size"), "Snapshot should match per-field reads");
+      assert(snapshot._items instanceof MonoObject, "Reference fields should decode to MonoObject");
+      assert(listClass.layout === listClass.layout, "Layout plan should be cached per class");
+    }),
+  );
+
   // ===== OBJECT TOSTRING TESTS =====
 
   results.push(
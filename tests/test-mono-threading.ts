@@ -905,6 +905,67 @@ export async function createMonoThreadingTests(): Promise<TestResult> {
     }),
   );
 
+  // ============================================================================
+  // NATIVE BINDINGS
+  // ============================================================================
+
+  await suite.addResultAsync(
+    await withDomain("Arity-specialized bindings should normalize arguments on both paths", () => {
+      const api = Mono.api;
+      const manager = api.getThreadManager()!;
+      const corlib = api.native.mono_get_corlib();
+      const namespace = Memory.allocUtf8String("System");
+      const name = Memory.allocUtf8String("String");
+      const hasOpenFromData = api.hasExport("mono_image_open_from_data_with_name");
+
+      // 0, 3 and 6 arguments; booleans become ints and null becomes NULL
+      const callAll = (native: typeof api.native): void => {
+        assert(!native.mono_domain_get().isNull(), "0-arg binding should return the current domain");
+        assert(!native.mono_class_from_name(corlib, namespace, name).isNull(), "3-arg binding should resolve a class");
+        if (hasOpenFromData) {
+          const data = Memory.alloc(64);
+          const status = Memory.alloc(4);
+          status.writeS32(0);
+          const image = native.mono_image_open_from_data_with_name(data, 64, true, status, false, null);
+          assert(image.isNull(), "6-arg binding should reject a zeroed image");
+          assert(status.readS32() !== 0, "6-arg binding should pass the status out-param through");
+        }
+      };
+
+      // Fast path: the test already runs inside an attached context
+      callAll(api.native);
+
+      // Slow path: pretend the thread is outside an attached context and count attach round-trips
+      const originalRun = manager.run;
+      let runs = 0;
+      manager.isInAttachedContext = () => false;
+      manager.run = (fn, options) => {
+        runs++;
+        return originalRun.call(manager, fn, options);
+      };
+      try {
+        callAll(api.native);
+        assert(runs === (hasOpenFromData ? 3 : 2), "Each checked binding call should go through the thread manager");
+
+        runs = 0;
+        callAll(api.uncheckedNative);
+        assert(runs === 0, "Unchecked bindings should never consult the thread manager");
+      } finally {
+        delete (manager as Partial<typeof manager>).isInAttachedContext;
+        delete (manager as Partial<typeof manager>).run;
+      }
+    }),
+  );
+
+  await suite.addResultAsync(
+    createIntegrationTest("Mono.perform should hand the callback the unchecked bindings", async () => {
+      const received = await Mono.perform(native => native);
+      assert(received === Mono.api.uncheckedNative, "perform() callback should receive api.uncheckedNative");
+      const domain = await Mono.perform(native => native.mono_domain_get());
+      assert(!domain.isNull(), "Unchecked bindings should work inside perform()");
+    }),
+  );
+
   const summary = suite.getSummary();
 
   return {
@@ -22,7 +22,7 @@ import {
   tryMakePointer,
   unwrapInstance,
 } from "../src/utils/memory";
-import { createMatcher, matchesPattern, wildcardToRegex } from "../src/utils/pattern";
+import { compilePattern, createMatcher, matchesPattern, wildcardToRegex } from "../src/utils/pattern";
 import {
   createError,
   createTimer,
@@ -95,6 +95,24 @@ export async function createMonoUtilsTests(): Promise<TestResult> {
     }),
   );
 
+  await suite.addResultAsync(
+    createStandaloneTest("Find utility - compiled pattern fast paths", () => {
+      assert(compilePattern("*.Update").test("Player.Update"), "Suffix pattern should match");
+      assert(!compilePattern("*.Update").test("Player.UpdateAll"), "Suffix pattern should be anchored");
+      assert(compilePattern("Game*").test("GameManager"), "Prefix pattern should match");
+      assert(compilePattern("*manager*").test("GameManagerBase"), "Contains pattern should ignore case");
+      assert(!compilePattern("*Manager*", { caseInsensitive: false }).test("gamemanager"), "Should honor case");
+      assert(compilePattern("Get?Value").test("GetXValue"), "Single-char wildcard should fall back to regex");
+      assert(compilePattern("A*B*C").test("AxxBxxC"), "Inner wildcards should fall back to regex");
+
+      assert(compilePattern("Test*") === compilePattern("Test*"), "Compiled matchers should be cached");
+      assert(
+        compilePattern("Test*") !== compilePattern("Test*", { regex: true }),
+        "Cache should be keyed by options",
+      );
+    }),
+  );
+
   // ============================================================================
   // TRACE UTILITY TESTS
   // ============================================================================
@@ -47,6 +47,18 @@ export async function createRuntimeApiTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoApi root domain wait should resolve immediately when ready", async () => {
+      const start = Date.now();
+      const domain = await Mono.api.tryWaitForRootDomainReady(5000, 5000, 1000);
+      const elapsed = Date.now() - start;
+
+      assertNotNull(domain, "Root domain should be returned");
+      assert(domain.equals(Mono.api.getRootDomain()), "Returned domain should be the root domain");
+      assert(elapsed < 500, `Ready runtime should not wait for a poll interval (took ${elapsed}ms)`);
+    }),
+  );
+
   // ===== STRING CREATION TESTS =====
 
   results.push(
@@ -329,6 +341,23 @@ export async function createRuntimeApiTests(): Promise<TestResult[]> {
     }),
   );
 
+  results.push(
+    await withDomain("MonoApi export table should agree with module lookups", () => {
+      assert(Mono.api.loadExportTable(), "Export table should be available after initialize()");
+      assert(Mono.api.exportCount > 0, "Export table should contain the module's exports");
+
+      const moduleHandle = Mono.api.getModuleHandle();
+      for (const exportName of ["mono_get_root_domain", "mono_class_get_name", "mono_runtime_invoke"]) {
+        const expected = moduleHandle.findExportByName(exportName);
+        const resolved = Mono.api.getExportAddress(exportName as any);
+        assert(
+          expected === null ? resolved === null : resolved !== null && resolved.equals(expected),
+          `${exportName} should resolve to the same address as findExportByName`,
+        );
+      }
+    }),
+  );
+
   // ===== TRY FREE TESTS =====
 
   results.push(
@@ -827,6 +856,27 @@ export async function createRuntimeApiTests(): Promise<TestResult[]> {
     }),
   );
 
+  // ===== HANDLE INTERNING TESTS =====
+
+  results.push(
+    await withCoreClasses("MonoApi should intern metadata wrappers per pointer", ({ stringClass }) => {
+      const wrapped = Mono.class.wrap(stringClass.pointer);
+      assert(wrapped === stringClass, "Wrapping the same class pointer should return the same instance");
+
+      const concat = stringClass.tryMethod("Concat", 2);
+      if (concat) {
+        assert(Mono.method.wrap(concat.pointer) === concat, "Method wrappers should be interned");
+      }
+
+      const removed = Mono.api.invalidateHandle(stringClass.pointer);
+      assert(removed >= 1, "invalidateHandle should drop the interned class wrapper");
+
+      const fresh = Mono.class.wrap(stringClass.pointer);
+      assert(fresh !== stringClass, "Invalidated pointers should produce a new wrapper");
+      assert(fresh.equals(stringClass), "Fresh wrapper should still point at the same class");
+    }),
+  );
+
   // ===== PERFORMANCE TESTS =====
 
   results.push(